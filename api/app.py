@@ -27,8 +27,15 @@ app = FastAPI()
 setup_logging()
 
 from api.routers.job import router as job_router
+from api.routers.known import router as known_router
 
 sb_jobs_io = SBJobsIO()
 
 
 app.include_router(job_router)
+app.include_router(known_router)
+
+
+@app.get("/health")
+def health():
+    return {"status": "ok"}
@@ -6,8 +6,9 @@ from fastapi.datastructures import UploadFile
 from common.constants import EXT_SRT
 from common.schemas import BuildDeckRequest, ExportDeckRequest, PreviewBuildDeckRequest
 from infra.supabase.jobs_repo import SBJobsIO
+from pipelines.analysis_cache import get_analysis
 from pipelines.analysis_pipeline import register_job, run_analysis_pipeline
-from pipelines.deck_pipeline import run_deck_pipeline, run_preview
+from pipelines.deck_pipeline import run_deck_pipeline, run_preview, run_preview_curve
 from pipelines.export_deck import run_export_deck
 
 router = APIRouter()
@@ -29,7 +30,8 @@ async def create_job(file: UploadFile, episode_name: str = Form(...)):
 # Get processed episode
 @router.get("/jobs/{job_id}/analysis")
 def get_job_analysis(job_id: str):
-    return sb_jobs_io.download_analysis(job_id)
+    # Stored results may be the binary artifact, the client always gets JSON
+    return get_analysis(job_id)
 
 
 @router.post("/jobs/{job_id}/preview")
@@ -37,6 +39,12 @@ def get_preview(request: PreviewBuildDeckRequest):
     return run_preview(request)
 
 
+@router.post("/jobs/{job_id}/preview/curve")
+def get_preview_curve(request: PreviewBuildDeckRequest):
+    # Cards vs coverage for every deck size, so sliders need no round trips
+    return run_preview_curve(request)
+
+
 @router.post("/jobs/{job_id}/deck")
 def export_deck(request: ExportDeckRequest):
     return Response(
@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+
+from common.schemas import KnownLemmasRequest
+from pipelines.known_vocab import add_known, list_known, remove_known
+
+router = APIRouter()
+
+
+@router.get("/users/{user_id}/known/{lang}")
+def get_known(user_id: str, lang: str):
+    lemmas = list_known(user_id, lang)
+    return {"count": len(lemmas), "lemmas": lemmas}
+
+
+@router.post("/users/{user_id}/known/{lang}")
+def add_known_lemmas(user_id: str, lang: str, request: KnownLemmasRequest):
+    return {"count": add_known(user_id, lang, request.lemmas)}
+
+
+@router.post("/users/{user_id}/known/{lang}/remove")
+def remove_known_lemmas(user_id: str, lang: str, request: KnownLemmasRequest):
+    return {"count": remove_known(user_id, lang, request.lemmas)}
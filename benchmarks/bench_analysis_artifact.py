@@ -0,0 +1,84 @@
+"""
+Benchmark: binary analysis artifact vs JSON (size, encode and decode time).
+Inputs are the preview analysis in tests/integ and the bundled SRTs run
+through the analysis steps. Without Stanza installed the SRTs fall back to
+form == lemma tokens, which keeps sentence/example volume realistic.
+
+Run: python -m benchmarks.bench_analysis_artifact
+"""
+
+import ast
+import glob
+import json
+import time
+from typing import Dict, List
+
+from domain.nlp.content.srt_adapter import SRTAdapter
+from domain.nlp.lang.sv.sv_lang_adapter import SVLangAdapter
+from domain.nlp.lexicon.artifact import dump_analysis, load_analysis
+from domain.nlp.lexicon.schema import AnalyzedEpisode, NLPToken
+from domain.nlp.run_episode_analysis import process_episode
+
+REPEATS = 5
+
+
+class _FormLemmaAdapter(SVLangAdapter):
+    def _analyse(self, words: List[str]) -> Dict[str, List[NLPToken]]:
+        return {w: [NLPToken(form=w, lemma=w, pos="NOUN", other={})] for w in words}
+
+
+def _lang_adapter() -> SVLangAdapter:
+    try:
+        import stanza  # noqa: F401
+    except ImportError:
+        return _FormLemmaAdapter()
+    return SVLangAdapter()
+
+
+def _episodes():
+    with open("tests/integ/data_preview.txt", "r", encoding="utf-8") as f:
+        loaded_analysis = json.loads(ast.literal_eval(f.read()))
+    yield "data_preview", AnalyzedEpisode(episode_name="BonusFam", **loaded_analysis)
+
+    lang_adapter = _lang_adapter()
+    for path in sorted(glob.glob("*.srt")) + ["tests/integ/ep1.srt"]:
+        with open(path, "rb") as f:
+            raw = f.read()
+        yield path[:40], process_episode(raw, SRTAdapter(), lang_adapter, path)
+
+
+def _best(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    print(
+        f"{'input':>40} {'lemmas':>7} {'json KB':>9} {'bin KB':>8} {'ratio':>6}"
+        f" {'json enc':>9} {'bin enc':>8} {'json dec':>9} {'bin dec':>8} {'speedup':>8}"
+    )
+    for name, episode in _episodes():
+        as_json = dump_analysis(episode, "json")
+        as_binary = dump_analysis(episode, "binary")
+        assert load_analysis(as_binary) == load_analysis(as_json)
+
+        json_enc = _best(lambda: dump_analysis(episode, "json"))
+        bin_enc = _best(lambda: dump_analysis(episode, "binary"))
+        json_dec = _best(lambda: load_analysis(as_json))
+        bin_dec = _best(lambda: load_analysis(as_binary))
+        print(
+            f"{name:>40} {len(episode.episode_data_processed):>7}"
+            f" {len(as_json) / 1024:>9.1f} {len(as_binary) / 1024:>8.1f}"
+            f" {len(as_json) / len(as_binary):>5.1f}x"
+            f" {json_enc * 1e3:>7.1f}ms {bin_enc * 1e3:>6.1f}ms"
+            f" {json_dec * 1e3:>7.1f}ms {bin_dec * 1e3:>6.1f}ms"
+            f" {json_dec / bin_dec:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: translation cache lookup for a 2,000-card deck. Legacy
+computes every cache key twice (lookup, then merge) and queries the
+100-id chunks one after another; the current code builds keys once
+(normalizing / encoding each distinct string once) and runs the chunks
+concurrently. Supabase is simulated with a fixed round-trip per request.
+
+Run: python -m benchmarks.bench_cache_lookup
+"""
+
+import logging
+import time
+
+from benchmarks.bench_translation_cache_tiers import RemoteDeckIO
+from domain.deck.schemas.schema import Candidate
+from domain.translator.translation import (
+    _cache_keys,
+    _create_id_translation_cache,
+    find_cached_translation_batch,
+)
+
+N_CANDIDATES = 2000
+SENTENCES = 700
+
+
+def legacy_find_cached_translation_batch(selection, deck_io):
+    def key(c):
+        return _create_id_translation_cache(
+            c.form_original_lang,
+            c.sentence_original_lang,
+            c.source_lang_tag,
+            c.target_lang_tag,
+        )
+
+    cached, to_translate = [], []
+    for start in range(0, len(selection), 100):
+        chunk = selection[start : start + 100]
+        res = deck_io.get_cached([key(c) for c in chunk])
+        for c in chunk:
+            row = res.get(key(c))
+            if row:
+                c.translated_word = row["word_target_lang"]
+                c.translated_example = row["sentence_target_lang"]
+                cached.append(c)
+            else:
+                to_translate.append(c)
+    return cached, to_translate
+
+
+def _selection():
+    return [
+        Candidate(
+            lemma=f"ord{i}",
+            pos="NOUN",
+            forms=[f"ord{i}"],
+            freq=1,
+            cov_share_source=0.0,
+            form_original_lang=f"ord{i}",
+            sentence_original_lang=(
+                f"Replik {i % SENTENCES}: och  så sa hon ord{i} igen, "
+                "men ingen lyssnade på henne."
+            ),
+            source_lang_tag="sv",
+            target_lang_tag="EN-GB",
+        )
+        for i in range(N_CANDIDATES)
+    ]
+
+
+def main():
+    logging.getLogger().setLevel(logging.ERROR)
+    remote = RemoteDeckIO()
+    remote.rows = {
+        key: {"word_target_lang": "w", "sentence_target_lang": "s"}
+        for key in _cache_keys(_selection()[::2])
+    }
+
+    selections = [_selection() for _ in range(20)]
+    t0 = time.perf_counter()
+    for selection in selections:
+        [
+            _create_id_translation_cache(
+                c.form_original_lang,
+                c.sentence_original_lang,
+                c.source_lang_tag,
+                c.target_lang_tag,
+            )
+            for c in selection
+        ]
+    single = (time.perf_counter() - t0) / len(selections)
+    t0 = time.perf_counter()
+    for selection in selections:
+        _cache_keys(selection)
+    batched = (time.perf_counter() - t0) / len(selections)
+    print(
+        f"keys per pass: one by one {single * 1e3:5.1f}ms (legacy: 2 passes),"
+        f" column-wise {batched * 1e3:5.1f}ms"
+    )
+
+    for name, run in (
+        ("legacy", lambda s: legacy_find_cached_translation_batch(s, remote)),
+        ("current", lambda s: find_cached_translation_batch(s, remote)),
+    ):
+        selection = _selection()
+        remote.requests = 0
+        t0 = time.perf_counter()
+        cached, to_translate = run(selection)
+        elapsed = time.perf_counter() - t0
+        assert len(cached) == N_CANDIDATES // 2
+        print(
+            f"{name:>7}: lookup {elapsed * 1e3:6.1f}ms, {remote.requests} requests"
+        )
+
+
+if __name__ == "__main__":
+    main()
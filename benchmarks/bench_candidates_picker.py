@@ -0,0 +1,71 @@
+"""
+Benchmark: heap/cursor pick_until_target vs the previous list-based picker.
+100k candidates over several POS with hard caps and soft targets; both
+pickers must return the same picks and report.
+
+Run: python -m benchmarks.bench_candidates_picker
+"""
+
+import random
+import time
+from typing import List
+
+from domain.deck.deck_generation.candidates_picker import pick_until_target
+from domain.deck.schemas.schema import Candidate
+from tests.legacy_picker import legacy_pick_until_target
+
+POS_WEIGHTS = {"NOUN": 0.4, "VERB": 0.25, "ADJ": 0.15, "ADV": 0.1, "PRON": 0.1}
+
+
+def synthetic_candidates(n: int, seed: int = 0) -> List[Candidate]:
+    rng = random.Random(seed)
+    pos_names = list(POS_WEIGHTS)
+    weights = list(POS_WEIGHTS.values())
+    out = []
+    for i in range(n):
+        cov = rng.paretovariate(1.2) / (n * 10)
+        out.append(
+            Candidate(
+                lemma=f"l{i}",
+                pos=rng.choices(pos_names, weights)[0],
+                forms=[f"l{i}"],
+                freq=1,
+                cov_share_source=cov,
+                score=cov,
+            )
+        )
+    return out
+
+
+SCENARIOS = {
+    "caps + targets": dict(
+        max_share_per_pos={"NOUN": 0.35, "VERB": 0.3, "ADJ": 0.15},
+        target_share_per_pos={"NOUN": 0.4, "VERB": 0.3, "ADJ": 0.2, "ADV": 0.1},
+    ),
+    "caps only": dict(max_share_per_pos={"NOUN": 0.5, "VERB": 0.3, "PRON": 0.05}),
+}
+
+
+def main():
+    for n in (10_000, 100_000):
+        candidates = synthetic_candidates(n)
+        for name, kwargs in SCENARIOS.items():
+            for max_cards in (1_000, None):
+                t0 = time.perf_counter()
+                legacy = legacy_pick_until_target(candidates, max_cards, None, **kwargs)
+                t_legacy = time.perf_counter() - t0
+                t0 = time.perf_counter()
+                new = pick_until_target(candidates, max_cards, None, **kwargs)
+                t_new = time.perf_counter() - t0
+                assert legacy[1] == new[1]
+                assert [c.lemma for c in legacy[0]] == [c.lemma for c in new[0]]
+                print(
+                    f"n={n:>7} {name:<15} max_cards={str(max_cards):>5}"
+                    f" picked={new[1]['picked_count']:>6}"
+                    f" legacy {t_legacy:7.3f}s  heap {t_new:7.3f}s"
+                    f"  speedup {t_legacy / t_new:5.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: SVLangAdapter.build_dictionary_from_tokens on synthetic vocabularies.
+Time per type should stay flat as the vocabulary grows (linear scaling).
+The legacy (quadratic) implementation is timed on the small sizes only.
+
+Run: python -m benchmarks.bench_lexicon_aggregation
+"""
+
+import time
+from typing import Dict
+
+from domain.nlp.lang.sv.sv_lang_adapter import SVLangAdapter
+from domain.nlp.lang.sv.sv_not_translatable import SV_NOT_TRANSLATABLE
+from domain.nlp.lexicon.schema import LemmaSV, NLPToken
+
+POS_CYCLE = ("NOUN", "VERB", "ADJ", "ADV", "PRON")
+FORMS_PER_LEMMA = 3
+
+
+def synthetic_vocabulary(n_types: int):
+    tokens = []
+    words_counted = {}
+    for i in range(n_types):
+        lemma_id = i // FORMS_PER_LEMMA
+        form = f"w{i}"
+        pos = POS_CYCLE[lemma_id % len(POS_CYCLE)]
+        tokens.append(
+            NLPToken(
+                form=form,
+                lemma=f"l{lemma_id}",
+                pos=pos,
+                other={"artikel": "en" if pos == "NOUN" else None},
+            )
+        )
+        # Zipf-like counts
+        words_counted[form] = max(1, 100_000 // (i + 1))
+    return tokens, words_counted
+
+
+def legacy_build(tokens, words_counted) -> Dict[str, LemmaSV]:
+    lexicon = {}
+    for token in tokens:
+        if token.lemma not in lexicon:
+            lexicon[token.lemma] = LemmaSV(
+                pos=token.pos,
+                forms=[],
+                examples={},
+                artikel=token.other.get("artikel") if token.other else None,
+                forms_freq={},
+                lang="sv",
+                to_learn=token.lemma not in SV_NOT_TRANSLATABLE,
+            )
+        lexicon[token.lemma].forms.append(token.form)
+        lexicon[token.lemma].forms_freq[token.form] = words_counted.get(token.form, 0)
+        lexicon[token.lemma].forms_cov[token.form] = (
+            words_counted.get(token.form, 0) / sum(words_counted.values())
+            if sum(words_counted.values()) > 0
+            else 0.0
+        )
+        lexicon[token.lemma].forms = list(set(lexicon[token.lemma].forms))
+    return lexicon
+
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main() -> None:
+    # Skip __init__: aggregation does not need the Stanza pipeline
+    adapter = SVLangAdapter.__new__(SVLangAdapter)
+
+    for n_types in (2_000, 5_000, 10_000):
+        tokens, words_counted = synthetic_vocabulary(n_types)
+        new, t_new = _timed(adapter.build_dictionary_from_tokens, tokens, words_counted)
+        old, t_old = _timed(legacy_build, tokens, words_counted)
+        assert new.keys() == old.keys()
+        for lemma, data in new.items():
+            assert set(data.forms) == set(old[lemma].forms)
+            assert data.forms_freq == old[lemma].forms_freq
+            assert data.forms_cov == old[lemma].forms_cov
+        print(
+            f"{n_types:>7} types  legacy {t_old:8.3f}s  new {t_new:6.3f}s  "
+            f"speedup {t_old / t_new:6.1f}x"
+        )
+
+    for n_types in (25_000, 50_000, 100_000):
+        tokens, words_counted = synthetic_vocabulary(n_types)
+        _, t_new = _timed(adapter.build_dictionary_from_tokens, tokens, words_counted)
+        print(
+            f"{n_types:>7} types  new {t_new:6.3f}s  "
+            f"({t_new / n_types * 1e6:.2f} us/type)"
+        )
+
+
+if __name__ == "__main__":
+    main()
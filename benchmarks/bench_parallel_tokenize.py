@@ -0,0 +1,51 @@
+"""
+Benchmark: SVLangAdapter.tokenize throughput by worker count (needs Stanza models).
+Vocabulary is the unique words of the bundled *.sv.srt files. Pool start-up
+(model load per worker) is done in a warm-up call and not timed.
+
+Run: python -m benchmarks.bench_parallel_tokenize [max_workers]
+"""
+
+import glob
+import os
+import sys
+import time
+
+from domain.nlp.content.srt_adapter import SRTAdapter
+from domain.nlp.lang.sv.sv_lang_adapter import SVLangAdapter
+
+
+def _vocabulary() -> list[str]:
+    adapter = SRTAdapter()
+    words = []
+    for path in sorted(glob.glob("*.sv.srt")):
+        with open(path, "rb") as f:
+            words.extend(adapter.clean_for_words(adapter.clean_for_sentence(f)))
+    return list(dict.fromkeys(words))
+
+
+def main(max_workers: int) -> None:
+    words = _vocabulary()
+    shard_size = 250
+    print(f"{len(words)} unique words, shard size {shard_size}")
+
+    baseline = None
+    workers = 1
+    while workers <= max_workers:
+        adapter = SVLangAdapter(workers=workers, shard_size=shard_size)
+        adapter.tokenize(words[: shard_size * workers + 1])  # warm-up
+
+        t0 = time.perf_counter()
+        tokens = adapter.tokenize(words)
+        elapsed = time.perf_counter() - t0
+
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers}: {elapsed:.2f}s, {len(words) / elapsed:,.0f} words/s, "
+            f"speedup {baseline / elapsed:.1f}x ({len(tokens)} tokens)"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1))
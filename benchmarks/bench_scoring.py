@@ -0,0 +1,78 @@
+"""
+Benchmark: vectorized rank_candidates vs the previous score_and_rank
+(sorted() over Candidate models + a score write on every candidate),
+alone and followed by the picker (which then scores picked cards only).
+
+Run: python -m benchmarks.bench_scoring
+"""
+
+import random
+import time
+from typing import List
+
+from benchmarks.bench_candidates_picker import synthetic_candidates
+from domain.deck.deck_generation.candidates_picker import pick_until_target
+from domain.deck.deck_generation.scoring import CorpusStats, rank_candidates
+from domain.deck.schemas.schema import Candidate
+
+MODES = ("FREQ", "ZIPF", "TFIDF", "LENGTH")
+MAX_CARDS = 500
+
+
+def legacy_score_and_rank(candidates: List[Candidate]) -> List[Candidate]:
+    ranked_candidates = []
+    candidates = sorted(
+        candidates, key=lambda cand: cand.cov_share_source, reverse=True
+    )
+    for candidate in candidates:
+        candidate.score = candidate.cov_share_source
+        ranked_candidates.append(candidate)
+    return ranked_candidates
+
+
+def synthetic_corpus(candidates: List[Candidate], seed: int = 0) -> CorpusStats:
+    rng = random.Random(seed)
+    lemmas = [c.lemma for c in candidates]
+    rng.shuffle(lemmas)
+    return CorpusStats(
+        n_docs=1000,
+        doc_freq={lemma: rng.randint(1, 1000) for lemma in lemmas},
+        freq_rank={lemma: i + 1 for i, lemma in enumerate(lemmas)},
+    )
+
+
+def _timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - t0
+
+
+def main():
+    for n in (10_000, 200_000):
+        candidates = synthetic_candidates(n)
+        corpus = synthetic_corpus(candidates)
+
+        legacy, t_legacy = _timed(legacy_score_and_rank, candidates)
+        _, t_legacy_pick = _timed(pick_until_target, legacy, MAX_CARDS, None)
+        print(
+            f"n={n:>7} legacy FREQ   rank {t_legacy * 1e3:8.1f}ms"
+            f"  rank+pick {(t_legacy + t_legacy_pick) * 1e3:8.1f}ms"
+        )
+
+        for mode in MODES:
+            for c in candidates:
+                c.score = None
+            (ranked, scores), t_rank = _timed(rank_candidates, candidates, mode, corpus)
+            _, t_pick = _timed(
+                pick_until_target, ranked, MAX_CARDS, None, scores=scores
+            )
+            if mode == "FREQ":
+                assert [c.lemma for c in ranked] == [c.lemma for c in legacy]
+            print(
+                f"n={n:>7} vector {mode:<6} rank {t_rank * 1e3:8.1f}ms"
+                f"  rank+pick {(t_rank + t_pick) * 1e3:8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
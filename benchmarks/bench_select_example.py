@@ -0,0 +1,123 @@
+"""
+Benchmark: select_example on analyses with precomputed example word counts
+and shortlists vs the previous implementation, which re-counted the words of
+every example of every form on each deck build. Both must pick the same
+sentences.
+
+Run: python -m benchmarks.bench_select_example
+"""
+
+import time
+from types import SimpleNamespace
+from typing import List, Optional
+
+from benchmarks.bench_analysis_artifact import _episodes
+from domain.deck.deck_generation.lexicon_processing import (
+    select_candidates,
+    select_example,
+)
+from domain.deck.schemas.schema import Candidate
+from domain.nlp.lexicon.examples import index_examples
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+
+REPEATS = 5
+SETTINGS = [
+    ("defaults", {}, False),
+    ("3-12 words", {"min_example_len": 3, "max_example_len": 12}, False),
+    ("3-12 words, dedupe", {"min_example_len": 3, "max_example_len": 12}, True),
+]
+
+
+def legacy_select_example(
+    selection: List[Candidate],
+    req,
+    analyzed_payload: AnalyzedEpisode,
+) -> List[Candidate]:
+    lang_opts = req.lang_opts.get("sv", {})
+    min_len = int(lang_opts.get("min_example_len", 1))
+    max_len = int(lang_opts.get("max_example_len", 10**9))
+    dedupe = bool(getattr(req, "dedupe_sentences", False))
+
+    seen_sentences = set()
+
+    def wc(s: str) -> int:
+        return len(s.split())
+
+    def pick_best(examples: List[str]) -> Optional[str]:
+        if not examples:
+            return None
+        pool = [e for e in examples if min_len <= wc(e) <= max_len] or examples
+        multi = [e for e in pool if wc(e) > 1] or pool
+        if dedupe:
+            for e in multi:
+                if e not in seen_sentences:
+                    seen_sentences.add(e)
+                    return e
+            return multi[0]
+        else:
+            return multi[0]
+
+    for cand in selection:
+        lemma = cand.lemma
+        data = analyzed_payload.episode_data_processed.get(lemma)
+
+        if not data or not getattr(data, "examples", None):
+            raise ValueError(f"No examples found for lemma: {lemma}")
+
+        for form, example in data.examples.items():
+            chosen = pick_best(example)
+            if chosen:
+                cand.form_original_lang = form
+                cand.sentence_original_lang = chosen
+            else:
+                raise ValueError(f"No valid example found for form: {form}")
+    return selection
+
+
+def _best(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    print(
+        f"{'input':>40} {'setting':>20} {'cands':>6}"
+        f" {'legacy':>9} {'new':>8} {'x':>5}"
+    )
+    for name, episode in _episodes():
+        index_examples(episode.episode_data_processed)
+        for label, opts, dedupe in SETTINGS:
+            req = SimpleNamespace(
+                lang_opts={"sv": opts},
+                dedupe_sentences=dedupe,
+                target_share_per_pos={},
+                exclude_known_lemmas=[],
+            )
+            selection = [
+                c
+                for c in select_candidates(episode, req)
+                if episode.episode_data_processed[c.lemma].examples
+            ]
+            legacy = legacy_select_example(
+                [c.model_copy() for c in selection], req, episode
+            )
+            new = select_example([c.model_copy() for c in selection], req, episode)
+            assert [c.sentence_original_lang for c in new] == [
+                c.sentence_original_lang for c in legacy
+            ]
+
+            t_legacy = _best(lambda: legacy_select_example(selection, req, episode))
+            t_new = _best(lambda: select_example(selection, req, episode))
+            print(
+                f"{name:>40} {label:>20} {len(selection):>6}"
+                f" {t_legacy * 1e3:>7.2f}ms {t_new * 1e3:>6.2f}ms"
+                f" {t_legacy / t_new:>4.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
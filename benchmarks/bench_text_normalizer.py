@@ -0,0 +1,86 @@
+"""
+Micro-benchmark: legacy `regex`-module cleaning vs TextNormalizer.
+Runs both over the bundled *.sv.srt files, replicated to a few MB,
+and checks the output is identical.
+
+Run: python -m benchmarks.bench_text_normalizer [target_mb]
+"""
+
+import glob
+import sys
+import time
+
+import regex
+
+from domain.nlp.content.srt_adapter import SRTAdapter
+from domain.nlp.content.text_normalizer import TextNormalizer
+
+_LEGACY_SENT_END_RE = regex.compile(
+    r"""
+    (?<!\b(?:dr|prof|mr|mrs|ms|st|jr|sr|e\.g|i\.e|no|np|tj|kap|art|al)\.)
+    (?<=\.|!|\?)
+    \s+
+    (?=[A-Z0-9"'-]|\p{Lu})
+    """,
+    regex.IGNORECASE | regex.VERBOSE,
+)
+
+
+def legacy_clean_line(text: str) -> str:
+    text = regex.sub(r"<[^>]+>", "", text)
+    text = regex.sub(r"^\s*-\s+", "", text)
+    text = regex.sub(r"^\s*-\s*", "", text)
+    return text
+
+
+def legacy_normalize(lines: list[str]) -> tuple[list[str], list[str]]:
+    text = " ".join(legacy_clean_line(line) for line in lines)
+    sentences = [s.strip() for s in _LEGACY_SENT_END_RE.split(text) if s.strip()]
+    words = []
+    for sentence in sentences:
+        sentence = regex.sub(r"\p{P}+", " ", sentence).lower().strip()
+        words.extend(w for w in sentence.split() if w and w.isalpha())
+    return sentences, words
+
+
+def fused_normalize(lines: list[str]) -> tuple[list[str], list[str]]:
+    normalizer = TextNormalizer()
+    text = " ".join(normalizer.clean_line(line) for line in lines)
+    sentences = normalizer.split_sentences(text)
+    return sentences, normalizer.words(sentences)
+
+
+def _load_lines() -> list[str]:
+    adapter = SRTAdapter()
+    lines = []
+    for path in sorted(glob.glob("*.sv.srt")):
+        with open(path, "rb") as f:
+            for _, _, cue_lines in adapter._iter_cues(adapter._iter_lines(f)):
+                lines.extend(cue_lines)
+    return lines
+
+
+def _timed(fn, lines):
+    t0 = time.perf_counter()
+    out = fn(lines)
+    return out, time.perf_counter() - t0
+
+
+def main(target_mb: float = 4.0) -> None:
+    base = _load_lines()
+    base_bytes = sum(len(line.encode("utf-8")) + 1 for line in base)
+    lines = base * max(1, round(target_mb * 1024 * 1024 / base_bytes))
+    size_mb = sum(len(line.encode("utf-8")) + 1 for line in lines) / 1024 / 1024
+
+    legacy, t_legacy = _timed(legacy_normalize, lines)
+    fused, t_fused = _timed(fused_normalize, lines)
+    assert legacy == fused, "Fused normalizer output differs from legacy output"
+
+    print(f"input: {size_mb:.2f} MB, {len(lines)} lines")
+    print(f"legacy: {t_legacy:.3f}s ({size_mb / t_legacy:.2f} MB/s)")
+    print(f"fused:  {t_fused:.3f}s ({size_mb / t_fused:.2f} MB/s)")
+    print(f"speedup: {t_legacy / t_fused:.1f}x (identical output)")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 4.0)
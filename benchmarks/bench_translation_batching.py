@@ -0,0 +1,60 @@
+"""
+Benchmark: fixed 40-candidate translation batches vs packing by the
+backend's item / character / byte budgets, on a mixed-length deck
+(mostly short subtitle lines plus a tail of long ones). FakeTranslator
+latency grows with request characters, as DeepL's does.
+
+Run: python -m benchmarks.bench_translation_batching
+"""
+
+import logging
+import random
+import time
+
+from domain.translator.batching import BatchLimits, batch_sizes, pack_batches
+from domain.translator.fake_translator import FakeTranslator
+from domain.translator.scheduler import TranslationScheduler
+
+N_TEXTS = 2000
+LIMITS = BatchLimits(max_items=50, max_chars=5000, max_bytes=100000)
+
+
+def _texts(rng: random.Random):
+    texts = []
+    for i in range(N_TEXTS):
+        words = rng.randint(2, 8) if rng.random() < 0.85 else rng.randint(40, 120)
+        texts.append(" ".join(["ord"] * words) + f" <i>term{i}</i>.")
+    return texts
+
+
+def _run(texts, batches):
+    translator = FakeTranslator(latency=0.08, jitter=0.02, latency_per_char=2e-5)
+    scheduler = TranslationScheduler(translator, max_workers=4, rate=1000, seed=0)
+    t0 = time.perf_counter()
+    results = scheduler.run([[texts[i] for i in b] for b in batches], "EN-GB", "sv")
+    elapsed = time.perf_counter() - t0
+    assert [t for res in results for t in res] == [texts[i] for b in batches for i in b]
+    return elapsed, scheduler.stats()
+
+
+def main():
+    logging.getLogger().setLevel(logging.ERROR)
+    texts = _texts(random.Random(0))
+    fixed = [list(range(i, min(i + 40, N_TEXTS))) for i in range(0, N_TEXTS, 40)]
+    packed = pack_batches(texts, LIMITS)
+
+    for name, batches in (("fixed 40", fixed), ("packed", packed)):
+        sizes = batch_sizes(texts, batches)
+        elapsed, stats = _run(texts, batches)
+        print(
+            f"{name:>8}: {len(batches):>3} requests,"
+            f" chars/request max {max(s['chars'] for s in sizes):>6},"
+            f" p50 {stats['latency_p50_s'] * 1e3:5.0f}ms"
+            f" p95 {stats['latency_p95_s'] * 1e3:5.0f}ms"
+            f" max {stats['latency_max_s'] * 1e3:5.0f}ms,"
+            f" total {elapsed:5.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
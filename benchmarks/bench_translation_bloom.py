@@ -0,0 +1,72 @@
+"""
+Benchmark: cache lookups for a deck of new content (every key misses)
+with and without the Bloom-filter negative cache in front of Supabase,
+simulated with a fixed round-trip per request. Also reports the filter size
+for the configured false positive rate.
+
+Run: python -m benchmarks.bench_translation_bloom
+"""
+
+import logging
+import time
+
+from benchmarks.bench_translation_cache_tiers import RemoteDeckIO
+from domain.deck.schemas.schema import Candidate
+from domain.translator.translation import find_cached_translation_batch
+from infra.memory.bloom_filter import BloomFilter
+from infra.tiered.deck_io import TieredDeckIO
+
+STORED_IDS = 200_000
+N_CANDIDATES = 2000
+FP_RATE = 0.01
+
+
+def _new_selection():
+    return [
+        Candidate(
+            lemma=f"nytt{i}",
+            pos="NOUN",
+            forms=[f"nytt{i}"],
+            freq=1,
+            cov_share_source=0.0,
+            form_original_lang=f"nytt{i}",
+            sentence_original_lang=f"Ett helt nytt{i} avsnitt.",
+            source_lang_tag="sv",
+            target_lang_tag="EN-GB",
+        )
+        for i in range(N_CANDIDATES)
+    ]
+
+
+def main():
+    logging.getLogger().setLevel(logging.ERROR)
+    remote = RemoteDeckIO()
+    stored = [f"{i:064x}" for i in range(STORED_IDS)]
+    remote.rows = {cache_id: {"id": cache_id} for cache_id in stored}
+
+    t0 = time.perf_counter()
+    bloom = BloomFilter(2 * STORED_IDS, FP_RATE)
+    bloom.add(stored)
+    build_s = time.perf_counter() - t0
+    print(
+        f"filter: {STORED_IDS} ids, {len(bloom.bits) / 1024:.0f} KiB,"
+        f" {bloom.n_hashes} hashes, built in {build_s * 1e3:.0f}ms"
+    )
+
+    for name, negative in (("no filter", None), ("bloom", bloom)):
+        deck_io = TieredDeckIO(remote, negative=negative)
+        remote.requests = 0
+        t0 = time.perf_counter()
+        cached, missing = find_cached_translation_batch(_new_selection(), deck_io)
+        elapsed = time.perf_counter() - t0
+        assert not cached and len(missing) == N_CANDIDATES
+        l3 = deck_io.stats()["l3"]
+        print(
+            f"{name:>9}: {elapsed * 1e3:6.1f}ms, {remote.requests} Supabase"
+            f" requests, {l3['skipped']} ids skipped,"
+            f" {l3['misses']} ids sent"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark: cache lookups of a repeated deck build going to Supabase every
+time vs through the tiered DeckIO (in-process LRU -> node-local SQLite ->
+Supabase). Supabase is simulated with a fixed round-trip per request.
+
+Run: python -m benchmarks.bench_translation_cache_tiers
+"""
+
+import logging
+import tempfile
+import time
+
+from domain.deck.schemas.schema import Candidate
+from domain.translator.translation import (
+    _prepare_cache_entry,
+    find_cached_translation_batch,
+)
+from infra.sqlite.translation_cache import SqliteTranslationCache
+from infra.tiered.deck_io import TieredDeckIO
+
+N_CANDIDATES = 2000
+ROUND_TRIP_S = 0.03
+BUILDS = 3
+
+
+class RemoteDeckIO:
+    """In-memory cached_translations behind a simulated network round-trip."""
+
+    def __init__(self):
+        self.rows = {}
+        self.written = {}
+        self.requests = 0
+
+    def get_cached(self, ids):
+        self.requests += 1
+        time.sleep(ROUND_TRIP_S)
+        return {i: self.rows[i] for i in ids if i in self.rows}
+
+    def upsert_cache_translation(self, cache_entries):
+        self.requests += 1
+        time.sleep(ROUND_TRIP_S)
+        self.rows.update({entry["id"]: entry for entry in cache_entries})
+        self.written.update({entry["id"]: time.time() for entry in cache_entries})
+        return {}
+
+    def last_cache_write(self):
+        self.requests += 1
+        time.sleep(ROUND_TRIP_S)
+        return max(self.written.values(), default=None)
+
+    def cache_ids_since(self, since):
+        self.requests += 1
+        time.sleep(ROUND_TRIP_S)
+        return iter([i for i, t in self.written.items() if t >= since])
+
+
+def _selection():
+    return [
+        Candidate(
+            lemma=f"ord{i}",
+            pos="NOUN",
+            forms=[f"ord{i}"],
+            freq=1,
+            cov_share_source=0.0,
+            form_original_lang=f"ord{i}",
+            sentence_original_lang=f"Det här är ord{i} i en mening.",
+            source_lang_tag="sv",
+            target_lang_tag="EN-GB",
+            translated_word=f"word{i}",
+            translated_example=f"This is <i>word{i}</i> in a sentence.",
+        )
+        for i in range(N_CANDIDATES)
+    ]
+
+
+def _builds(deck_io):
+    timings = []
+    for _ in range(BUILDS):
+        t0 = time.perf_counter()
+        cached, missing = find_cached_translation_batch(_selection(), deck_io)
+        timings.append(time.perf_counter() - t0)
+        assert len(cached) == N_CANDIDATES and not missing
+    return timings
+
+
+def main():
+    logging.getLogger().setLevel(logging.ERROR)
+    remote = RemoteDeckIO()
+    remote.upsert_cache_translation([_prepare_cache_entry(c) for c in _selection()])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, deck_io in (
+            ("supabase", remote),
+            (
+                "tiered",
+                TieredDeckIO(
+                    remote, SqliteTranslationCache(f"{tmp}/translations.sqlite3")
+                ),
+            ),
+        ):
+            remote.requests = 0
+            timings = _builds(deck_io)
+            print(
+                f"{name:>8}: builds "
+                + ", ".join(f"{t * 1e3:6.1f}ms" for t in timings)
+                + f"; {remote.requests} Supabase requests"
+            )
+            if name == "tiered":
+                print(f"          tiers: {deck_io.stats()}")
+
+        # Another worker process on the node: cold L1, warm L2
+        remote.requests = 0
+        worker = TieredDeckIO(
+            remote, SqliteTranslationCache(f"{tmp}/translations.sqlite3")
+        )
+        timings = _builds(worker)
+        print(
+            "  worker2: builds "
+            + ", ".join(f"{t * 1e3:6.1f}ms" for t in timings)
+            + f"; {remote.requests} Supabase requests"
+        )
+
+
+if __name__ == "__main__":
+    main()
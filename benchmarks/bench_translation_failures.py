@@ -0,0 +1,95 @@
+"""
+Benchmark: three rebuilds of a deck where DeepL loses the <i> tag for 10%
+of the candidates. Legacy re-sends the failures on every build; now they
+get one repair pass (term and sentence translated separately) and the
+ones that still fail are skipped within their retry window.
+
+Run: python -m benchmarks.bench_translation_failures
+"""
+
+import logging
+
+from domain.deck.schemas.schema import Candidate
+from domain.translator.fake_translator import FakeTranslator
+from domain.translator.scheduler import TranslationScheduler
+from domain.translator.translation import translate_selection
+
+N_CANDIDATES = 1000
+BUILDS = 3
+
+
+class TagLosingTranslator(FakeTranslator):
+    """Drops the tag of every 10th sentence; half of those lone terms are lost."""
+
+    def translate(self, text, target_lang, source_lang):
+        out = []
+        for t in super().translate(text, target_lang, source_lang):
+            n = int("".join(ch for ch in t if ch.isdigit()) or 0)
+            if n % 10 == 0:
+                t = t.replace("<i>", "").replace("</i>", "")
+                if n % 20 == 0 and " " not in t:
+                    t = "-"
+            out.append(t)
+        self.texts = getattr(self, "texts", 0) + len(text)
+        return out
+
+
+class MemoryStore:
+    def __init__(self):
+        self.rows = {}
+
+    def get_cached(self, ids):
+        return {i: self.rows[i] for i in ids if i in self.rows}
+
+    def upsert_cache_translation(self, cache_entries):
+        self.rows.update({entry["id"]: entry for entry in cache_entries})
+
+    get_failed = get_cached
+
+    def record_failed(self, entries):
+        self.rows.update({entry["id"]: entry for entry in entries})
+
+
+def _selection():
+    return [
+        Candidate(
+            lemma=f"ord{i}",
+            pos="NOUN",
+            forms=[f"ord{i}"],
+            freq=1,
+            cov_share_source=0.0,
+            form_original_lang=f"ord{i}",
+            sentence_original_lang=f"Här står ord{i} i en mening.",
+            source_lang_tag="sv",
+            target_lang_tag="EN-GB",
+        )
+        for i in range(N_CANDIDATES)
+    ]
+
+
+def main():
+    logging.getLogger().setLevel(logging.ERROR)
+    for name, kwargs in (
+        ("legacy", {"repair": False}),
+        ("current", {"repair": True, "failures": MemoryStore()}),
+    ):
+        cache, translator = MemoryStore(), TagLosingTranslator(latency=0)
+        scheduler = TranslationScheduler(translator, rate=1000)
+        texts, failed, wasted = [], [], 0
+        for _ in range(BUILDS):
+            before = getattr(translator, "texts", 0)
+            stats = {}
+            _, not_translated = translate_selection(
+                _selection(), translator, cache, scheduler, stats=stats, **kwargs
+            )
+            texts.append(translator.texts - before)
+            failed.append(len(not_translated))
+            wasted += stats["translation_wasted_calls"]
+        print(
+            f"{name:>7}: texts sent per build {texts}, failed cards {failed},"
+            f" wasted texts {wasted}"
+        )
+
+
+if __name__ == "__main__":
+    main()
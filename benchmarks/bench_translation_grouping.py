@@ -0,0 +1,76 @@
+"""
+Benchmark: one translation per candidate (one <i> tag each) vs one per
+shared sentence with id-bearing tags, on a dialogue-heavy selection where
+short lines carry several selected words. Counts requests and characters
+sent (what DeepL bills) through the scheduler and FakeTranslator.
+
+Run: python -m benchmarks.bench_translation_grouping
+"""
+
+import logging
+import random
+import time
+
+from domain.deck.schemas.schema import Candidate
+from domain.translator.fake_translator import FakeTranslator
+from domain.translator.scheduler import TranslationScheduler
+from domain.translator.translation import translate_selection
+
+N_SENTENCES = 600
+WORDS = [f"ord{i}" for i in range(5000)]
+
+
+class MemoryDeckIO:
+    def get_cached(self, ids):
+        return {}
+
+    def upsert_cache_translation(self, cache_entries):
+        return {}
+
+
+def _selection(rng: random.Random):
+    selection = []
+    for _ in range(N_SENTENCES):
+        words = rng.sample(WORDS, rng.randint(4, 10))
+        sentence = " ".join(words).capitalize() + "."
+        # Dialogue lines: most selected words share their line with others
+        for form in rng.sample(words, rng.choice([1, 1, 2, 3, 4])):
+            selection.append(
+                Candidate(
+                    lemma=form,
+                    pos="NOUN",
+                    forms=[form],
+                    freq=1,
+                    cov_share_source=0.0,
+                    form_original_lang=form,
+                    sentence_original_lang=sentence,
+                    source_lang_tag="sv",
+                    target_lang_tag="EN-GB",
+                )
+            )
+    return selection
+
+
+def main():
+    logging.getLogger().setLevel(logging.ERROR)
+    for grouped in (False, True):
+        selection = _selection(random.Random(0))
+        translator = FakeTranslator(latency=0.02, latency_per_char=2e-6)
+        scheduler = TranslationScheduler(translator, rate=1000, seed=0)
+        t0 = time.perf_counter()
+        translated, failed = translate_selection(
+            selection, translator, MemoryDeckIO(), scheduler, grouped
+        )
+        elapsed = time.perf_counter() - t0
+        stats = scheduler.stats()
+        assert not failed and all(c.translated_word for c in translated)
+        print(
+            f"{'grouped' if grouped else 'one-term':>8}: {len(selection)} candidates,"
+            f" {int(stats['requests']):>3} requests,"
+            f" {sum(len(b) for b in translator.batches):>5} texts,"
+            f" {int(stats['chars']):>6} chars, {elapsed:5.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
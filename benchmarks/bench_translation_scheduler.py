@@ -0,0 +1,71 @@
+"""
+Benchmark: concurrent translation scheduler vs the previous serial loop
+(one batch at a time, a fixed 3 s sleep and a single retry on HTTP 429),
+against FakeTranslator with DeepL-like latency and a server-side limit on
+requests per second.
+
+Run: python -m benchmarks.bench_translation_scheduler
+"""
+
+import logging
+import time
+from typing import List
+
+from domain.translator.fake_translator import FakeTranslator
+from domain.translator.scheduler import TranslationScheduler
+from domain.translator.translator import TooManyRequestsError
+
+BATCHES = 40
+BATCH_SIZE = 40
+LATENCY = 0.25
+JITTER = 0.25
+MAX_RPS = 8
+
+
+def legacy_run(translator, batches: List[List[str]]) -> List[List[str]]:
+    out = []
+    for batch in batches:
+        for attempt in range(2):
+            try:
+                out.append(translator.translate(batch, "EN-GB", "sv"))
+                break
+            except TooManyRequestsError:
+                if attempt == 1:
+                    raise
+                time.sleep(3)
+    return out
+
+
+def main():
+    logging.getLogger().setLevel(logging.ERROR)
+    batches = [
+        [f"<i>ord{i}</i> {j}" for j in range(BATCH_SIZE)] for i in range(BATCHES)
+    ]
+    print(
+        f"{BATCHES} batches, latency {LATENCY}-{LATENCY + JITTER}s,"
+        f" server limit {MAX_RPS} req/s"
+    )
+
+    translator = FakeTranslator(latency=LATENCY, jitter=JITTER, max_rps=MAX_RPS)
+    t0 = time.perf_counter()
+    assert legacy_run(translator, batches) == batches
+    print(
+        f"{'serial':>10}: {time.perf_counter() - t0:6.2f}s,"
+        f" 429s: {translator.throttled}"
+    )
+
+    for workers, burst in ((4, 1), (8, 1), (16, 1), (8, 8)):
+        translator = FakeTranslator(latency=LATENCY, jitter=JITTER, max_rps=MAX_RPS)
+        scheduler = TranslationScheduler(
+            translator, max_workers=workers, rate=MAX_RPS, burst=burst, seed=0
+        )
+        t0 = time.perf_counter()
+        assert scheduler.run(batches, "EN-GB", "sv") == batches
+        print(
+            f"{workers:>2}w burst {burst}: {time.perf_counter() - t0:6.2f}s,"
+            f" 429s: {translator.throttled}, stats: {scheduler.stats()}"
+        )
+
+
+if __name__ == "__main__":
+    main()
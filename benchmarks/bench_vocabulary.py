@@ -0,0 +1,66 @@
+"""
+Benchmark: memory footprint of many cached analyses with interned lemma/form
+strings vs one string object per occurrence, and the size of the id-based
+lexicon index next to the lexicon it indexes.
+Each bundled episode is decoded COPIES times, standing in for a worker that
+keeps many analyses of overlapping vocabulary in its cache.
+
+Run: python -m benchmarks.bench_vocabulary
+"""
+
+import gc
+import sys
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from benchmarks.bench_analysis_artifact import _episodes
+from domain.nlp.lexicon import artifact
+from domain.nlp.lexicon.artifact import dump_analysis, load_analysis
+from domain.nlp.lexicon.index import LexiconIndex
+from domain.vocab.vocabulary import Vocabulary
+
+COPIES = 8
+
+
+def _footprint(fn) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def _decode_all(blobs):
+    return [load_analysis(blob) for blob in blobs for _ in range(COPIES)]
+
+
+def main():
+    episodes = list(_episodes())
+    blobs = [dump_analysis(episode) for _, episode in episodes]
+    lemmas = sum(len(e.episode_data_processed) for _, e in episodes)
+    print(f"{len(episodes)} episodes x {COPIES} copies, {lemmas} lemmas per copy")
+
+    # Legacy decode: every lemma / form / label string is a fresh object
+    legacy_sys = SimpleNamespace(byteorder=sys.byteorder, intern=lambda s: s)
+    with patch.object(artifact, "sys", legacy_sys):
+        _, plain = _footprint(lambda: _decode_all(blobs))
+    _, interned = _footprint(lambda: _decode_all(blobs))
+    print(
+        f"decoded analyses: {plain / 1e6:.1f} MB -> {interned / 1e6:.1f} MB interned"
+        f" ({1 - interned / plain:.0%} less)"
+    )
+
+    vocabulary = Vocabulary()
+    indexes, index_size = _footprint(
+        lambda: [LexiconIndex.build(e, vocabulary, create=True) for _, e in episodes]
+    )
+    print(
+        f"lexicon indexes: {sum(i.nbytes() for i in indexes) / 1e3:.0f} KB of"
+        f" columns, {index_size / 1e6:.2f} MB incl. vocabulary {vocabulary.stats()}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -24,3 +24,16 @@ BUILD_VERSION = "v1"
 CARDS_TABLE = "cards"
 DECKS_TABLE = "decks"
 CACHED_TRANSLATIONS_TABLE = "cached_translations"
+
+# Analysis
+MAX_EXAMPLES_PER_FORM = 50
+MAX_EXAMPLES_PER_EPISODE = 20000
+EXAMPLE_SHORTLIST_SIZE = 5
+
+# Vocabulary (integer ids per lang and kind) and known lemmas
+LEMMA_VOCABULARY_TABLE = "lemma_vocabulary"
+VOCABULARY_TABLES = {"lemma": LEMMA_VOCABULARY_TABLE}
+KNOWN_LEMMAS_TABLE = "known_lemmas"
+
+# Translations that failed tag validation (negative cache)
+FAILED_TRANSLATIONS_TABLE = "failed_translations"
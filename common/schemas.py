@@ -44,8 +44,11 @@ class CacheEntry(BaseModel):
     target_lang: str
 
 
-DIFFICULTY_SCORING = Literal["FREQ"]
+DIFFICULTY_SCORING = Literal["FREQ", "ZIPF", "TFIDF", "LENGTH"]
 OUTPUT_FORMAT = Literal["anki", "quizlet", "csv"]
+# SENTENCE: term tagged in its example sentence, cached per (form, sentence)
+# LEMMA: context-free gloss cached per (form, POS) for LEMMA_TRANSLATION_POS
+TRANSLATION_MODE = Literal["SENTENCE", "LEMMA"]
 
 
 class BuildDeckRequest(BaseModel):
@@ -61,10 +64,14 @@ class BuildDeckRequest(BaseModel):
     target_share_per_pos: Optional[Dict[str, float]] = Field(default_factory=dict)
     difficulty_scoring: DIFFICULTY_SCORING = "FREQ"
     exclude_known_lemmas: Optional[List[str]] = Field(default_factory=list)
+    user_id: Optional[str] = None  # also excludes the user's stored known lemmas
     # example_settings: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
     lang_opts: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
     target_lang_tag: str
     build_version: str
+    translation_mode: TRANSLATION_MODE = "SENTENCE"
+    # LEMMA mode: translate example sentences only if cards render them
+    render_sentence_translation: bool = True
     # params_schema_version: Literal["v1"] = "v1"
     # requested_by: str
     # requested_at_iso: str
@@ -82,10 +89,15 @@ class PreviewBuildDeckRequest(BaseModel):
     target_share_per_pos: Optional[Dict[str, float]] = Field(default_factory=dict)
     difficulty_scoring: DIFFICULTY_SCORING = "FREQ"
     exclude_known_lemmas: Optional[List[str]] = Field(default_factory=list)
+    user_id: Optional[str] = None  # also excludes the user's stored known lemmas
     # example_settings: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
     # lang_opts: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
 
 
+class KnownLemmasRequest(BaseModel):
+    lemmas: List[str]
+
+
 class ExportDeckRequest(BaseModel):
     deck_id: str
     output_format: OUTPUT_FORMAT
@@ -1,7 +1,8 @@
-from typing import Any, List, Protocol
+from typing import Any, Dict, Iterator, List, Optional, Protocol
 
 from common.schemas import CacheEntry
 from domain.deck.schemas.schema import Candidate, Card, Deck
+from domain.nlp.lexicon.schema import NLPToken
 
 
 class DeckIO(Protocol):
@@ -9,8 +10,54 @@ class DeckIO(Protocol):
 
     def upsert_cache_translation(self, cache_entries: list[CacheEntry]) -> dict: ...
 
+    def iter_cache_ids(self) -> Iterator[str]: ...
+
+    def cache_ids_since(self, since: float) -> Iterator[str]: ...
+
+    def last_cache_write(self) -> Optional[float]: ...
+
     def save_deck(self, deck: Deck, request_params: dict) -> Any: ...
 
     def save_cards(self, cards: list[Card], deck_id: str) -> Any: ...
 
     def get_cards(self, deck_id: str) -> list[Card]: ...
+
+
+class TokenCache(Protocol):
+    def get_many(self, version: str, forms: List[str]) -> Dict[str, List[NLPToken]]: ...
+
+    def put_many(
+        self, version: str, tokens_by_form: Dict[str, List[NLPToken]]
+    ) -> None: ...
+
+    def stats(self) -> dict: ...
+
+
+class TranslationCache(Protocol):
+    def get_many(self, version: str, ids: List[str]) -> Dict[str, Dict[str, Any]]: ...
+
+    def put_many(self, version: str, rows: Dict[str, Dict[str, Any]]) -> None: ...
+
+    def stats(self) -> dict: ...
+
+
+class VocabularyIO(Protocol):
+    def get_ids(self, lang: str, kind: str, values: List[str]) -> Dict[str, int]: ...
+
+    def create_ids(
+        self, lang: str, kind: str, values: List[str]
+    ) -> Dict[str, int]: ...
+
+    def get_values(self, lang: str, kind: str, ids: List[int]) -> Dict[int, str]: ...
+
+
+class FailedTranslationIO(Protocol):
+    def get_failed(self, ids: List[str]) -> Dict[str, Dict[str, Any]]: ...
+
+    def record_failed(self, entries: List[Dict[str, Any]]) -> Any: ...
+
+
+class KnownLemmaIO(Protocol):
+    def load_known(self, user_id: str, lang: str) -> Optional[bytes]: ...
+
+    def save_known(self, user_id: str, lang: str, bitset: bytes, count: int) -> Any: ...
@@ -1,6 +1,7 @@
+import heapq
 from collections import Counter, defaultdict
 from math import floor
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from domain.deck.schemas.schema import Candidate
 
@@ -49,99 +50,127 @@ def _normalize_targets(target_share_per_pos: Dict[str, float]) -> Dict[str, floa
     return {k: max(0.0, v) / total for k, v in target_share_per_pos.items()}
 
 
-def _bucketize_by_pos(candidates: list[Candidate]) -> dict[str, list[Candidate]]:
-    """Group candidates by POS. Each bucket sorted by score descending; drop zero coverage."""
-    buckets: dict[str, list[Candidate]] = defaultdict(list)
-    for rc in candidates:
+def _bucketize_by_pos(
+    candidates: list[Candidate], scores: Sequence[float]
+) -> Tuple[dict[str, list[Candidate]], dict[str, list[float]]]:
+    """
+    Group candidates by POS. Each bucket sorted by score descending; drop zero coverage.
+    Returns buckets and their scores, aligned.
+    """
+    indices: dict[str, list[int]] = defaultdict(list)
+    for i, rc in enumerate(candidates):
         if rc.cov_share_source > 0.0:
-            buckets[rc.pos].append(rc)
-    for pos, bucket in buckets.items():
-        bucket.sort(key=lambda x: x.score, reverse=True)
-    return buckets
-
-
-def _is_eligible(
-    pos: str,
-    buckets: dict[str, list[Candidate]],
-    pos_counts: Counter,
-    caps: dict[str, int],
-) -> bool:
-    """Eligible = bucket non-empty AND under its hard cap (if any)."""
-    if not buckets.get(pos):
-        return False
-    cap = caps.get(pos)
-    return (cap is None) or (pos_counts.get(pos, 0) < cap)
-
-
-def _global_best_head(
-    buckets: Dict[str, List[Candidate]], pos_counts: Counter, caps: Dict[str, int]
-) -> Tuple[Optional[str], Optional[Candidate]]:
-    """Return (pos, item) for the best available head across eligible buckets."""
-    best_pos: Optional[str] = None
-    best_item: Optional[Candidate] = None
-    for p, bucket in buckets.items():
-        if not _is_eligible(p, buckets, pos_counts, caps):
-            continue
-        head = bucket[0]
-        if best_item is None or head.score > best_item.score:
-            best_item, best_pos = head, p
-    return best_pos, best_item
+            indices[rc.pos].append(i)
+    buckets: dict[str, list[Candidate]] = {}
+    bucket_scores: dict[str, list[float]] = {}
+    for pos, bucket in indices.items():
+        bucket.sort(key=scores.__getitem__, reverse=True)
+        buckets[pos] = [candidates[i] for i in bucket]
+        bucket_scores[pos] = [scores[i] for i in bucket]
+    return buckets, bucket_scores
+
+
+class _PosQueues:
+    """
+    Per-POS sorted buckets read through index cursors, plus a lazy max-heap of
+    bucket heads for the global best.
+    A POS that turns ineligible (bucket exhausted or hard cap hit) never becomes
+    eligible again, so stale heap entries are simply dropped when met.
+    Heap ties break on bucket order, like a left-to-right scan with strict >.
+    """
+
+    def __init__(
+        self,
+        candidates: list[Candidate],
+        scores: Sequence[float],
+        caps: Dict[str, int],
+    ):
+        self.buckets, self.scores = _bucketize_by_pos(candidates, scores)
+        self.caps = caps
+        self.cursor: Dict[str, int] = {pos: 0 for pos in self.buckets}
+        self.order: Dict[str, int] = {pos: i for i, pos in enumerate(self.buckets)}
+        self.pos_counts: Counter = Counter()
+        self.eligible = {pos for pos in self.buckets if self._is_eligible(pos)}
+        self.heap: List[Tuple[float, int, int, str]] = []
+        for pos in self.eligible:
+            self._push_head(pos)
+
+    def _is_eligible(self, pos: str) -> bool:
+        """Eligible = bucket non-empty AND under its hard cap (if any)."""
+        if self.cursor[pos] >= len(self.buckets[pos]):
+            return False
+        cap = self.caps.get(pos)
+        return (cap is None) or (self.pos_counts[pos] < cap)
+
+    def _push_head(self, pos: str) -> None:
+        i = self.cursor[pos]
+        heapq.heappush(self.heap, (-self.scores[pos][i], self.order[pos], i, pos))
+
+    def head_score(self, pos: str) -> float:
+        return self.scores[pos][self.cursor[pos]]
+
+    def global_best(self) -> Optional[str]:
+        """POS of the best available head across eligible buckets."""
+        while self.heap:
+            _, _, i, pos = self.heap[0]
+            if pos in self.eligible and i == self.cursor[pos]:
+                return pos
+            heapq.heappop(self.heap)
+        return None
+
+    def take(self, pos: str) -> Tuple[Candidate, float]:
+        i = self.cursor[pos]
+        self.cursor[pos] += 1
+        self.pos_counts[pos] += 1
+        if self._is_eligible(pos):
+            self._push_head(pos)
+        else:
+            self.eligible.discard(pos)
+        return self.buckets[pos][i], self.scores[pos][i]
 
 
 def _compute_needs(
-    pos_counts: Counter,
+    queues: _PosQueues,
     targets: Dict[str, float],
-    buckets: Dict[str, List[Candidate]],
-    caps: Dict[str, int],
+    picked_count: int,
     alpha: float = 1.0,
-) -> Dict[str, float]:
+) -> Tuple[Optional[str], float]:
     """
     Smoothed need per POS: need = target_share - current_share,
     where current_share ≈ (count + α) / (N + α * P). Ineligible POS -> -inf.
+    Returns the first POS with the highest need and that need.
     """
-    needs: Dict[str, float] = {}
-    if not targets:
-        return needs
-
     P = len(targets)
-    N = sum(pos_counts.values())
+    N = picked_count
     denom = N + alpha * P
 
+    pos_star: Optional[str] = None
+    need_star = float("-inf")
     for pos, t in targets.items():
-        if not _is_eligible(pos, buckets, pos_counts, caps):
-            needs[pos] = float("-inf")
-            continue
-        s_hat = (pos_counts.get(pos, 0) + alpha) / denom if denom > 0 else (1.0 / P)
-        needs[pos] = t - s_hat
-    return needs
+        if pos not in queues.eligible:
+            need = float("-inf")
+        else:
+            s_hat = (
+                (queues.pos_counts[pos] + alpha) / denom if denom > 0 else (1.0 / P)
+            )
+            need = t - s_hat
+        if pos_star is None or need > need_star:
+            pos_star, need_star = pos, need
+    return pos_star, need_star
 
 
 # ----------------- Main picker -----------------
 
 
-def pick_until_target(
-    filtered_ranked: list[Candidate],
+def _resolve_limits(
+    n_candidates: int,
     max_cards: Optional[int],
-    target_coverage: Optional[float],
-    max_share_per_pos: Optional[dict[str, float]] = None,  # hard caps (sum ≤ 1)
-    target_share_per_pos: Optional[
-        dict[str, float]
-    ] = None,  # soft targets (normalized)
-    hysteresis_eps: float = 0.02,  # ignore tiny needs near boundary
-    score_gap_delta: float = 0.15,  # allow global best if it's ≥15% higher than the needed head
-) -> Tuple[list[Candidate], dict[str, Any]]:
-    """
-    POS-aware greedy picker that respects hard caps and optionally steers toward a target mix.
-    Stops at target_coverage or max_cards, or when candidates are exhausted.
-    Returns (picked, report).
-    """
-    if target_coverage is not None and not (0.0 <= target_coverage <= 1.0):
-        raise ValueError("target_coverage must be within [0, 1].")
-
+    max_share_per_pos: Optional[dict[str, float]],
+    target_share_per_pos: Optional[dict[str, float]],
+) -> Tuple[int, Dict[str, int], Dict[str, float]]:
+    """Deck budget, hard cap counts and normalized soft targets for a request."""
     limit = (
-        max_cards
-        if (max_cards is not None and int(max_cards) > 0)
-        else len(filtered_ranked)
+        max_cards if (max_cards is not None and int(max_cards) > 0) else n_candidates
     )
     # Max share per pos validation - sum <=1
     _validate_caps(max_share_per_pos)
@@ -149,10 +178,30 @@ def pick_until_target(
     caps = _caps_to_counts(limit, max_share_per_pos)
     # Normalize target shares to sum = 1
     targets = _normalize_targets(target_share_per_pos)
+    return limit, caps, targets
 
-    buckets = _bucketize_by_pos(filtered_ranked)
+
+def _greedy_pick(
+    filtered_ranked: list[Candidate],
+    limit: int,
+    target_coverage: Optional[float],
+    caps: Dict[str, int],
+    targets: Dict[str, float],
+    hysteresis_eps: float,
+    score_gap_delta: float,
+    scores: Optional[Sequence[float]] = None,
+) -> Tuple[list[Candidate], list[float], Counter, float, str]:
+    """
+    Greedy loop of pick_until_target.
+    Returns (picked, picked_scores, pos_counts, coverage, reason).
+    Buckets are consumed through cursors and the global best comes from a heap,
+    so each pick costs O(log P + P) instead of rescanning and shifting lists.
+    """
+    if scores is None:
+        scores = [c.score for c in filtered_ranked]
+    queues = _PosQueues(filtered_ranked, scores, caps)
     picked: list[Candidate] = []
-    pos_counts: Counter = Counter()
+    picked_scores: list[float] = []
     coverage = 0.0
     reason = "exhausted"
 
@@ -164,65 +213,93 @@ def pick_until_target(
         if len(picked) >= limit:
             reason = "max_cards"
             break
-        if all(len(b) == 0 for b in buckets.values()):
-            reason = "exhausted"
-            break
-        if not any(_is_eligible(p, buckets, pos_counts, caps) for p in buckets):
+        if not queues.eligible:
             reason = "exhausted"
             break
 
-        # --- Seed with global best on the first iteration ---
-        if not picked:
-            g_pos, g_item = _global_best_head(buckets, pos_counts, caps)
-            if g_item is None:
-                reason = "exhausted"
-                break
-            buckets[g_pos].pop(0)
-            picked.append(g_item)
-            pos_counts[g_pos] += 1
-            coverage = min(1.0, coverage + g_item.cov_share_source)
-            continue
-
-        # --- Choose POS: soft need if provided; otherwise global best ---
-        needs = _compute_needs(pos_counts, targets, buckets, caps) if targets else {}
+        # --- Choose POS: soft need if provided (never on the first pick); otherwise global best ---
         chosen_pos: Optional[str] = None
 
-        if needs:
-            pos_star = max(needs, key=needs.get)
-            need_star = needs[pos_star]
-            if need_star > hysteresis_eps and _is_eligible(
-                pos_star, buckets, pos_counts, caps
-            ):
+        if picked and targets:
+            pos_star, need_star = _compute_needs(queues, targets, len(picked))
+            if need_star > hysteresis_eps:
                 # Global-utility override: if global best is much stronger than the needed head, take it.
-                g_pos, g_item = _global_best_head(buckets, pos_counts, caps)
-                needed_head = buckets[pos_star][0] if buckets[pos_star] else None
-                if (
-                    g_item
-                    and needed_head
-                    and g_item.score >= (1.0 + score_gap_delta) * needed_head.score
-                ):
+                g_pos = queues.global_best()
+                if queues.head_score(g_pos) >= (
+                    1.0 + score_gap_delta
+                ) * queues.head_score(pos_star):
                     chosen_pos = g_pos
                 else:
                     chosen_pos = pos_star
 
         if chosen_pos is None:
-            chosen_pos, _ = _global_best_head(buckets, pos_counts, caps)
-        if chosen_pos is None:
-            reason = "exhausted"
-            break
+            chosen_pos = queues.global_best()
 
         # --- Commit pick ---
-        item = buckets[chosen_pos].pop(0)
+        item, score = queues.take(chosen_pos)
         picked.append(item)
-        pos_counts[chosen_pos] += 1
+        picked_scores.append(score)
         coverage = min(1.0, coverage + item.cov_share_source)
 
+    return picked, picked_scores, queues.pos_counts, coverage, reason
+
+
+def _make_report(
+    picked_count: int,
+    coverage: float,
+    pos_counts: Dict[str, int],
+    reason: str,
+    target_coverage: Optional[float],
+) -> dict[str, Any]:
     report = {
-        "picked_count": len(picked),
+        "picked_count": picked_count,
         "achieved_coverage": coverage,
         "pos_counts": dict(pos_counts),
         "stopped_reason": reason,
     }
     if target_coverage is not None and coverage < target_coverage - 1e-12:
         report["note"] = "Target not reached with current caps/availability."
-    return picked, report
+    return report
+
+
+def pick_until_target(
+    filtered_ranked: list[Candidate],
+    max_cards: Optional[int],
+    target_coverage: Optional[float],
+    max_share_per_pos: Optional[dict[str, float]] = None,  # hard caps (sum ≤ 1)
+    target_share_per_pos: Optional[
+        dict[str, float]
+    ] = None,  # soft targets (normalized)
+    hysteresis_eps: float = 0.02,  # ignore tiny needs near boundary
+    score_gap_delta: float = 0.15,  # allow global best if it's ≥15% higher than the needed head
+    scores: Optional[Sequence[float]] = None,  # aligned with filtered_ranked
+) -> Tuple[list[Candidate], dict[str, Any]]:
+    """
+    POS-aware greedy picker that respects hard caps and optionally steers toward a target mix.
+    Stops at target_coverage or max_cards, or when candidates are exhausted.
+    Scores come from candidate.score unless given; given scores are written
+    back to the picked candidates only.
+    Returns (picked, report).
+    """
+    if target_coverage is not None and not (0.0 <= target_coverage <= 1.0):
+        raise ValueError("target_coverage must be within [0, 1].")
+
+    limit, caps, targets = _resolve_limits(
+        len(filtered_ranked), max_cards, max_share_per_pos, target_share_per_pos
+    )
+    picked, picked_scores, pos_counts, coverage, reason = _greedy_pick(
+        filtered_ranked,
+        limit,
+        target_coverage,
+        caps,
+        targets,
+        hysteresis_eps,
+        score_gap_delta,
+        scores,
+    )
+    if scores is not None:
+        for item, score in zip(picked, picked_scores):
+            item.score = score
+    return picked, _make_report(
+        len(picked), coverage, pos_counts, reason, target_coverage
+    )
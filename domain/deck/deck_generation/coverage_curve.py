@@ -0,0 +1,135 @@
+from bisect import bisect_left
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from domain.deck.deck_generation.candidates_picker import (
+    _greedy_pick,
+    _make_report,
+    _resolve_limits,
+)
+from domain.deck.schemas.schema import Candidate
+
+_EPS = 1e-12
+
+
+class CoverageCurve:
+    """
+    Full greedy pick order for one set of ranked candidates and POS caps,
+    with the running coverage after every pick.
+    target_coverage and max_cards only decide where the greedy picker stops,
+    so any combination is answered by binary search over the prefix coverage.
+    Hard caps are counts derived from max_cards, so a curve is only valid for
+    requests with the same cap counts (see curve_key).
+    """
+
+    def __init__(self, picks: List[Candidate], n_candidates: int):
+        """
+        Args:
+            picks (List[Candidate]): Greedy pick order without any stop.
+            n_candidates (int): Candidates fed to the picker (deck budget
+                when max_cards is not set).
+        """
+        self.picks = picks
+        self.n_candidates = n_candidates
+        # coverage[k] = coverage after k picks, accumulated exactly like the picker
+        self.coverage = [0.0]
+        # pick indices per POS, in order of first appearance
+        self.pos_picks: Dict[str, List[int]] = {}
+        for i, item in enumerate(picks):
+            self.coverage.append(min(1.0, self.coverage[-1] + item.cov_share_source))
+            self.pos_picks.setdefault(item.pos, []).append(i)
+
+    def stop_at(
+        self, max_cards: Optional[int], target_coverage: Optional[float]
+    ) -> Tuple[int, str]:
+        """Number of picks pick_until_target makes and its stopped_reason."""
+        limit = (
+            max_cards
+            if (max_cards is not None and int(max_cards) > 0)
+            else self.n_candidates
+        )
+        k = min(limit, len(self.picks))
+        if target_coverage is not None:
+            # coverage is non-decreasing: first k that reaches the target
+            k = min(k, bisect_left(self.coverage, target_coverage - _EPS))
+            if k < len(self.coverage) and self.coverage[k] >= target_coverage - _EPS:
+                return k, "target_coverage"
+        if k >= limit:
+            return k, "max_cards"
+        return k, "exhausted"
+
+    def pos_counts(self, k: int) -> Dict[str, int]:
+        # pos_picks order is first pick of each POS, like the picker's Counter
+        return {
+            pos: bisect_left(indices, k)
+            for pos, indices in self.pos_picks.items()
+            if indices[0] < k
+        }
+
+    def report(
+        self, max_cards: Optional[int], target_coverage: Optional[float]
+    ) -> dict[str, Any]:
+        """Same report as pick_until_target for these stop parameters."""
+        if target_coverage is not None and not (0.0 <= target_coverage <= 1.0):
+            raise ValueError("target_coverage must be within [0, 1].")
+        k, reason = self.stop_at(max_cards, target_coverage)
+        return _make_report(
+            k, self.coverage[k], self.pos_counts(k), reason, target_coverage
+        )
+
+    def points(self, max_cards: Optional[int] = None) -> Dict[str, List]:
+        """Cards vs coverage for every deck size up to the budget."""
+        k, _ = self.stop_at(max_cards, None)
+        return {
+            "cards": list(range(k + 1)),
+            "coverage": self.coverage[: k + 1],
+        }
+
+
+def curve_key(
+    n_candidates: int,
+    max_cards: Optional[int],
+    max_share_per_pos: Optional[dict[str, float]],
+    target_share_per_pos: Optional[dict[str, float]],
+) -> Hashable:
+    """
+    Picker inputs that shape the pick order. Requests differing only in
+    target_coverage, or in max_cards without changing cap counts, share it.
+    """
+    _, caps, targets = _resolve_limits(
+        n_candidates, max_cards, max_share_per_pos, target_share_per_pos
+    )
+    # targets keep their order: it breaks ties between equal needs
+    return tuple(sorted(caps.items())), tuple(targets.items())
+
+
+def build_coverage_curve(
+    filtered_ranked: List[Candidate],
+    max_cards: Optional[int],
+    max_share_per_pos: Optional[dict[str, float]] = None,
+    target_share_per_pos: Optional[dict[str, float]] = None,
+    hysteresis_eps: float = 0.02,
+    score_gap_delta: float = 0.15,
+    scores: Optional[List[float]] = None,
+) -> CoverageCurve:
+    """
+    Run the greedy picker once without stop conditions. max_cards only fixes
+    the hard cap counts.
+    """
+    _, caps, targets = _resolve_limits(
+        len(filtered_ranked), max_cards, max_share_per_pos, target_share_per_pos
+    )
+    picks, _, _, _, _ = _greedy_pick(
+        filtered_ranked,
+        len(filtered_ranked),
+        None,
+        caps,
+        targets,
+        hysteresis_eps,
+        score_gap_delta,
+        scores,
+    )
+    return CoverageCurve(picks, len(filtered_ranked))
+
+
+if __name__ == "__main__":
+    pass
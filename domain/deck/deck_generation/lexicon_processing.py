@@ -1,9 +1,16 @@
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from common.schemas import BuildDeckRequest, PreviewBuildDeckRequest
 from domain.deck.deck_generation.candidates_picker import pick_until_target
+from domain.deck.deck_generation.scoring import CorpusStats, rank_candidates
 from domain.deck.schemas.schema import Candidate
+from domain.nlp.lexicon.examples import example_shortlist, word_count
+from domain.nlp.lexicon.index import LexiconIndex
 from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.vocab.known_store import KnownLemmas
+from domain.vocab.vocabulary import Vocabulary
 
 ###########################################################
 # Aim of this module is to generate a deck of cards
@@ -20,61 +27,76 @@ from domain.nlp.lexicon.schema import AnalyzedEpisode
 
 
 def select_candidates(
-    analyzed_episode: AnalyzedEpisode, req: BuildDeckRequest | PreviewBuildDeckRequest
+    analyzed_episode: AnalyzedEpisode,
+    req: BuildDeckRequest | PreviewBuildDeckRequest,
+    known: Optional[KnownLemmas] = None,
+    index: Optional[LexiconIndex] = None,
 ) -> List[Candidate]:
     """
     Select candidates from the lexicon based on the request parameters.
     Build candidates list from the lexicon. Filters out known lemmas and pos not in request.
+    Filtering runs on the id columns of the lexicon index (POS mask, one bitset
+    lookup for stored known lemmas); strings are materialized for kept rows only.
+    req.exclude_known_lemmas is still honoured for clients that send the list.
     """
-    lexicon = analyzed_episode.episode_data_processed
-    known_lemmas = set(req.exclude_known_lemmas or [])
-    allowed_pos = set(req.target_share_per_pos.keys() or [])
-    target_lang_tag = getattr(req, "target_lang_tag", None)
-
-    out: List[Candidate] = []
-    for lemma, data in lexicon.items():
-        pos = data.pos
-        source_lang_tag = data.lang
-        if allowed_pos and pos not in allowed_pos:
-            continue
-        if lemma in known_lemmas:
-            continue
-
-        freq_total = sum(data.forms_freq.values())
-        cov_total = sum(data.forms_cov.values())
-
-        out.append(
-            Candidate(
-                lemma=lemma,
-                pos=pos,
-                forms=list(set(data.forms)),
-                freq=freq_total,
-                cov_share_source=cov_total,
-                source_lang_tag=source_lang_tag,
-                target_lang_tag=target_lang_tag,
+    if index is None:
+        index = LexiconIndex.build(
+            analyzed_episode, known.vocabulary if known else Vocabulary()
+        )
+    keep = index.pos_mask(req.target_share_per_pos.keys() or [])
+    if known:
+        lemma_ids = index.lemma_ids
+        unknown = np.flatnonzero(lemma_ids < 0)
+        if len(unknown):
+            # Lemmas given an id after the index was built (marked known since)
+            lemma_ids = lemma_ids.copy()
+            lemma_ids[unknown] = known.vocabulary.ids(
+                index.lang, "lemma", index.lemmas(unknown)
             )
+        keep &= ~known.mask(lemma_ids)
+    if req.exclude_known_lemmas:
+        excluded = set(req.exclude_known_lemmas)
+        lexicon = analyzed_episode.episode_data_processed
+        keep &= ~np.fromiter((lemma in excluded for lemma in lexicon), bool, len(index))
+
+    rows = np.flatnonzero(keep)
+    target_lang_tag = getattr(req, "target_lang_tag", None)
+    return [
+        Candidate(
+            lemma=lemma,
+            lemma_id=lemma_id,
+            pos=index.pos_labels[pos_code],
+            forms=forms,
+            freq=freq,
+            cov_share_source=cov,
+            source_lang_tag=index.lang,
+            target_lang_tag=target_lang_tag,
         )
-    return out
+        for lemma, lemma_id, pos_code, forms, freq, cov in zip(
+            index.lemmas(rows),
+            index.lemma_ids[rows].tolist(),
+            index.pos_codes[rows].tolist(),
+            index.forms(rows),
+            index.freq[rows].tolist(),
+            index.cov[rows].tolist(),
+        )
+    ]
 
 
 def score_and_rank(
-    candidates: List[Candidate], req: BuildDeckRequest | PreviewBuildDeckRequest
+    candidates: List[Candidate],
+    req: BuildDeckRequest | PreviewBuildDeckRequest,
+    corpus: Optional[CorpusStats] = None,
 ) -> List[Candidate]:
     """
     Score and rank candidates based on request parameters.
-    Populates score field in candidates.
+    Populates score field in candidates. Pipelines that only need the picked
+    ones scored use rank_candidates and pass the scores to the picker.
     """
-    ### In the future - multiple ranking types based on req.difficulty_scoring
-    ranked_candidates = []
-    candidates = sorted(
-        candidates, key=lambda cand: cand.cov_share_source, reverse=True
-    )
-
-    for candidate in candidates:
-        candidate.score = candidate.cov_share_source
-        ranked_candidates.append(candidate)
-
-    return ranked_candidates
+    ranked, scores = rank_candidates(candidates, req.difficulty_scoring, corpus)
+    for candidate, score in zip(ranked, scores):
+        candidate.score = score
+    return ranked
 
 
 def select_example(
@@ -85,6 +107,9 @@ def select_example(
     """
     For each candidate and for each of its forms found in analyzed examples,
     choose exactly one example sentence and store under candidate['example'][form].
+    Uses the word counts and shortlist stored at analysis time: the first
+    shortlisted example within the length bounds (and unseen, with dedupe) is
+    the pick; all examples are scanned only when no shortlisted one fits.
     """
     # Read constraints (adapt lang key if needed)
     lang_opts = req.lang_opts.get("sv", {})
@@ -94,28 +119,35 @@ def select_example(
 
     seen_sentences = set()
 
-    def wc(s: str) -> int:
-        """Sentence word count"""
-        return len(s.split())
+    def take(sentence: str) -> str:
+        if dedupe:
+            seen_sentences.add(sentence)
+        return sentence
 
-    def pick_best(examples: List[str]) -> Optional[str]:
+    def pick_best(
+        examples: List[str], counts: List[int], shortlist: List[int]
+    ) -> Optional[str]:
         """Pick the best example sentence"""
         if not examples:
             return None
+        # Shortlist = first multi-word examples, so the first fit is the pick
+        for i in shortlist:
+            if min_len <= counts[i] <= max_len and not (
+                dedupe and examples[i] in seen_sentences
+            ):
+                return take(examples[i])
         # Apply length bounds
-        pool = [e for e in examples if min_len <= wc(e) <= max_len] or examples
+        pool = [i for i, c in enumerate(counts) if min_len <= c <= max_len]
+        pool = pool or list(range(len(examples)))
         # Prefer multi-word
-        multi = [e for e in pool if wc(e) > 1] or pool
+        multi = [i for i in pool if counts[i] > 1] or pool
         # Respect dedupe if requested
         if dedupe:
-            for e in multi:
-                if e not in seen_sentences:
-                    seen_sentences.add(e)
-                    return e
-            # all were seen: still return something deterministic
-            return multi[0]
-        else:
-            return multi[0]
+            for i in multi:
+                if examples[i] not in seen_sentences:
+                    return take(examples[i])
+        # all were seen (or no dedupe): still return something deterministic
+        return examples[multi[0]]
 
     for cand in selection:
         lemma = cand.lemma
@@ -126,7 +158,13 @@ def select_example(
 
         # data.examples is expected to be: Dict[str form, List[str sentences]]
         for form, example in data.examples.items():
-            chosen = pick_best(example)
+            counts = data.example_words.get(form)
+            if counts is None:  # analysed before example indexing
+                counts = [word_count(e) for e in example]
+                shortlist = example_shortlist(counts)
+            else:
+                shortlist = data.example_shortlist.get(form, [])
+            chosen = pick_best(example, counts, shortlist)
             if chosen:
                 cand.form_original_lang = form
                 cand.sentence_original_lang = chosen
@@ -0,0 +1,153 @@
+import json
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from common.schemas import DIFFICULTY_SCORING
+from domain.deck.schemas.schema import Candidate
+
+###########################################################
+# Vectorized candidate scoring.
+# Features are loaded once into NumPy arrays, every mode is a few array
+# expressions and ranking is a stable argsort, so ties keep input order.
+#
+# FREQ:   episode coverage share (the original ranking).
+# ZIPF:   geometric mean of episode coverage and the Zipf-expected share of
+#         the lemma in general language (1 / (rank * H_V)); lemmas useful in
+#         the episode AND in general rank first.
+# TFIDF:  coverage share * smoothed idf over a reference corpus of episodes.
+# LENGTH: coverage share penalized for long lemmas and many inflected forms.
+###########################################################
+
+# LENGTH mode: no penalty up to these, then linear per extra char / form
+_LENGTH_FREE_CHARS = 5
+_LENGTH_CHAR_PENALTY = 0.1
+_LENGTH_FORM_PENALTY = 0.05
+
+
+class CorpusStats(BaseModel):
+    """
+    Reference statistics for corpus-aware modes.
+    doc_freq: episodes containing the lemma (TFIDF).
+    freq_rank: general-language frequency rank, 1 = most common (ZIPF).
+    """
+
+    n_docs: int = 0
+    doc_freq: Dict[str, int] = Field(default_factory=dict)
+    freq_rank: Dict[str, int] = Field(default_factory=dict)
+
+
+def load_corpus_stats(path: str) -> CorpusStats:
+    with open(path, "r", encoding="utf-8") as f:
+        return CorpusStats(**json.load(f))
+
+
+class CandidateFeatures:
+    """
+    Column arrays of candidate features, aligned with the input list.
+    Columns are built on first use, so a mode only pays for what it reads.
+    """
+
+    def __init__(
+        self, candidates: List[Candidate], corpus: Optional[CorpusStats] = None
+    ):
+        self.candidates = candidates
+        self.corpus = corpus or CorpusStats()
+
+    def _column(self, values, dtype) -> np.ndarray:
+        return np.fromiter(values, dtype, len(self.candidates))
+
+    @cached_property
+    def freq(self) -> np.ndarray:
+        return self._column((c.freq for c in self.candidates), np.int64)
+
+    @cached_property
+    def cov(self) -> np.ndarray:
+        return self._column((c.cov_share_source for c in self.candidates), np.float64)
+
+    @cached_property
+    def n_forms(self) -> np.ndarray:
+        return self._column((len(c.forms) for c in self.candidates), np.int64)
+
+    @cached_property
+    def length(self) -> np.ndarray:
+        return self._column((len(c.lemma) for c in self.candidates), np.int64)
+
+    @cached_property
+    def doc_freq(self) -> np.ndarray:
+        doc_freq = self.corpus.doc_freq
+        return self._column(
+            (doc_freq.get(c.lemma, 0) for c in self.candidates), np.int64
+        )
+
+    @cached_property
+    def ext_rank(self) -> np.ndarray:
+        """General-language frequency rank, 0 = unknown."""
+        freq_rank = self.corpus.freq_rank
+        return self._column(
+            (freq_rank.get(c.lemma, 0) for c in self.candidates), np.int64
+        )
+
+
+def _episode_rank(freq: np.ndarray) -> np.ndarray:
+    """1-based frequency rank inside the episode (ties share the first rank)."""
+    order = np.argsort(-freq, kind="stable")
+    sorted_freq = freq[order]
+    first = np.r_[True, sorted_freq[1:] != sorted_freq[:-1]]
+    run_start = np.where(first, np.arange(len(freq)), 0)
+    ranks_sorted = np.maximum.accumulate(run_start) + 1
+    ranks = np.empty(len(freq), np.int64)
+    ranks[order] = ranks_sorted
+    return ranks
+
+
+def compute_scores(
+    features: CandidateFeatures, mode: DIFFICULTY_SCORING
+) -> np.ndarray:
+    cov = features.cov
+    if mode == "FREQ":
+        return cov.copy()
+    if mode == "ZIPF":
+        # Lemmas without an external rank fall back to their episode rank
+        rank = np.where(
+            features.ext_rank > 0, features.ext_rank, _episode_rank(features.freq)
+        )
+        vocab = max(len(features.corpus.freq_rank), int(rank.max(initial=1)))
+        harmonic = np.log(vocab) + np.euler_gamma
+        return np.sqrt(cov / (rank * harmonic))
+    if mode == "TFIDF":
+        n_docs = features.corpus.n_docs
+        idf = np.log((1 + n_docs) / (1 + features.doc_freq)) + 1.0
+        return cov * idf
+    if mode == "LENGTH":
+        penalty = (
+            1.0
+            + _LENGTH_CHAR_PENALTY
+            * np.maximum(0, features.length - _LENGTH_FREE_CHARS)
+            + _LENGTH_FORM_PENALTY * np.maximum(0, features.n_forms - 1)
+        )
+        return cov / penalty
+    raise ValueError(f"Unknown difficulty_scoring: {mode}")
+
+
+def rank_candidates(
+    candidates: List[Candidate],
+    mode: DIFFICULTY_SCORING = "FREQ",
+    corpus: Optional[CorpusStats] = None,
+) -> Tuple[List[Candidate], List[float]]:
+    """
+    Rank candidates by score, descending; ties keep input order.
+    Scores are returned aligned with the ranked list instead of being set on
+    every Candidate (pick_until_target writes them on picked ones only).
+    """
+    if not candidates:
+        return [], []
+    scores = compute_scores(CandidateFeatures(candidates, corpus), mode)
+    order = np.argsort(-scores, kind="stable")
+    return [candidates[i] for i in order.tolist()], scores[order].tolist()
+
+
+if __name__ == "__main__":
+    pass
@@ -1,10 +1,21 @@
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel
 
+# Candidate fields the translation cache id is built from
+CACHE_KEY_FIELDS = frozenset(
+    {
+        "form_original_lang",
+        "sentence_original_lang",
+        "source_lang_tag",
+        "target_lang_tag",
+    }
+)
+
 
 class Candidate(BaseModel):
     lemma: str
+    lemma_id: Optional[int] = None  # vocabulary id (see LexiconIndex)
     pos: str
     forms: list[str]
     freq: int
@@ -25,6 +36,14 @@ class Candidate(BaseModel):
 
     translation_input: Optional[str] = None
     translation_output: Optional[str] = None
+    # Translation cache id of (form, sentence, languages) for TRANS_VERSION;
+    # cleared whenever one of CACHE_KEY_FIELDS is assigned
+    cache_key: Optional[str] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in CACHE_KEY_FIELDS:
+            super().__setattr__("cache_key", None)
 
 
 POS = Literal["NOUN", "VERB", "ADJ", "ADV"]
@@ -1,20 +1,35 @@
+from typing import Optional
+
+from core.ports import TokenCache
 from domain.nlp.content.content_adapter import ContentAdapter
-from domain.nlp.content.srt_adapter import SRTAdapter
 from domain.nlp.lang.lang_adapter import LangAdapter
-from domain.nlp.lang.sv.sv_lang_adapter import SVLangAdapter
+
+# Concrete adapters are imported on demand, so importing the factory
+# (e.g. from the API process) does not pull in NLP dependencies.
 
 
 class AdapterFactory:
     @staticmethod
     def create_content_adapter(file_type: str) -> ContentAdapter:
         if file_type == "srt":
+            from domain.nlp.content.srt_adapter import SRTAdapter
+
             return SRTAdapter()
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
 
     @staticmethod
-    def create_lang_adapter(language: str) -> LangAdapter:
+    def create_lang_adapter(
+        language: str,
+        token_cache: Optional[TokenCache] = None,
+        workers: int = 1,
+        shard_size: int = 2000,
+    ) -> LangAdapter:
         if language == "sv":
-            return SVLangAdapter()
+            from domain.nlp.lang.sv.sv_lang_adapter import SVLangAdapter
+
+            return SVLangAdapter(
+                token_cache=token_cache, workers=workers, shard_size=shard_size
+            )
         else:
             raise ValueError(f"Unsupported language: {language}")
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Iterator, List
 
 from domain.nlp.lexicon.schema import SentenceRec
 
@@ -7,6 +7,14 @@ from domain.nlp.lexicon.schema import SentenceRec
 
 
 class ContentAdapter(ABC):
+    @abstractmethod
+    def iter_sentences(self, file: Any) -> Iterator[SentenceRec]:
+        """
+        Streaming mode: read the content unit by unit (bytes or file object)
+        and yield each sentence as soon as it is closed.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def clean_for_sentence(self, file: Any) -> List[SentenceRec]:
         """
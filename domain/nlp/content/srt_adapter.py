@@ -1,107 +1,174 @@
-from typing import Any, List
-
-import regex as re
+import io
+import re
+from bisect import bisect_right
+from typing import Any, Iterator, List, Optional, Tuple
 
 from domain.nlp.content.content_adapter import ContentAdapter
+from domain.nlp.content.text_normalizer import TextNormalizer
 from domain.nlp.lexicon.schema import SentenceRec
 
+Cue = Tuple[Optional[float], Optional[float], List[str]]
+
 
 class SRTAdapter(ContentAdapter):
     _SRT_TIME_RE = re.compile(
-        r"^\d{2}:\d{2}:\d{2}[,\.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,\.]\d{3}$"
-    )
-    _SENT_END_RE = re.compile(
-        r"""
-    (?<!\b(?:dr|prof|mr|mrs|ms|st|jr|sr|e\.g|i\.e|no|np|tj|kap|art|al)\.) # Abbreviations
-    (?<=\.|!|\?)                                                          # Split after . ! ?
-    \s+                                                                   # Followed by whitespace
-    (?=[A-Z0-9"'-]|\p{Lu})                                                # Lookahead: Next char is usually Upper or Value or Dash
-    """,
-        re.IGNORECASE | re.VERBOSE,
+        r"(\d{2}):(\d{2}):(\d{2})[,\.](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[,\.](\d{3})"
     )
+    _normalizer = TextNormalizer()
+    # Safety valve for streaming: text that never hits a sentence end
+    # (e.g. subtitles without punctuation) is flushed once it grows past this.
+    _MAX_PENDING_CHARS = 10_000
 
-    def _clean_line(self, text):
-        text = re.sub(r"<[^>]+>", "", text)
-
-        # 2. Remove leading dashes used for dialogue (e.g. "- Hello")
-        # This preserves hyphens in words like "semi-detached"
-        text = re.sub(r"^\s*-\s+", "", text)  # Dash followed by space
-        text = re.sub(r"^\s*-\s*", "", text)  # strict start dash
-        return text
+    def _clean_line(self, text: str) -> str:
+        return self._normalizer.clean_line(text)
 
     def _split_sentences(self, text: str) -> list[str]:
-        return [s.strip() for s in self._SENT_END_RE.split(text) if s.strip()]
+        return self._normalizer.split_sentences(text)
 
-    def _read_file(self, srt_file: Any) -> str:
+    def _iter_lines(self, srt_file: Any) -> Iterator[str]:
         """
-        Reads an SRT file and extracts the text content from it.
+        Yields decoded lines one at a time.
         Args:
-            srt_file (Any): The SRT file to read.
+            srt_file (Any): Raw bytes, a binary file object or a text file object.
         """
-        return srt_file.decode("utf-8")
-
-    def _parse_srt_blocks(self, content: str) -> list[str]:
+        if isinstance(srt_file, (bytes, bytearray, memoryview)):
+            srt_file = io.BytesIO(srt_file)
+        if isinstance(srt_file, io.TextIOBase):
+            yield from srt_file
+            return
+
+        # Universal newlines cover \r\n and bare \r
+        stream = io.TextIOWrapper(srt_file, encoding="utf-8", newline=None)
+        try:
+            yield from stream
+        finally:
+            # Do not close the caller's file object together with the wrapper
+            stream.detach()
+
+    def _parse_time(self, groups: Tuple[str, ...]) -> float:
+        h, m, s, ms = (int(g) for g in groups)
+        return round(h * 3600 + m * 60 + s + ms / 1000, 3)
+
+    def _parse_cue(self, block: List[str]) -> Optional[Cue]:
         """
-        Identify content blocks inbetween time lines.
+        Returns (start, end, text lines) for one SRT block.
+        Text lines are everything after the (last) timing line.
         """
-        content = content.replace("\r\n", "\n").replace("\r", "\n")
-        blocks = re.split(r"\n\s*\n", content)
+        arrow_line = -1
+        for i, line in enumerate(block):
+            if "-->" in line:
+                arrow_line = i
 
-        text_lines = []
-        for block in blocks:
-            lines = [l.strip() for l in block.splitlines() if l.strip()]
+        if arrow_line == -1 or arrow_line + 1 >= len(block):
+            return None
 
-            arrow_line = -1
-            for i, line in enumerate(lines):
-                if "-->" in line:
-                    arrow_line = i
+        start = end = None
+        match = self._SRT_TIME_RE.search(block[arrow_line])
+        if match:
+            start = self._parse_time(match.groups()[:4])
+            end = self._parse_time(match.groups()[4:])
 
-            if arrow_line != -1 and arrow_line + 1 < len(lines):
-                data_content = lines[arrow_line + 1 :]
+        return start, end, block[arrow_line + 1 :]
 
-            text_lines.extend(data_content)
-
-        return text_lines
+    def _iter_cues(self, lines: Iterator[str]) -> Iterator[Cue]:
+        """
+        Identify content blocks inbetween time lines, one block at a time.
+        """
+        block: List[str] = []
+        for line in lines:
+            line = line.strip()
+            if line:
+                block.append(line)
+                continue
+            if block:
+                cue = self._parse_cue(block)
+                if cue:
+                    yield cue
+                block = []
+
+        if block:
+            cue = self._parse_cue(block)
+            if cue:
+                yield cue
+
+    def _make_sentence(
+        self,
+        text: str,
+        begin: int,
+        stop: int,
+        offsets: List[int],
+        times: List[Tuple[Optional[float], Optional[float]]],
+    ) -> Optional[SentenceRec]:
+        """
+        Builds SentenceRec from text[begin:stop].
+        start/end come from the cues holding the first and the last character.
+        """
+        chunk = text[begin:stop]
+        sentence = chunk.strip()
+        if not sentence:
+            return None
+
+        first = begin + len(chunk) - len(chunk.lstrip())
+        last = begin + len(chunk.rstrip()) - 1
+        start = times[bisect_right(offsets, first) - 1][0]
+        end = times[bisect_right(offsets, last) - 1][1]
+        return SentenceRec(text=sentence, meta={"start": start, "end": end})
+
+    def iter_sentences(self, srt_file: Any) -> Iterator[SentenceRec]:
+        """
+        Streaming mode: reads cues one at a time and yields SentenceRec as soon as
+        a sentence closes. Only the current block and the unfinished sentence
+        are kept in memory. meta holds start/end (seconds) of the spanned cues.
+        """
+        pending = ""
+        offsets: List[int] = []  # where each cue starts in pending
+        times: List[Tuple[Optional[float], Optional[float]]] = []
+
+        for start, end, lines in self._iter_cues(self._iter_lines(srt_file)):
+            # Boundary can only appear after the last non-space char seen so far
+            scan_from = len(pending.rstrip())
+            if pending:
+                pending += " "
+            offsets.append(len(pending))
+            times.append((start, end))
+            pending += " ".join(self._clean_line(line) for line in lines)
+
+            cut = 0
+            for match in self._normalizer.sentence_ends(pending, scan_from):
+                rec = self._make_sentence(pending, cut, match.start(), offsets, times)
+                if rec:
+                    yield rec
+                cut = match.end()
+
+            if len(pending) - cut > self._MAX_PENDING_CHARS:
+                rec = self._make_sentence(pending, cut, len(pending), offsets, times)
+                if rec:
+                    yield rec
+                cut = len(pending)
+
+            if cut:
+                # Keep only cues overlapping the unfinished sentence
+                keep = max(0, bisect_right(offsets, cut) - 1)
+                offsets = [max(0, o - cut) for o in offsets[keep:]]
+                times = times[keep:]
+                pending = pending[cut:]
+
+        if offsets:
+            rec = self._make_sentence(pending, 0, len(pending), offsets, times)
+            if rec:
+                yield rec
 
     def clean_for_sentence(self, srt_file: Any) -> List[SentenceRec]:
         """
         Transform list of sentences to tokenized words adapter
         """
-        file_content = self._read_file(srt_file)
-
-        lines = self._parse_srt_blocks(file_content)
-        lines = [self._clean_line(line) for line in lines]
-
-        text = " ".join(lines)
-
-        # 2) Split by sentences (not lines)
-        sentences = self._split_sentences(text)
-
-        # 3) Clean and filter
-        cleaned_sentences = []
-        for s in sentences:
-            cleaned_sentences.append(SentenceRec(text=s, meta={}))
-
-        return cleaned_sentences
+        return list(self.iter_sentences(srt_file))
 
     def clean_for_words(self, sentences: List[SentenceRec]) -> List[str]:
         """
         Transform list of sentences to tokenized words adapter
         """
-        cleaned_sentences = []
-        for line in sentences:
-            sentence = line.text
-            # Remove punctuation and special characters using regex
-            sentence = re.sub(r"\p{P}+", " ", sentence)
-            sentence = sentence.lower()
-            sentence = sentence.strip()
-            for word in sentence.split():
-                if (
-                    word and word.isalpha()
-                ):  # Ensure the word is not empty and contains only alphabetic characters
-                    cleaned_sentences.append(word)
-
-        return cleaned_sentences
+        return self._normalizer.words(s.text for s in sentences)
 
 
 if __name__ == "__main__":
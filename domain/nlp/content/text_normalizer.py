@@ -0,0 +1,122 @@
+import re
+import unicodedata
+from typing import Callable, Iterable, Iterator, List
+
+# Punctuation and cased letters used below all live in Unicode planes 0-1
+_UNICODE_LIMIT = 0x20000
+
+_ABBREVIATIONS = (
+    "dr",
+    "prof",
+    "mr",
+    "mrs",
+    "ms",
+    "st",
+    "jr",
+    "sr",
+    "e.g",
+    "i.e",
+    "no",
+    "np",
+    "tj",
+    "kap",
+    "art",
+    "al",
+)
+
+# \s without the \x1c-\x1f separators (matches the `regex` module's \s)
+_WS = r"[^\S\x1c-\x1f]"
+
+
+def _char_class(predicate: Callable[[str], bool]) -> str:
+    """
+    Builds the body of a stdlib `re` character class from code point ranges.
+    """
+    ranges = []
+    start = prev = None
+    for cp in range(_UNICODE_LIMIT):
+        if not predicate(chr(cp)):
+            continue
+        if start is not None and cp == prev + 1:
+            prev = cp
+            continue
+        if start is not None:
+            ranges.append((start, prev))
+        start = prev = cp
+    if start is not None:
+        ranges.append((start, prev))
+
+    return "".join(
+        re.escape(chr(a)) if a == b else f"{re.escape(chr(a))}-{re.escape(chr(b))}"
+        for a, b in ranges
+    )
+
+
+def _is_punct(c: str) -> bool:
+    """Same set as \\p{P}."""
+    return unicodedata.category(c).startswith("P")
+
+
+def _upper_folds() -> frozenset:
+    return frozenset(
+        chr(cp).casefold()
+        for cp in range(_UNICODE_LIMIT)
+        if unicodedata.category(chr(cp)) == "Lu"
+    )
+
+
+_UPPER_FOLDS = _upper_folds()
+
+
+def _starts_sentence(c: str) -> bool:
+    """Same set as [A-Z0-9"'-]|\\p{Lu} under IGNORECASE."""
+    if c in "0123456789\"'-" or c.casefold() in _UPPER_FOLDS:
+        return True
+    # [A-Z] also folds dotless i and long s
+    upper = c.upper()
+    return len(upper) == 1 and "A" <= upper <= "Z"
+
+
+class TextNormalizer:
+    """
+    Compiled normalization engine for subtitle text.
+    Strips markup and dialogue dashes, finds sentence ends and emits lowercase
+    word tokens with stdlib `re` patterns built once at import.
+    """
+
+    _TAG_RE = re.compile(r"<[^>]+>")
+    # Dash followed by space, then a strict start dash (e.g. "- -Hej" -> "Hej")
+    _DIALOGUE_DASH_RE = re.compile(rf"(?:{_WS}*-{_WS}+)?(?:{_WS}*-{_WS}*)?")
+    # Cheap punctuation check first so abbreviation lookbehinds rarely run
+    _SENT_END_RE = re.compile(
+        r"(?<=[.!?])"
+        + "".join(rf"(?<!\b(?i:{re.escape(a)})\.)" for a in _ABBREVIATIONS)
+        + rf"{_WS}+"
+        + f"(?=[{_char_class(_starts_sentence)}])"
+    )
+    _PUNCT_RE = re.compile(f"[{_char_class(_is_punct)}]+")
+
+    def clean_line(self, text: str) -> str:
+        """
+        Removes tags and leading dialogue dashes.
+        Hyphens inside words like "semi-detached" are preserved.
+        """
+        if "<" in text:
+            text = self._TAG_RE.sub("", text)
+        return text[self._DIALOGUE_DASH_RE.match(text).end() :]
+
+    def sentence_ends(self, text: str, pos: int = 0) -> Iterator[re.Match]:
+        """
+        Yields sentence boundaries (the whitespace run after . ! ?) from pos on.
+        """
+        return self._SENT_END_RE.finditer(text, pos)
+
+    def split_sentences(self, text: str) -> List[str]:
+        return [s.strip() for s in self._SENT_END_RE.split(text) if s.strip()]
+
+    def words(self, texts: Iterable[str]) -> List[str]:
+        """
+        Lowercase alphabetic tokens of all texts, punctuation counts as space.
+        """
+        text = self._PUNCT_RE.sub(" ", " ".join(texts)).lower()
+        return [word for word in text.split() if word.isalpha()]
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import regex as re
 
+from domain.nlp.lexicon.examples import ExampleSampler
 from domain.nlp.lexicon.schema import LemmaBase, NLPToken, SentenceRec
 
+_WORD_RE = re.compile(r"\w+")
+
 
 class LangAdapter(ABC):
     code: str
@@ -31,27 +34,52 @@ class LangAdapter(ABC):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def build_form_index(lexicon: Dict[str, LemmaBase]) -> Dict[str, List[LemmaBase]]:
+        """
+        Builds inverted index: lowercase form -> lemma data owning that form.
+        Lemmas keep lexicon order, so a form shared by several lemmas is
+        attached in the same order as a full lexicon scan would.
+        Args:
+            lexicon (Dict[str, LemmaBase]): Dictionary mapping lemmas to their lemma data.
+        """
+        index: Dict[str, List[LemmaBase]] = {}
+        for lemma_data in lexicon.values():
+            for form in {form.lower() for form in lemma_data.forms}:
+                index.setdefault(form, []).append(lemma_data)
+        return index
+
     @staticmethod
     def attach_examples(
-        sentences: List[SentenceRec], lexicon: Dict[str, LemmaBase]
+        sentences: List[SentenceRec],
+        lexicon: Dict[str, LemmaBase],
+        max_examples_per_form: Optional[int] = None,
+        sampler: Optional[ExampleSampler] = None,
     ) -> Dict[str, LemmaBase]:
         """
         Associates example sentences with each inflected word found in the given sentences.
         Args:
             sentences (SentenceRec): Iterable of sentence objects containing text.
             lexicon (Dict[str, LemmaBase]): Dictionary mapping inflected words to their lemma data.
+            max_examples_per_form (Optional[int]): Keep a seeded sample of at most
+                this many examples per form. None means no cap. Ignored with sampler.
+            sampler (Optional[ExampleSampler]): Example store with cap, episode budget
+                and seed; its dropped count is readable after the call.
         Returns:
             Dict[str, LemmaBase]: Updated lexicon with example sentences attached to each inflected word.
         """
+        form_index = LangAdapter.build_form_index(lexicon)
+        if sampler is None:
+            sampler = ExampleSampler(cap=max_examples_per_form)
 
         for sentence in sentences:
-            words = re.findall(r"\w+", sentence.text)
-            for word in words:
-                word_lower = word.lower()
-                for lemma, lemma_data in lexicon.items():
-                    lower_forms_set = {form.lower() for form in lemma_data.forms}
-                    if word_lower in lower_forms_set:
-                        lemma_data.examples.setdefault(word, []).append(sentence.text)
+            for word in _WORD_RE.findall(sentence.text):
+                owners = form_index.get(word.lower())
+                if owners:
+                    sampler.offer(owners, word, sentence.text)
+        sampler.finalize()
+
+        return lexicon
 
     @staticmethod
     def finalize_lexicon(lexicon: Dict[str, LemmaBase]) -> Dict[str, LemmaBase]:
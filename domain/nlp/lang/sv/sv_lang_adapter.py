@@ -1,34 +1,111 @@
 import logging
-from typing import Dict, List
-
-import stanza
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from typing import Dict, List, Optional
 
+from core.ports import TokenCache
 from domain.nlp.lang.lang_adapter import LangAdapter, NLPToken
 from domain.nlp.lang.sv.sv_not_translatable import SV_NOT_TRANSLATABLE
 from domain.nlp.lexicon.schema import LemmaSV
 
+_PROCESSORS = "tokenize,pos,lemma"
+
+
+def _stanza_version() -> str:
+    try:
+        return version("stanza")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _init_worker(torch_threads: int) -> None:
+    """
+    Tokenizer pool initializer: split cores between workers
+    and load the Stanza pipeline once per worker process.
+    """
+    import torch
+
+    torch.set_num_threads(torch_threads)
+    SVLangAdapter._get_nlp()
+
+
+def _analyse_shard(words: List[str]) -> Dict[str, List[NLPToken]]:
+    return SVLangAdapter()._analyse(words)
+
 
 class SVLangAdapter(LangAdapter):
     _nlp_pipeline = None
+    _pool: Optional[ProcessPoolExecutor] = None
+    _pool_workers = 0
+    # Token cache key: analyses from another model/processor set are never reused
+    model_version = f"stanza-{_stanza_version()}:sv:{_PROCESSORS}"
 
     @classmethod
     def _get_nlp(cls):
         if cls._nlp_pipeline is None:
+            # Heavy (torch): imported only when tokenization actually needs it
+            import stanza
+
             logging.info("Loading Stanza Swedish pipeline (first time)...")
             cls._nlp_pipeline = stanza.Pipeline(
-                "sv", processors="tokenize,pos,lemma", tokenize_pretokenized=True
+                "sv", processors=_PROCESSORS, tokenize_pretokenized=True
             )
         return cls._nlp_pipeline
 
-    def __init__(self):
-        self.nlp = self._get_nlp()
+    @classmethod
+    def _get_pool(cls, workers: int) -> ProcessPoolExecutor:
+        """
+        Worker pool is kept for the process lifetime, so the Stanza
+        pipelines are loaded once rather than per episode.
+        """
+        if cls._pool is None or cls._pool_workers != workers:
+            if cls._pool is not None:
+                cls._pool.shutdown()
+            logging.info(f"Starting {workers} tokenizer worker processes...")
+            cls._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                # fork is unsafe once torch threads exist in the parent
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(max(1, (os.cpu_count() or 1) // workers),),
+            )
+            cls._pool_workers = workers
+        return cls._pool
+
+    def __init__(
+        self,
+        token_cache: Optional[TokenCache] = None,
+        workers: int = 1,
+        shard_size: int = 2000,
+    ):
+        """
+        Args:
+            token_cache (Optional[TokenCache]): Store consulted before Stanza.
+            workers (int): Tokenizer processes. 1 keeps tokenization in-process.
+            shard_size (int): Unique words sent to a worker per task.
+        """
+        if workers < 1 or shard_size < 1:
+            raise ValueError("workers and shard_size must be >= 1")
+        self.token_cache = token_cache
+        self.workers = workers
+        self.shard_size = shard_size
 
-    def tokenize(self, words_clean: List[str]) -> List[NLPToken]:
-        # Implement Swedish-specific tokenization logic here
-        words_clean = list(set(words_clean))  # get unique
-        doc = self.nlp([[w] for w in words_clean])
-        tokens = []
-        for sentence in doc.sentences:
+    @property
+    def nlp(self):
+        # Loaded on first cache miss only
+        return self._get_nlp()
+
+    def _analyse(self, words: List[str]) -> Dict[str, List[NLPToken]]:
+        """
+        Runs Stanza on words (one pretokenized sentence each).
+        Returns tokens per input word.
+        """
+        doc = self.nlp([[w] for w in words])
+        analysed = {}
+        for word, sentence in zip(words, doc.sentences):
+            tokens = []
             for token in sentence.words:
                 art = None
                 # Derive article
@@ -39,7 +116,6 @@ class SVLangAdapter(LangAdapter):
                         if "Gender=Com" in feats
                         else ("ett" if "Gender=Neut" in feats else None)
                     )
-                # Append token
                 tokens.append(
                     NLPToken(
                         form=token.text,
@@ -48,7 +124,54 @@ class SVLangAdapter(LangAdapter):
                         other={"artikel": art},
                     )
                 )
-        logging.info(f"Tokenized {len(words_clean)} word to {len(tokens)} tokens.")
+            analysed[word] = tokens
+        return analysed
+
+    def _analyse_parallel(self, words: List[str]) -> Dict[str, List[NLPToken]]:
+        """
+        Shards words across the worker pool.
+        Shards are merged in submission order, so output is deterministic.
+        """
+        shards = [
+            words[start : start + self.shard_size]
+            for start in range(0, len(words), self.shard_size)
+        ]
+        analysed: Dict[str, List[NLPToken]] = {}
+        for shard_result in self._get_pool(self.workers).map(_analyse_shard, shards):
+            analysed.update(shard_result)
+        return analysed
+
+    def tokenize(self, words_clean: List[str]) -> List[NLPToken]:
+        """
+        Tokenize unique words. With a token cache only cache misses are sent
+        to Stanza and their results are written back.
+        """
+        words_clean = list(dict.fromkeys(words_clean))  # get unique
+
+        cached: Dict[str, List[NLPToken]] = {}
+        if self.token_cache is not None:
+            cached = self.token_cache.get_many(self.model_version, words_clean)
+
+        misses = [w for w in words_clean if w not in cached]
+        if not misses:
+            analysed = {}
+        elif self.workers > 1 and len(misses) > self.shard_size:
+            analysed = self._analyse_parallel(misses)
+        else:
+            analysed = self._analyse(misses)
+        if self.token_cache is not None and analysed:
+            self.token_cache.put_many(self.model_version, analysed)
+
+        tokens = []
+        for word in words_clean:
+            tokens.extend(cached[word] if word in cached else analysed.get(word, []))
+
+        logging.info(
+            f"Tokenized {len(words_clean)} word to {len(tokens)} tokens "
+            f"({len(cached)} from cache, {len(misses)} analysed)."
+        )
+        if self.token_cache is not None:
+            logging.info(f"Token cache stats: {self.token_cache.stats()}")
         return tokens
 
     def build_dictionary_from_tokens(
@@ -57,38 +180,38 @@ class SVLangAdapter(LangAdapter):
         words_counted: Dict[str, int],
         not_translatable: list[str] = SV_NOT_TRANSLATABLE,
     ) -> Dict[str, LemmaSV]:
-        # Implement Swedish-specific dictionary building logic here
-        # Example: Group tokens by lemma and aggregate forms and features
-        test = 0
-        lexicon = {}
-        for token in tokens:
-            if token.lemma not in lexicon:
-                lexicon[token.lemma] = LemmaSV(
-                    pos=token.pos,
-                    forms=[],
-                    examples={},
-                    artikel=token.other.get("artikel") if token.other else None,
-                    forms_freq={},
-                    lang="sv",
-                    to_learn=token.lemma not in not_translatable,
-                )
+        """
+        Groups tokens by lemma in one pass.
+        First token of a lemma decides pos/artikel. forms_freq doubles as the
+        ordered set of forms; LemmaSV models are built once at the end.
+        """
+        total = sum(words_counted.values())
+        not_translatable = set(not_translatable)
 
-            lexicon[token.lemma].forms.append(token.form)
-
-            lexicon[token.lemma].forms_freq[token.form] = words_counted.get(
-                token.form, 0
-            )
+        first_tokens: Dict[str, NLPToken] = {}
+        forms_freq: Dict[str, Dict[str, int]] = {}
+        for token in tokens:
+            if token.lemma not in first_tokens:
+                first_tokens[token.lemma] = token
+                forms_freq[token.lemma] = {}
+            forms_freq[token.lemma][token.form] = words_counted.get(token.form, 0)
 
-            # REVIEW THIS,
-            lexicon[token.lemma].forms_cov[token.form] = (
-                words_counted.get(token.form, 0) / sum(words_counted.values())
-                if sum(words_counted.values()) > 0
-                else 0.0
+        lexicon = {}
+        for lemma, token in first_tokens.items():
+            freq = forms_freq[lemma]
+            lexicon[lemma] = LemmaSV(
+                pos=token.pos,
+                forms=list(freq),
+                examples={},
+                artikel=token.other.get("artikel") if token.other else None,
+                forms_freq=freq,
+                forms_cov={
+                    form: (count / total if total > 0 else 0.0)
+                    for form, count in freq.items()
+                },
+                lang="sv",
+                to_learn=lemma not in not_translatable,
             )
-            test += words_counted.get(token.form, 0)
-            lexicon[token.lemma].forms = list(
-                set(lexicon[token.lemma].forms)
-            )  # Ensure unique forms
 
         return lexicon
 
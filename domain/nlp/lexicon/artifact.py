@@ -0,0 +1,303 @@
+"""
+Compact binary artifact for AnalyzedEpisode.
+
+Layout (little-endian): b"SBAE" magic, u16 format version, then a zlib body:
+  - string table: lemmas, forms, POS and other labels, each stored once
+  - sentence table: every example sentence stored once
+  - lemma columns: string ids per lemma (+ to_learn flags)
+  - CSR groups: per-lemma offsets into flat columns for forms, forms_freq,
+    forms_cov and examples (example sentences are sentence-table ids)
+  - v2: example index (per-lemma flag, word count per sentence-table entry,
+    per-form CSR shortlist); example_words is rebuilt from the sentence counts
+  - v3: stats carry examples_dropped
+
+JSON stays supported: load_analysis() accepts both formats.
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, List, Literal, Optional, Tuple
+
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+
+MAGIC = b"SBAE"
+# Bump on any layout change; readers reject versions they do not know
+FORMAT_VERSION = 3
+_READABLE_VERSIONS = (1, 2, 3)
+
+AnalysisFormat = Literal["binary", "json"]
+
+_HEADER = struct.Struct("<4sH")
+_STATS = struct.Struct("<Bqqqq")
+_STATS_V2 = struct.Struct("<Bqqq")
+_NONE = 0xFFFFFFFF
+_OPTIONAL_FIELDS = ("artikel", "gender", "definite")
+_STATS_FIELDS = ("total_tokens", "total_types", "total_lemas", "examples_dropped")
+
+
+class _Interner:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def __call__(self, value: Optional[str]) -> int:
+        if value is None:
+            return _NONE
+        idx = self.ids.get(value)
+        if idx is None:
+            idx = self.ids[value] = len(self.ids)
+        return idx
+
+
+def _le(arr: array) -> array:
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+
+def _put_array(out: List[bytes], arr: array) -> None:
+    out.append(struct.pack("<I", len(arr)))
+    out.append(_le(arr).tobytes())
+
+
+def _put_strings(out: List[bytes], strings: List[str]) -> None:
+    # Lengths in characters: the reader decodes the blob once and slices it
+    _put_array(out, array("I", (len(s) for s in strings)))
+    blob = "".join(strings).encode("utf-8")
+    out.append(struct.pack("<I", len(blob)))
+    out.append(blob)
+
+
+class _Reader:
+    def __init__(self, body: bytes):
+        self.view = memoryview(body)
+        self.pos = 0
+
+    def take(self, fmt: struct.Struct) -> Tuple:
+        values = fmt.unpack_from(self.view, self.pos)
+        self.pos += fmt.size
+        return values
+
+    def array(self, typecode: str) -> array:
+        (count,) = self.take(struct.Struct("<I"))
+        arr = array(typecode)
+        end = self.pos + count * arr.itemsize
+        arr.frombytes(self.view[self.pos : end])
+        self.pos = end
+        return _le(arr)
+
+    def strings(self) -> List[str]:
+        lengths = self.array("I")
+        (size,) = self.take(struct.Struct("<I"))
+        text = str(self.view[self.pos : self.pos + size], "utf-8")
+        self.pos += size
+        out = []
+        start = 0
+        for length in lengths:
+            out.append(text[start : start + length])
+            start += length
+        return out
+
+
+def _groups(offsets: array, keys: list, values: Optional[list] = None) -> list:
+    """
+    Splits flat columns by CSR offsets: lists of keys, or dicts keys -> values.
+    """
+    offsets = offsets.tolist()
+    bounds = zip(offsets, offsets[1:])
+    if values is None:
+        return [keys[a:b] for a, b in bounds]
+    return [dict(zip(keys[a:b], values[a:b])) for a, b in bounds]
+
+
+def encode_analysis(episode: AnalyzedEpisode) -> bytes:
+    """
+    Serialize AnalyzedEpisode to the binary artifact.
+    """
+    strings = _Interner()
+    sentences = _Interner()
+    name_id = strings(episode.episode_name)
+
+    lemma_cols = {name: array("I") for name in ("lemma", "pos", "lang")}
+    optional_cols = {name: array("I") for name in _OPTIONAL_FIELDS}
+    to_learn = array("B")
+
+    forms_off, forms = array("I", [0]), array("I")
+    freq_off, freq_keys, freq_vals = array("I", [0]), array("I"), array("q")
+    cov_off, cov_keys, cov_vals = array("I", [0]), array("I"), array("d")
+    ex_off, ex_keys = array("I", [0]), array("I")
+    ex_sent_off, ex_sents = array("I", [0]), array("I")
+    indexed = array("B")
+    sentence_words: Dict[int, int] = {}
+    sl_off, sl_idx = array("I", [0]), array("I")
+
+    for lemma, data in episode.episode_data_processed.items():
+        lemma_cols["lemma"].append(strings(lemma))
+        lemma_cols["pos"].append(strings(data.pos))
+        lemma_cols["lang"].append(strings(data.lang))
+        for name in _OPTIONAL_FIELDS:
+            optional_cols[name].append(strings(getattr(data, name)))
+        to_learn.append(1 if data.to_learn else 0)
+
+        forms.extend(strings(f) for f in data.forms)
+        forms_off.append(len(forms))
+
+        for form, count in data.forms_freq.items():
+            freq_keys.append(strings(form))
+            freq_vals.append(count)
+        freq_off.append(len(freq_keys))
+
+        for form, share in data.forms_cov.items():
+            cov_keys.append(strings(form))
+            cov_vals.append(share)
+        cov_off.append(len(cov_keys))
+
+        indexed.append(1 if data.example_words else 0)
+        for form, examples in data.examples.items():
+            ex_keys.append(strings(form))
+            ids = [sentences(s) for s in examples]
+            ex_sents.extend(ids)
+            ex_sent_off.append(len(ex_sents))
+            if data.example_words:
+                sentence_words.update(zip(ids, data.example_words[form]))
+                sl_idx.extend(data.example_shortlist.get(form, []))
+            sl_off.append(len(sl_idx))
+        ex_off.append(len(ex_keys))
+
+    body: List[bytes] = []
+    _put_strings(body, list(strings.ids))
+    _put_strings(body, list(sentences.ids))
+    body.append(struct.pack("<I", name_id))
+    stats = episode.stats
+    body.append(
+        _STATS.pack(
+            1,
+            stats.total_tokens,
+            stats.total_types,
+            stats.total_lemas,
+            stats.examples_dropped,
+        )
+        if stats
+        else _STATS.pack(0, 0, 0, 0, 0)
+    )
+    for arr in (*lemma_cols.values(), *optional_cols.values()):
+        _put_array(body, arr)
+    _put_array(body, to_learn)
+    for arr in (
+        forms_off,
+        forms,
+        freq_off,
+        freq_keys,
+        freq_vals,
+        cov_off,
+        cov_keys,
+        cov_vals,
+        ex_off,
+        ex_keys,
+        ex_sent_off,
+        ex_sents,
+        indexed,
+        array("I", (sentence_words.get(i, 0) for i in range(len(sentences.ids)))),
+        sl_off,
+        sl_idx,
+    ):
+        _put_array(body, arr)
+
+    return _HEADER.pack(MAGIC, FORMAT_VERSION) + zlib.compress(b"".join(body))
+
+
+def decode_analysis(data: bytes) -> AnalyzedEpisode:
+    """
+    Deserialize the binary artifact. Plain containers are assembled column-wise
+    and validated in one pydantic call (faster than per-model construction).
+    """
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a binary analysis artifact")
+    if version not in _READABLE_VERSIONS:
+        raise ValueError(f"Unsupported analysis artifact version: {version}")
+
+    r = _Reader(zlib.decompress(memoryview(data)[_HEADER.size :]))
+    # Lemmas, forms and labels recur across analyses: share one object each
+    strings = [sys.intern(s) for s in r.strings()]
+    sentences = r.strings()
+    (name_id,) = r.take(struct.Struct("<I"))
+    if version >= 3:
+        has_stats, *stats = r.take(_STATS)
+    else:
+        has_stats, *stats = r.take(_STATS_V2) + (0,)
+
+    def labels() -> List[Optional[str]]:
+        return [None if i == _NONE else strings[i] for i in r.array("I")]
+
+    lemmas, pos, lang = labels(), labels(), labels()
+    optional = [labels() for _ in _OPTIONAL_FIELDS]
+    to_learn = [bool(flag) for flag in r.array("B")]
+    forms = _groups(r.array("I"), labels())
+    forms_freq = _groups(r.array("I"), labels(), r.array("q").tolist())
+    forms_cov = _groups(r.array("I"), labels(), r.array("d").tolist())
+    ex_off, ex_keys = r.array("I"), labels()
+    ex_sent_off, ex_sents = r.array("I"), r.array("I")
+    examples = _groups(
+        ex_off, ex_keys, _groups(ex_sent_off, [sentences[i] for i in ex_sents])
+    )
+    if version >= 2:
+        indexed = r.array("B")
+        words = r.array("I")
+        example_words = _groups(
+            ex_off, ex_keys, _groups(ex_sent_off, [words[i] for i in ex_sents])
+        )
+        example_shortlist = _groups(
+            ex_off, ex_keys, _groups(r.array("I"), r.array("I").tolist())
+        )
+    else:
+        indexed = array("B", bytes(len(lemmas)))
+
+    lexicon = {}
+    for i, lemma in enumerate(lemmas):
+        entry = {
+            "pos": pos[i],
+            "forms": forms[i],
+            "examples": examples[i],
+            "forms_freq": forms_freq[i],
+            "forms_cov": forms_cov[i],
+            "to_learn": to_learn[i],
+            "lang": lang[i],
+        }
+        for name, values in zip(_OPTIONAL_FIELDS, optional):
+            entry[name] = values[i]
+        if indexed[i]:
+            entry["example_words"] = example_words[i]
+            entry["example_shortlist"] = example_shortlist[i]
+        lexicon[lemma] = entry
+
+    return AnalyzedEpisode.model_validate(
+        {
+            "episode_name": strings[name_id],
+            "episode_data_processed": lexicon,
+            "stats": dict(zip(_STATS_FIELDS, stats)) if has_stats else None,
+        }
+    )
+
+
+def dump_analysis(
+    episode: AnalyzedEpisode, fmt: AnalysisFormat = "binary"
+) -> bytes:
+    """
+    Serialize analysis results for storage in the chosen format.
+    """
+    if fmt == "binary":
+        return encode_analysis(episode)
+    if fmt == "json":
+        return episode.model_dump_json().encode("utf-8")
+    raise ValueError(f"Unknown analysis format: {fmt}")
+
+
+def load_analysis(data: bytes) -> AnalyzedEpisode:
+    """
+    Parse stored analysis results, binary artifact or legacy JSON.
+    """
+    if bytes(data[: len(MAGIC)]) == MAGIC:
+        return decode_analysis(data)
+    return AnalyzedEpisode.model_validate_json(data)
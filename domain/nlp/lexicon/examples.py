@@ -0,0 +1,166 @@
+import heapq
+import random
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from common.constants import EXAMPLE_SHORTLIST_SIZE, MAX_EXAMPLES_PER_FORM
+from domain.nlp.lexicon.schema import LemmaBase
+
+_PUNCT_RE = re.compile(r"[^\w\s]+")
+
+
+def word_count(sentence: str) -> int:
+    return len(sentence.split())
+
+
+def example_shortlist(
+    counts: Sequence[int], size: int = EXAMPLE_SHORTLIST_SIZE
+) -> List[int]:
+    """
+    Indices of the first multi-word examples, in example order. Deck builds try
+    these before scanning all examples of a form.
+    """
+    out = []
+    for i, count in enumerate(counts):
+        if count > 1:
+            out.append(i)
+            if len(out) == size:
+                break
+    return out
+
+
+def index_examples(
+    lexicon: Dict[str, LemmaBase], size: int = EXAMPLE_SHORTLIST_SIZE
+) -> Dict[str, LemmaBase]:
+    """
+    Precompute word counts and the shortlist for every example of every form.
+    Examples never change after analysis, so deck builds only read these.
+    Args:
+        lexicon (Dict[str, LemmaBase]): Lexicon with examples attached.
+        size (int): Shortlist length per form.
+    """
+    counted: Dict[str, int] = {}
+    for lemma_data in lexicon.values():
+        for form, examples in lemma_data.examples.items():
+            counts = []
+            for sentence in examples:
+                count = counted.get(sentence)
+                if count is None:
+                    count = counted[sentence] = word_count(sentence)
+                counts.append(count)
+            lemma_data.example_words[form] = counts
+            lemma_data.example_shortlist[form] = example_shortlist(counts, size)
+    return lexicon
+
+
+def near_duplicate_key(sentence: str) -> str:
+    """
+    Lines equal up to case, punctuation and spacing count as near-duplicates
+    (subtitles repeat lines with different punctuation or casing).
+    """
+    return " ".join(_PUNCT_RE.sub(" ", sentence.casefold()).split())
+
+
+class _Reservoir:
+    def __init__(self):
+        # Max-heap on priority: (-priority, seq, sentence)
+        self.heap: List[Tuple[float, int, str]] = []
+        self.seen = set()
+
+
+class ExampleSampler:
+    """
+    Bounded example store used by attach_examples.
+    Per form: a seeded reservoir keeping the cap occurrences with the lowest
+    random priority (a uniform sample of the stream). With a cap or budget,
+    near-duplicates of earlier lines are skipped so they do not use up the
+    sample; without either, every occurrence is kept as before. finalize()
+    then shrinks the per-form cap until the episode fits the total budget
+    (every form keeps at least one example) and writes the kept sentences in
+    stream order.
+    Args:
+        cap (Optional[int]): Max examples per form. None means no cap.
+        budget (Optional[int]): Max examples per episode. None means no budget.
+        seed (int): Same seed and input give the same sample.
+    """
+
+    def __init__(
+        self,
+        cap: Optional[int] = MAX_EXAMPLES_PER_FORM,
+        budget: Optional[int] = None,
+        seed: int = 0,
+    ):
+        if cap is not None and cap < 1:
+            raise ValueError("cap must be >= 1")
+        self.cap = cap
+        self.budget = budget
+        self.dedupe = cap is not None or budget is not None
+        self.rng = random.Random(seed)
+        self.offered = 0
+        self.dropped = 0
+        self._seq = 0
+        self._forms: Dict[Tuple[int, str], Tuple[LemmaBase, str, _Reservoir]] = {}
+
+    def offer(self, owners: Sequence[LemmaBase], form: str, sentence: str) -> None:
+        """
+        One occurrence of form in sentence, for every lemma owning the form.
+        """
+        priority = self.rng.random()
+        self._seq += 1
+        dup_key = near_duplicate_key(sentence) if self.dedupe else None
+        for lemma_data in owners:
+            key = (id(lemma_data), form)
+            entry = self._forms.get(key)
+            if entry is None:
+                entry = self._forms[key] = (lemma_data, form, _Reservoir())
+                # Keeps first-occurrence order of forms in examples
+                lemma_data.examples.setdefault(form, [])
+            reservoir = entry[2]
+            self.offered += 1
+            if dup_key is not None:
+                if dup_key in reservoir.seen:
+                    continue
+                reservoir.seen.add(dup_key)
+            item = (-priority, self._seq, sentence)
+            if self.cap is None or len(reservoir.heap) < self.cap:
+                heapq.heappush(reservoir.heap, item)
+            elif item > reservoir.heap[0]:
+                heapq.heapreplace(reservoir.heap, item)
+
+    def _budget_cap(self, sizes: List[int]) -> Optional[int]:
+        """
+        Largest per-form cap (>= 1) under which the episode fits the budget.
+        """
+        if self.budget is None or sum(sizes) <= self.budget:
+            return None
+        lo, hi = 1, max(sizes)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if sum(min(size, mid) for size in sizes) <= self.budget:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def finalize(self) -> int:
+        """
+        Write the sampled examples into the lexicon. Returns dropped count.
+        """
+        entries = list(self._forms.values())
+        cap = self._budget_cap([len(r.heap) for _, _, r in entries])
+        kept = 0
+        for lemma_data, form, reservoir in entries:
+            items = reservoir.heap
+            if cap is not None and len(items) > cap:
+                items = heapq.nlargest(cap, items)
+            items = sorted(items, key=lambda item: item[1])
+            lemma_data.examples[form].extend(sentence for _, _, sentence in items)
+            kept += len(items)
+        self._forms = {}
+        self.dropped += self.offered - kept
+        self.offered = 0
+        return self.dropped
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,121 @@
+from typing import Iterable, List
+
+import numpy as np
+
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.vocab.vocabulary import Vocabulary
+
+DEFAULT_LANG = "sv"
+
+
+class LexiconIndex:
+    """
+    Columns of an analysis lexicon, in lexicon order: vocabulary ids of
+    lemmas (-1 when not in the vocabulary), POS codes, per-lemma freq /
+    coverage totals and the unique forms per lemma (CSR). Built once per
+    analysis; lemma and form strings are the analysis' own objects and only
+    copied into lists for the rows a caller keeps (see lemmas / forms).
+    """
+
+    def __init__(
+        self,
+        lang: str,
+        lemma_ids: np.ndarray,
+        pos_labels: List[str],
+        pos_codes: np.ndarray,
+        freq: np.ndarray,
+        cov: np.ndarray,
+        form_offsets: np.ndarray,
+        lemma_values: List[str],
+        form_values: List[str],
+    ):
+        self.lang = lang
+        self.lemma_ids = lemma_ids
+        self.pos_labels = pos_labels
+        self.pos_codes = pos_codes
+        self.freq = freq
+        self.cov = cov
+        self.form_offsets = form_offsets
+        self.lemma_values = lemma_values
+        self.form_values = form_values
+
+    @classmethod
+    def build(
+        cls,
+        analyzed_episode: AnalyzedEpisode,
+        vocabulary: Vocabulary,
+        create: bool = False,
+    ) -> "LexiconIndex":
+        """
+        Index an analysis. Lemma ids are looked up read-only unless create
+        (analysis workers register new lemmas); lemmas the vocabulary does not
+        have get -1, which no known-lemma bitset contains.
+        """
+        lexicon = analyzed_episode.episode_data_processed
+        lang = next((data.lang for data in lexicon.values()), DEFAULT_LANG)
+
+        pos_labels: dict = {}
+        pos_codes, freq, cov, form_offsets, forms = [], [], [], [0], []
+        for data in lexicon.values():
+            pos_codes.append(pos_labels.setdefault(data.pos, len(pos_labels)))
+            freq.append(sum(data.forms_freq.values()))
+            cov.append(sum(data.forms_cov.values()))
+            forms.extend(dict.fromkeys(data.forms))
+            form_offsets.append(len(forms))
+
+        return cls(
+            lang,
+            vocabulary.ids(lang, "lemma", lexicon, create=create),
+            list(pos_labels),
+            np.array(pos_codes, np.int32),
+            np.array(freq, np.int64),
+            np.array(cov, np.float64),
+            np.array(form_offsets, np.int64),
+            list(lexicon),
+            forms,
+        )
+
+    def __len__(self) -> int:
+        return len(self.lemma_ids)
+
+    def pos_mask(self, allowed: Iterable[str]) -> np.ndarray:
+        """
+        Rows whose POS is in allowed (all rows when allowed is empty).
+        """
+        allowed = set(allowed)
+        if not allowed:
+            return np.ones(len(self), bool)
+        codes = [i for i, label in enumerate(self.pos_labels) if label in allowed]
+        return np.isin(self.pos_codes, codes)
+
+    def lemmas(self, rows: np.ndarray) -> List[str]:
+        values = self.lemma_values
+        return [values[i] for i in rows.tolist()]
+
+    def forms(self, rows: np.ndarray) -> List[List[str]]:
+        """
+        Unique forms per row (analysis order).
+        """
+        values, offsets = self.form_values, self.form_offsets
+        return [
+            values[a:b]
+            for a, b in zip(offsets[rows].tolist(), offsets[rows + 1].tolist())
+        ]
+
+    def nbytes(self) -> int:
+        # String objects belong to the analysis; the lists hold pointers
+        pointers = 8 * (len(self.lemma_values) + len(self.form_values))
+        return pointers + sum(
+            arr.nbytes
+            for arr in (
+                self.lemma_ids,
+                self.pos_codes,
+                self.freq,
+                self.cov,
+                self.form_offsets,
+            )
+        )
+
+
+if __name__ == "__main__":
+    pass
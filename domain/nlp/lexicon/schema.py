@@ -30,6 +30,10 @@ class LemmaBase(BaseModel):
         default_factory=dict
     )  # per-form coverage share (0..1)
     to_learn: bool = Field(default=True)
+    # Filled at analysis time (empty for older analyses): word count per
+    # example and indices of the first multi-word examples, per form
+    example_words: Dict[str, List[int]] = Field(default_factory=dict)
+    example_shortlist: Dict[str, List[int]] = Field(default_factory=dict)
 
 
 class LemmaSV(LemmaBase):
@@ -46,6 +50,8 @@ class Stats(BaseModel):
     total_tokens: int
     total_types: int
     total_lemas: int
+    # Example occurrences not stored: over the caps or near-duplicate lines
+    examples_dropped: int = 0
 
 
 class AnalyzedEpisode(BaseModel):
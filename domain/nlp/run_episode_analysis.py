@@ -1,8 +1,11 @@
 import logging
 import time
+from typing import Optional
 
+from common.constants import MAX_EXAMPLES_PER_EPISODE, MAX_EXAMPLES_PER_FORM
 from domain.nlp.content.content_adapter import ContentAdapter
 from domain.nlp.lang.lang_adapter import LangAdapter
+from domain.nlp.lexicon.examples import ExampleSampler, index_examples
 from domain.nlp.lexicon.schema import AnalyzedEpisode, Stats
 
 logger = logging.getLogger(__name__)
@@ -13,7 +16,13 @@ def _t():
 
 
 def process_episode(
-    file_bytes, adapter: ContentAdapter, lang_adapter: LangAdapter, episode_name: str
+    file_bytes,
+    adapter: ContentAdapter,
+    lang_adapter: LangAdapter,
+    episode_name: str,
+    max_examples_per_form: Optional[int] = MAX_EXAMPLES_PER_FORM,
+    max_examples_per_episode: Optional[int] = MAX_EXAMPLES_PER_EPISODE,
+    example_seed: int = 0,
 ) -> AnalyzedEpisode:
     t0 = _t()
 
@@ -40,10 +49,18 @@ def process_episode(
     lexicon = lang_adapter.build_dictionary_from_tokens(tokens, words_counted)
     logging.info("Built lexicon with %d lemmas (%.3fs)", len(lexicon), _t() - t3)
 
-    # 5) examples (cap per lemma inside the method)
+    # 5) examples (seeded sample per form, capped per form and per episode)
     t4 = _t()
-    lang_adapter.attach_examples(sentences, lexicon)
-    logging.info("Attached examples (%.3fs)", _t() - t4)
+    sampler = ExampleSampler(
+        max_examples_per_form, max_examples_per_episode, example_seed
+    )
+    lang_adapter.attach_examples(sentences, lexicon, sampler=sampler)
+    index_examples(lexicon)
+    logging.info(
+        "Attached and indexed examples, dropped %d (%.3fs)",
+        sampler.dropped,
+        _t() - t4,
+    )
 
     # 6) finalize
     t5 = _t()
@@ -55,6 +72,7 @@ def process_episode(
             total_tokens=sum(words_counted.values()),
             total_types=len(words_counted),
             total_lemas=len(lexicon),
+            examples_dropped=sampler.dropped,
         ),
     )
 
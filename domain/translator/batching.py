@@ -0,0 +1,63 @@
+import logging
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BatchLimits(BaseModel):
+    """
+    Per-request limits of a translation backend. None disables a limit.
+    """
+
+    max_items: Optional[int] = Field(default=50, ge=1)
+    max_chars: Optional[int] = Field(default=None, ge=1)
+    max_bytes: Optional[int] = Field(default=None, ge=1)
+
+
+def pack_batches(texts: List[str], limits: BatchLimits) -> List[List[int]]:
+    """
+    Group texts into request batches (lists of indices, input order kept)
+    so that each batch stays within the item, character and UTF-8 byte
+    budgets. A single text over a budget gets a batch of its own.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    chars = size = 0
+    for i, text in enumerate(texts):
+        n_chars, n_bytes = len(text), len(text.encode("utf-8"))
+        fits = (
+            (limits.max_items is None or len(current) < limits.max_items)
+            and (limits.max_chars is None or chars + n_chars <= limits.max_chars)
+            and (limits.max_bytes is None or size + n_bytes <= limits.max_bytes)
+        )
+        if current and not fits:
+            batches.append(current)
+            current, chars, size = [], 0, 0
+        if (limits.max_chars is not None and n_chars > limits.max_chars) or (
+            limits.max_bytes is not None and n_bytes > limits.max_bytes
+        ):
+            logging.warning(f"Text of {n_chars} chars exceeds the batch budget")
+        current.append(i)
+        chars += n_chars
+        size += n_bytes
+    if current:
+        batches.append(current)
+    return batches
+
+
+def batch_sizes(texts: List[str], batches: List[List[int]]) -> List[Dict[str, int]]:
+    """
+    Items, characters and UTF-8 bytes of every batch.
+    """
+    return [
+        {
+            "items": len(batch),
+            "chars": sum(len(texts[i]) for i in batch),
+            "bytes": sum(len(texts[i].encode("utf-8")) for i in batch),
+        }
+        for batch in batches
+    ]
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,82 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import List, Optional
+
+from domain.translator.batching import BatchLimits
+from domain.translator.translator import TooManyRequestsError
+
+
+class FakeTranslator:
+    """
+    Local stand-in for the DeepL backend (tests, benchmarks).
+    Echoes inputs, so <i> tags survive, after a simulated latency (fixed part
+    + jitter + per character of the request). Answers 429 like the real
+    service when more than max_rps requests arrived in the last second, or
+    more than max_concurrent are in flight, and at random with throttle_rate.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        latency_per_char: float = 0.0,
+        max_rps: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+        batch_limits: Optional[BatchLimits] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.latency_per_char = latency_per_char
+        self.batch_limits = batch_limits or BatchLimits()
+        self.max_rps = max_rps
+        self.max_concurrent = max_concurrent
+        self.throttle_rate = throttle_rate
+        self.calls = 0
+        self.throttled = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.batches: List[List[str]] = []
+        self._rng = random.Random(seed)
+        self._recent: deque = deque()
+        self._lock = threading.Lock()
+
+    def _admit(self) -> bool:
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] >= 1.0:
+            self._recent.popleft()
+        if self.max_rps is not None and len(self._recent) >= self.max_rps:
+            return False
+        if self.max_concurrent is not None and self.in_flight >= self.max_concurrent:
+            return False
+        if self._rng.random() < self.throttle_rate:
+            return False
+        self._recent.append(now)
+        return True
+
+    def translate(
+        self, text: list[str], target_lang: str, source_lang: str
+    ) -> list[str]:
+        with self._lock:
+            self.calls += 1
+            if not self._admit():
+                self.throttled += 1
+                raise TooManyRequestsError("Too many requests (fake)")
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self.batches.append(list(text))
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            delay += self.latency_per_char * sum(len(t) for t in text)
+        try:
+            time.sleep(delay)
+            return list(text)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+if __name__ == "__main__":
+    pass
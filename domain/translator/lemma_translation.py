@@ -0,0 +1,231 @@
+import hashlib
+import json
+import logging
+import os
+import unicodedata
+from typing import Dict, Optional, Tuple
+
+from core.ports import DeckIO, FailedTranslationIO
+from domain.deck.schemas.schema import Candidate
+from domain.translator.batching import BatchLimits, pack_batches
+from domain.translator.scheduler import TranslationScheduler
+from domain.translator.translation import (
+    default_scheduler,
+    get_chunked,
+    tag_first,
+    translate_selection,
+)
+from domain.translator.translator import TRANS_VERSION, Translator
+
+# POS whose gloss rarely depends on the sentence (UPOS tags)
+LEMMA_TRANSLATION_POS = frozenset(
+    pos
+    for pos in os.getenv("LEMMA_TRANSLATION_POS", "NOUN,ADJ,NUM,PROPN").split(",")
+    if pos
+)
+
+
+def _create_id_tier_cache(image: Dict[str, Optional[str]]) -> str:
+    image = {**image, "translation_ver": TRANS_VERSION}
+    return hashlib.sha256(
+        json.dumps(
+            image, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        ).encode(encoding="utf-8")
+    ).hexdigest()
+
+
+def _create_id_lemma_cache(
+    form: str, pos: str, source_lang_tag: str, target_lang_tag: str
+) -> str:
+    """
+    Cache id of the context-free translation of form as pos. The "tier"
+    field keeps these ids apart from the sentence-tagged ones.
+    """
+    return _create_id_tier_cache(
+        {
+            "tier": "lemma",
+            "word": unicodedata.normalize("NFKC", form.strip()),
+            "pos": pos,
+            "source_lang_tag": source_lang_tag,
+            "target_lang_tag": target_lang_tag,
+        }
+    )
+
+
+def _create_id_sentence_cache(
+    sentence: str, source_lang_tag: str, target_lang_tag: str
+) -> str:
+    """
+    Cache id of the plain (untagged) translation of a sentence.
+    """
+    return _create_id_tier_cache(
+        {
+            "tier": "sentence",
+            "sentence": unicodedata.normalize("NFKC", " ".join(sentence.split())),
+            "source_lang_tag": source_lang_tag,
+            "target_lang_tag": target_lang_tag,
+        }
+    )
+
+
+def uses_lemma_tier(candidate: Candidate) -> bool:
+    return candidate.pos in LEMMA_TRANSLATION_POS
+
+
+def translate_lemmas(
+    selection: list[Candidate],
+    translator: Translator,
+    deck_io: DeckIO,
+    scheduler: Optional[TranslationScheduler] = None,
+    with_sentences: bool = True,
+    stats: Optional[dict] = None,
+    failures: Optional[FailedTranslationIO] = None,
+) -> Tuple[list[Candidate], list[Candidate]]:
+    """
+    Context-free translation tier. The gloss of every (form, POS, language
+    pair) is translated alone once and then reused from the translation cache
+    for any sentence the form shows up in. With with_sentences, example
+    sentences are translated untagged (cached per sentence) and the gloss is
+    tagged in them where it occurs; without, cards get no sentence translation
+    and no sentence is sent at all. Candidates whose gloss does not occur in
+    the sentence translation (e.g. inflected there) go through
+    translate_selection instead, with its repair pass and failures store;
+    its translation_* counts are added to those already in stats, and the
+    texts this tier sent for them count as wasted.
+    Returns (selection, candidates without a gloss) like translate_selection.
+    """
+    if not selection:
+        return [], []
+
+    source_lang_tag = selection[0].source_lang_tag
+    target_lang_tag = selection[0].target_lang_tag
+    word_ids = [
+        _create_id_lemma_cache(
+            c.form_original_lang, c.pos, source_lang_tag, target_lang_tag
+        )
+        for c in selection
+    ]
+    sentence_ids = [
+        _create_id_sentence_cache(
+            c.sentence_original_lang, source_lang_tag, target_lang_tag
+        )
+        if with_sentences
+        else None
+        for c in selection
+    ]
+    ids = list(dict.fromkeys(word_ids + [i for i in sentence_ids if i]))
+    cached = get_chunked(deck_io.get_cached, ids)
+
+    # Distinct texts to translate, by cache id
+    missing: Dict[str, Tuple[str, Candidate]] = {}
+    for c, word_id, sentence_id in zip(selection, word_ids, sentence_ids):
+        if word_id not in cached:
+            missing.setdefault(word_id, ("word", c))
+        if sentence_id and sentence_id not in cached:
+            missing.setdefault(sentence_id, ("sentence", c))
+    missing_ids = list(missing)
+    texts = [
+        c.form_original_lang if kind == "word" else c.sentence_original_lang
+        for kind, c in missing.values()
+    ]
+
+    translated: Dict[str, str] = {}
+    if texts:
+        scheduler = scheduler or default_scheduler(translator)
+        limits = getattr(translator, "batch_limits", None) or BatchLimits()
+        batches = pack_batches(texts, limits)
+        results = scheduler.run(
+            [[texts[i] for i in batch] for batch in batches],
+            target_lang=target_lang_tag,
+            source_lang=source_lang_tag,
+        )
+        order = [missing_ids[i] for batch in batches for i in batch]
+        outputs = (t for res in results for t in res)
+        translated = {
+            cache_id: (
+                output.strip().strip(".,!?;:")
+                if missing[cache_id][0] == "word"
+                else output
+            )
+            for cache_id, output in zip(order, outputs)
+        }
+
+    entries_to_cache = []
+    for cache_id, output in translated.items():
+        kind, c = missing[cache_id]
+        word = output if kind == "word" else ""
+        if kind == "word" and not word:
+            continue
+        entries_to_cache.append(
+            {
+                "id": cache_id,
+                "form_org_lang": c.form_original_lang if kind == "word" else "",
+                "sentence_org_lang": "" if kind == "word" else c.sentence_original_lang,
+                "word_target_lang": word,
+                "sentence_target_lang": "" if kind == "word" else output,
+                "org_lang": source_lang_tag,
+                "target_lang": target_lang_tag,
+            }
+        )
+    if entries_to_cache:
+        try:
+            deck_io.upsert_cache_translation(entries_to_cache)
+        except Exception as e:
+            logging.warning(f"Failed to batch cache translations: {e}")
+
+    not_translated, untagged = [], []
+    # Cache ids of the tagged candidates / of the ones handed to the fallback
+    kept_ids, untagged_ids = set(), set()
+    for c, word_id, sentence_id in zip(selection, word_ids, sentence_ids):
+        row = cached.get(word_id)
+        word = row["word_target_lang"] if row else translated.get(word_id, "")
+        sentence = None
+        if sentence_id:
+            row = cached.get(sentence_id)
+            sentence = row["sentence_target_lang"] if row else translated[sentence_id]
+            if word:
+                tagged = tag_first(sentence, word)
+                if tagged == sentence:
+                    untagged.append(c)
+                    untagged_ids.update((word_id, sentence_id))
+                    continue
+                sentence = tagged
+        kept_ids.update((word_id, sentence_id))
+        c.translated_word = word
+        c.translated_example = sentence
+        if not word:
+            not_translated.append(c)
+
+    fallback_stats: dict = {}
+    if untagged:
+        _, failed = translate_selection(
+            untagged,
+            translator,
+            deck_io,
+            scheduler=scheduler,
+            failures=failures,
+            stats=fallback_stats,
+        )
+        not_translated += failed
+        # Texts sent above only for candidates that then went to the fallback
+        fallback_stats["translation_wasted_calls"] += len(
+            (untagged_ids - kept_ids) & translated.keys()
+        )
+
+    logging.info(
+        f"Lemma tier: {len(selection)} candidates, {len(cached)} of {len(ids)}"
+        f" cache ids hit, {len(texts)} texts translated"
+    )
+    if stats is not None:
+        stats["lemma_tier_candidates"] = len(selection)
+        stats["lemma_tier_cache_hits"] = sum(i in cached for i in word_ids)
+        stats["lemma_tier_chars"] = sum(len(t) for t in texts)
+        stats["lemma_tier_untagged"] = len(untagged)
+        # Added to the sentence tier's counts of the same deck build
+        for key, value in fallback_stats.items():
+            stats[key] = stats.get(key, 0) + value
+    return selection, not_translated
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,219 @@
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from domain.translator.translator import TooManyRequestsError, Translator
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: rate tokens per second, up to burst stored.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be > 0 and burst >= 1")
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(burst)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, waiting for it if needed. Returns the time waited.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            self.sleep(wait)
+            waited += wait
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit: halved on every throttle, raised by one after
+    `limit` consecutive successes, always within [1, max_limit].
+    """
+
+    def __init__(self, max_limit: int, initial: Optional[int] = None):
+        if max_limit < 1:
+            raise ValueError("max_limit must be >= 1")
+        self.max_limit = max_limit
+        self.limit = min(max_limit, initial or max_limit)
+        self.in_flight = 0
+        self.peak = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def release(self, throttled: bool) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+def backoff_delay(
+    attempt: int, base: float, cap: float, rng: random.Random
+) -> float:
+    """
+    Exponential backoff with equal jitter: half fixed, half random, so
+    throttled workers do not retry in lockstep.
+    """
+    delay = min(cap, base * (2**attempt))
+    return delay / 2 + rng.uniform(0, delay / 2)
+
+
+class TranslationScheduler:
+    """
+    Runs translation batches concurrently behind a token-bucket rate limit
+    and an adaptive concurrency limit; throttled batches are retried with
+    jittered exponential backoff. Results come back in batch order.
+    Args:
+        translator (Translator): Backend; translate() must be thread-safe.
+        max_workers (int): Upper bound on concurrent requests.
+        rate (float): Requests per second allowed by the token bucket.
+        burst (int): Requests that may start back to back.
+        max_retries (int): Retries per batch after a 429 before giving up.
+        base_delay (float): First backoff delay in seconds.
+        max_delay (float): Backoff cap in seconds.
+    """
+
+    def __init__(
+        self,
+        translator: Translator,
+        max_workers: int = 4,
+        rate: float = 5.0,
+        burst: int = 1,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        seed: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.translator = translator
+        self.max_workers = max_workers
+        self.bucket = TokenBucket(rate, burst, sleep=sleep)
+        self.limiter = AdaptiveLimiter(max_workers)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "throttled": 0, "backoff_s": 0.0, "chars": 0}
+        self._latencies: List[float] = []
+
+    def _count(self, key: str, value=1) -> None:
+        with self._lock:
+            self._stats[key] += value
+
+    def _run_batch(self, texts: List[str], target_lang: str, source_lang: str):
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            throttled = False
+            try:
+                self.bucket.acquire()
+                self._count("requests")
+                t0 = time.perf_counter()
+                res = self.translator.translate(
+                    texts, target_lang=target_lang, source_lang=source_lang
+                )
+                with self._lock:
+                    self._latencies.append(time.perf_counter() - t0)
+                    self._stats["chars"] += sum(len(t) for t in texts)
+                return res
+            except TooManyRequestsError:
+                throttled = True
+                self._count("throttled")
+                if attempt == self.max_retries:
+                    raise
+            finally:
+                self.limiter.release(throttled)
+            with self._lock:
+                delay = backoff_delay(
+                    attempt, self.base_delay, self.max_delay, self._rng
+                )
+            logging.warning(
+                f"Translation throttled, retry {attempt + 1} in {delay:.2f}s"
+            )
+            self._count("backoff_s", delay)
+            self.sleep(delay)
+
+    def run(
+        self, batches: List[List[str]], target_lang: str, source_lang: str
+    ) -> List[List[str]]:
+        """
+        Translate all batches; the i-th result belongs to the i-th batch.
+        The first failing batch cancels the ones not started yet and raises.
+        """
+        if not batches:
+            return []
+        workers = min(self.max_workers, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self._run_batch, batch, target_lang, source_lang)
+                for batch in batches
+            ]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Counters (chars = characters sent in successful requests, as billed)
+        plus latency of successful requests (p50 / p95 / max, s).
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            out = {
+                **self._stats,
+                "concurrency_limit": self.limiter.limit,
+                "peak_concurrency": self.limiter.peak,
+            }
+        if latencies:
+            out["latency_p50_s"] = latencies[len(latencies) // 2]
+            out["latency_p95_s"] = latencies[int(len(latencies) * 0.95)]
+            out["latency_max_s"] = latencies[-1]
+        return out
+
+
+if __name__ == "__main__":
+    pass
@@ -1,19 +1,49 @@
 import hashlib
 import json
 import logging
+import os
 import re
 import time
 import unicodedata
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import deepl
-
-from core.ports import DeckIO
+from core.ports import DeckIO, FailedTranslationIO
 from domain.deck.schemas.schema import Candidate
+from domain.translator.batching import BatchLimits, batch_sizes, pack_batches
+from domain.translator.scheduler import TranslationScheduler
 from domain.translator.translator import TRANS_VERSION, Translator
 
 SEP_FIND = re.compile(r"[\r\n\x85\u2028\u2029]")
 
+# Concurrent translation requests, request rate and retries on HTTP 429
+TRANSLATE_WORKERS = int(os.getenv("TRANSLATE_WORKERS", "4"))
+TRANSLATE_RATE_PER_S = float(os.getenv("TRANSLATE_RATE_PER_S", "5"))
+# Requests allowed back to back; above 1 a burst can overshoot a per-second limit
+TRANSLATE_BURST = int(os.getenv("TRANSLATE_BURST", "1"))
+TRANSLATE_MAX_RETRIES = int(os.getenv("TRANSLATE_MAX_RETRIES", "5"))
+# Ids per cache lookup request and lookup requests in flight
+CACHE_LOOKUP_CHUNK = int(os.getenv("CACHE_LOOKUP_CHUNK", "100"))
+CACHE_LOOKUP_WORKERS = int(os.getenv("CACHE_LOOKUP_WORKERS", "4"))
+# Translate a sentence shared by several candidates once, with one tag per term
+TRANSLATE_GROUP_SENTENCES = os.getenv("TRANSLATE_GROUP_SENTENCES", "1") == "1"
+
+# Failed translations are skipped for TRANSLATION_FAILURE_SKIP_S, doubled per
+# failed attempt up to TRANSLATION_FAILURE_MAX_SKIP_S
+TRANSLATION_FAILURE_SKIP_S = float(os.getenv("TRANSLATION_FAILURE_SKIP_S", "86400"))
+TRANSLATION_FAILURE_MAX_SKIP_S = float(
+    os.getenv("TRANSLATION_FAILURE_MAX_SKIP_S", "2592000")
+)
+# Second pass over failures: term and sentence translated separately
+TRANSLATE_REPAIR = os.getenv("TRANSLATE_REPAIR", "1") == "1"
+
+ID_TAG_FIND = re.compile(r"<i id=[\"'](\d+)[\"']>(.*?)</i>", flags=re.DOTALL)
+
+# Text to translate and the candidates it serves, as (tag id, candidate);
+# tag id None means the text carries the candidate's plain <i> tag
+TranslationUnit = Tuple[str, List[Tuple[Optional[int], Candidate]]]
+
 
 def _create_id_translation_cache(
     word: str,
@@ -61,6 +91,92 @@ def _create_id_translation_cache(
     ).hexdigest()
 
 
+def _encode_column(values: List[str], kind: str) -> List[str]:
+    """
+    Validated, normalized JSON string literals of values, as in
+    _create_id_translation_cache; every distinct value is processed once.
+    """
+    encoded = {}
+    for value in dict.fromkeys(values):
+        if SEP_FIND.search(value):
+            raise ValueError(f"CR/LF characters/lines break found in {kind}!")
+        if kind == "word":
+            cleaned = unicodedata.normalize("NFKC", value.strip())
+        else:
+            cleaned = unicodedata.normalize("NFKC", " ".join(value.split()))
+        if not cleaned:
+            raise ValueError(f"Incorrect {kind}")
+        encoded[value] = encode_basestring(cleaned)
+    return [encoded[value] for value in values]
+
+
+def _cache_keys(
+    candidates: list[Candidate], translation_ver: str = TRANS_VERSION
+) -> list[str]:
+    """
+    Cache ids of many candidates, equal to _create_id_translation_cache but
+    built column-wise: each distinct word / sentence / language is validated,
+    normalized and JSON-encoded once. Keys of TRANS_VERSION are stored on the
+    candidates (cache_key) and reused on later calls until the form, the
+    sentence or a language tag is reassigned (see Candidate); keys of other
+    versions are computed on every call.
+    """
+    if not translation_ver:
+        raise ValueError("Incorrect version")
+    memo = translation_ver == TRANS_VERSION
+    keys = [c.cache_key if memo else None for c in candidates]
+    pending = [c for c, key in zip(candidates, keys) if key is None]
+    if pending:
+        sentences = _encode_column(
+            [c.sentence_original_lang for c in pending], "sentence"
+        )
+        words = _encode_column([c.form_original_lang for c in pending], "word")
+        langs = {
+            tag: "null" if tag is None else encode_basestring(tag)
+            for c in pending
+            for tag in (c.source_lang_tag, c.target_lang_tag)
+        }
+        ver = encode_basestring(translation_ver)
+        computed = {}
+        for c, sentence, word in zip(pending, sentences, words):
+            # Same bytes as json.dumps(image, sort_keys=True, separators=(",", ":"))
+            image = (
+                f'{{"sentence":{sentence},'
+                f'"source_lang_tag":{langs[c.source_lang_tag]},'
+                f'"target_lang_tag":{langs[c.target_lang_tag]},'
+                f'"translation_ver":{ver},"word":{word}}}'
+            )
+            computed[id(c)] = hashlib.sha256(image.encode("utf-8")).hexdigest()
+            if memo:
+                c.cache_key = computed[id(c)]
+        keys = [computed.get(id(c), key) for c, key in zip(candidates, keys)]
+    return keys
+
+
+def get_chunked(
+    get: Callable[[List[str]], Dict[str, Any]],
+    keys: List[str],
+    max_workers: int = CACHE_LOOKUP_WORKERS,
+) -> Dict[str, Any]:
+    """
+    get() over CACHE_LOOKUP_CHUNK-key chunks, at most max_workers at a time,
+    merged in chunk order.
+    """
+    chunks = [
+        keys[start : start + CACHE_LOOKUP_CHUNK]
+        for start in range(0, len(keys), CACHE_LOOKUP_CHUNK)
+    ]
+    if len(chunks) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+            results = list(pool.map(get, chunks))
+    else:
+        results = [get(chunk) for chunk in chunks]
+    merged = {}
+    for found in results:
+        merged.update(found)
+    return merged
+
+
 def _look_up_translation_from_cache(
     candidates_to_check: list[Candidate],
     deck_io: DeckIO,
@@ -68,63 +184,127 @@ def _look_up_translation_from_cache(
     """
     Function returns the candidates that matched cache
     """
-    ids = []
-    for candidate in candidates_to_check:
-        cache_id = _create_id_translation_cache(
-            candidate.form_original_lang,
-            candidate.sentence_original_lang,
-            candidate.source_lang_tag,
-            candidate.target_lang_tag,
-        )
-        ids.append(cache_id)
+    return deck_io.get_cached(_cache_keys(candidates_to_check))
 
-    res = deck_io.get_cached(ids)
 
-    return res
-
-
-def _find_cached_translation_batch(
+def find_cached_translation_batch(
     selection: list[Candidate],
     deck_io: DeckIO,
+    max_workers: int = CACHE_LOOKUP_WORKERS,
 ) -> Tuple[list[Candidate], list[Candidate]]:
     """
     Function mutates the candidates that matched cache
+    Keys are computed once; chunks of CACHE_LOOKUP_CHUNK ids are looked up
+    concurrently (at most max_workers at a time) and merged in order.
     """
-    n = len(selection)
-    batch = 100
+    keys = _cache_keys(selection)
+    res = get_chunked(deck_io.get_cached, keys, max_workers)
+
     to_translate = []
     cached_translation = []
-
-    for start in range(0, n, batch):
-        end = min(start + batch, n)
-        candidates_to_check = selection[start:end]
-        res = _look_up_translation_from_cache(candidates_to_check, deck_io)
-
-        for candidate in candidates_to_check:
-            cache_id = _create_id_translation_cache(
-                candidate.form_original_lang,
-                candidate.sentence_original_lang,
-                candidate.source_lang_tag,
-                candidate.target_lang_tag,
-            )
-            cached_candidate = res.get(cache_id, None)
-            if cached_candidate:
-                candidate.translated_word = cached_candidate["word_target_lang"]
-                candidate.translated_example = cached_candidate["sentence_target_lang"]
-                cached_translation.append(candidate)
-            else:
-                to_translate.append(candidate)
+    for candidate, cache_id in zip(selection, keys):
+        cached_candidate = res.get(cache_id, None)
+        if cached_candidate:
+            candidate.translated_word = cached_candidate["word_target_lang"]
+            candidate.translated_example = cached_candidate["sentence_target_lang"]
+            cached_translation.append(candidate)
+        else:
+            to_translate.append(candidate)
 
     return cached_translation, to_translate
 
 
-def _tag_first(s, target):
+def tag_first(s, target):
+    """
+    Wrap the first match of target in s in <i> tags; s is returned unchanged
+    if target does not occur in it.
+    """
     # case-insensitive, whole-word; preserves original casing in the sentence
     pattern = re.compile(rf"\b{re.escape(target)}\b", flags=re.IGNORECASE)
     s = pattern.sub(lambda m: "<i>" + m.group(0) + "</i>", s, count=1)
     return s
 
 
+def _tag_terms(s: str, targets: List[str]) -> Tuple[str, List[int]]:
+    """
+    Wrap the first match of every target in <i id="k">, k being its index in
+    targets; matching as in tag_first. Targets without a match, or whose
+    match overlaps an earlier target's, are left untagged.
+    Returns the tagged sentence and the indices of the tagged targets.
+    """
+    spans = []
+    for k, target in enumerate(targets):
+        m = re.search(rf"\b{re.escape(target)}\b", s, flags=re.IGNORECASE)
+        if m and all(m.end() <= a or m.start() >= b for a, b, _ in spans):
+            spans.append((m.start(), m.end(), k))
+    spans.sort()
+    parts, pos = [], 0
+    for a, b, k in spans:
+        parts += [s[pos:a], f'<i id="{k}">', s[a:b], "</i>"]
+        pos = b
+    parts.append(s[pos:])
+    return "".join(parts), sorted(k for _, _, k in spans)
+
+
+def _select_term(target_text: str, tag_id: int) -> Optional[str]:
+    """
+    One term's view of a multi-term translation: its id tag becomes the plain
+    <i> tag, the other terms lose theirs. None if its tag was lost or is empty.
+    """
+    found = False
+
+    def keep(m: re.Match) -> str:
+        nonlocal found
+        if not found and int(m.group(1)) == tag_id and m.group(2).strip():
+            found = True
+            return f"<i>{m.group(2)}</i>"
+        return m.group(2)
+
+    res = ID_TAG_FIND.sub(keep, target_text)
+    return res if found else None
+
+
+def _translation_units(
+    candidates: list[Candidate], group_sentences: bool
+) -> List[TranslationUnit]:
+    """
+    One unit per text to send, in candidate order. With group_sentences, the
+    candidates sharing a sentence are tagged together in one text; the ones
+    that cannot be tagged there get their own one-term text.
+    """
+    shared: dict = {}
+    if group_sentences:
+        for candidate in candidates:
+            shared.setdefault(candidate.sentence_original_lang, []).append(
+                candidate
+            )
+
+    units: List[TranslationUnit] = []
+    done = set()
+    for candidate in candidates:
+        sentence = candidate.sentence_original_lang
+        group = shared.get(sentence, [])
+        if len(group) < 2:
+            one = tag_first(sentence, candidate.form_original_lang)
+            units.append((one, [(None, candidate)]))
+            continue
+        if sentence in done:
+            continue
+        done.add(sentence)
+        text, tagged = _tag_terms(sentence, [c.form_original_lang for c in group])
+        if len(tagged) > 1:
+            units.append((text, [(k, group[k]) for k in tagged]))
+        for k, member in enumerate(group):
+            if len(tagged) < 2 or k not in tagged:
+                one = tag_first(sentence, member.form_original_lang)
+                units.append((one, [(None, member)]))
+
+    for text, members in units:
+        for _, member in members:
+            member.translation_input = text
+    return units
+
+
 def _extract_term(target_text: str) -> str:
     a, b = target_text.find("<i>"), target_text.find("</i>")
     if a != -1 and b != -1 and b > a:
@@ -139,17 +319,12 @@ def _prepare_cache_entry(
     Returns a dict entry for translation cache table.
     Expects candidate to have translated_word and translated_example populated.
     """
-    if not candidate.translated_word:
+    if not (candidate.translated_word or "").strip():
         raise ValueError(
             f"Candidate with empty translation: {candidate.form_original_lang}"
         )
 
-    cache_id = _create_id_translation_cache(
-        candidate.form_original_lang,
-        candidate.sentence_original_lang,
-        candidate.source_lang_tag,
-        candidate.target_lang_tag,
-    )
+    (cache_id,) = _cache_keys([candidate])
 
     return {
         "id": cache_id,
@@ -169,98 +344,328 @@ def _is_valid_translation(sentence: str) -> bool:
         return True
 
 
+def _apply_translations(
+    candidate_group: list[Candidate],
+    res: list[str],
+    deck_io: DeckIO,
+    not_translated_correctly: list[Candidate],
+) -> None:
+    """
+    Write one batch of translations onto its candidates and cache the valid ones.
+    """
+    entries_to_cache = []
+    for candidate, translated_example in zip(candidate_group, res):
+        candidate.translation_output = translated_example
+
+        if not _is_valid_translation(translated_example):
+            logging.warning(
+                "Translation missing tags or empty: input=%r, output=%r",
+                candidate.translation_input,
+                translated_example,
+            )
+            not_translated_correctly.append(candidate)
+
+            candidate.translated_example = translated_example
+            candidate.translated_word = _extract_term(translated_example)
+            continue
+
+        candidate.translated_example = translated_example
+        candidate.translated_word = _extract_term(translated_example)
+
+        try:
+            entries_to_cache.append(_prepare_cache_entry(candidate))
+        except ValueError as e:
+            logging.error(f"Failed to prepare cache entry: {e}")
+
+    if entries_to_cache:
+        try:
+            deck_io.upsert_cache_translation(entries_to_cache)
+        except Exception as e:
+            logging.warning(f"Failed to batch cache translations: {e}")
+
+
+def _translate_units(
+    units: List[TranslationUnit],
+    translator: Translator,
+    scheduler: TranslationScheduler,
+    deck_io: DeckIO,
+    target_lang_tag: str,
+    source_lang_tag: str,
+    not_translated_correctly: list[Candidate],
+) -> list[Candidate]:
+    """
+    Pack the units' texts by the backend's item / character / byte budgets,
+    run them through the scheduler and apply the results batch by batch.
+    Returns the candidates whose id tag was lost in a multi-term translation.
+    """
+    texts = [text for text, _ in units]
+    limits = getattr(translator, "batch_limits", None) or BatchLimits()
+    batches = pack_batches(texts, limits)
+    sizes = batch_sizes(texts, batches)
+    if sizes:
+        logging.info(
+            f"Packed {len(texts)} texts into {len(sizes)} batches"
+            f" (max {max(s['items'] for s in sizes)} items,"
+            f" {max(s['chars'] for s in sizes)} chars,"
+            f" {max(s['bytes'] for s in sizes)} bytes): {sizes}"
+        )
+
+    results = scheduler.run(
+        [[texts[i] for i in batch] for batch in batches],
+        target_lang=target_lang_tag,
+        source_lang=source_lang_tag,
+    )
+
+    lost = []
+    for batch, res in zip(batches, results):
+        if res is None:
+            raise Exception("Failed to translate: result is None")
+        candidate_group, outputs = [], []
+        for i, translated in zip(batch, res):
+            for tag_id, candidate in units[i][1]:
+                if tag_id is not None:
+                    translated_one = _select_term(translated, tag_id)
+                    if translated_one is None:
+                        lost.append(candidate)
+                        continue
+                    candidate_group.append(candidate)
+                    outputs.append(translated_one)
+                else:
+                    candidate_group.append(candidate)
+                    outputs.append(translated)
+        _apply_translations(candidate_group, outputs, deck_io, not_translated_correctly)
+    return lost
+
+
+def default_scheduler(translator: Translator) -> TranslationScheduler:
+    return TranslationScheduler(
+        translator,
+        max_workers=TRANSLATE_WORKERS,
+        rate=TRANSLATE_RATE_PER_S,
+        burst=TRANSLATE_BURST,
+        max_retries=TRANSLATE_MAX_RETRIES,
+    )
+
+
+def _skip_known_failures(
+    candidates: list[Candidate], failures: FailedTranslationIO, now: float
+) -> Tuple[list[Candidate], list[Candidate], Dict[str, Dict[str, Any]]]:
+    """
+    Split off candidates that failed before and are still in their skip
+    window; they get the recorded output, as after a failed translation.
+    Returns (to translate, skipped, failure records by cache id).
+    """
+    try:
+        records = get_chunked(failures.get_failed, _cache_keys(candidates))
+    except Exception as e:
+        logging.warning(f"Failed to read failed translations: {e}")
+        return candidates, [], {}
+
+    to_translate, skipped = [], []
+    for candidate in candidates:
+        record = records.get(candidate.cache_key)
+        if record and float(record["retry_after"]) > now:
+            candidate.translation_output = record.get("translation_output") or ""
+            candidate.translated_example = candidate.translation_output
+            candidate.translated_word = _extract_term(candidate.translation_output)
+            skipped.append(candidate)
+        else:
+            to_translate.append(candidate)
+    return to_translate, skipped, records
+
+
+def _repair_translations(
+    failed: list[Candidate],
+    translator: Translator,
+    scheduler: TranslationScheduler,
+    deck_io: DeckIO,
+    target_lang_tag: str,
+    source_lang_tag: str,
+) -> Tuple[list[Candidate], list[Candidate]]:
+    """
+    Second chance for failed candidates, all in one scheduler run: the term
+    and the untagged sentence are translated separately and the term's
+    translation is then tagged in the translated sentence.
+    Returns (repaired, still failed); repaired ones are cached.
+    """
+    texts = []
+    for candidate in failed:
+        texts += [candidate.form_original_lang, candidate.sentence_original_lang]
+    limits = getattr(translator, "batch_limits", None) or BatchLimits()
+    batches = pack_batches(texts, limits)
+    results = scheduler.run(
+        [[texts[i] for i in batch] for batch in batches],
+        target_lang=target_lang_tag,
+        source_lang=source_lang_tag,
+    )
+    outputs = [translated for res in results for translated in res]
+
+    repaired, still_failed, entries_to_cache = [], [], []
+    for k, candidate in enumerate(failed):
+        word = outputs[2 * k].strip().strip(".,!?;:")
+        sentence = outputs[2 * k + 1]
+        tagged = tag_first(sentence, word) if word else sentence
+        if not _is_valid_translation(tagged):
+            still_failed.append(candidate)
+            continue
+        update = {
+            "translation_output": tagged,
+            "translated_example": tagged,
+            "translated_word": _extract_term(tagged),
+        }
+        try:
+            entry = _prepare_cache_entry(candidate.model_copy(update=update))
+        except ValueError as e:
+            logging.error(f"Failed to prepare cache entry: {e}")
+            still_failed.append(candidate)
+            continue
+        for field, value in update.items():
+            setattr(candidate, field, value)
+        entries_to_cache.append(entry)
+        repaired.append(candidate)
+
+    if entries_to_cache:
+        try:
+            deck_io.upsert_cache_translation(entries_to_cache)
+        except Exception as e:
+            logging.warning(f"Failed to batch cache translations: {e}")
+    return repaired, still_failed
+
+
+def _record_failures(
+    failed: list[Candidate],
+    records: Dict[str, Dict[str, Any]],
+    failures: FailedTranslationIO,
+    now: float,
+) -> None:
+    """
+    Store failed outputs; the skip window doubles with every failed attempt.
+    """
+    entries = []
+    for candidate in failed:
+        record = records.get(candidate.cache_key) or {}
+        attempts = int(record.get("attempts") or 0) + 1
+        window = TRANSLATION_FAILURE_SKIP_S * 2 ** (attempts - 1)
+        entries.append(
+            {
+                "id": candidate.cache_key,
+                "translation_input": candidate.translation_input,
+                "translation_output": candidate.translation_output,
+                "attempts": attempts,
+                "retry_after": now + min(window, TRANSLATION_FAILURE_MAX_SKIP_S),
+            }
+        )
+    try:
+        failures.record_failed(entries)
+    except Exception as e:
+        logging.warning(f"Failed to record failed translations: {e}")
+
+
 def translate_selection(
     selection: list[Candidate],
     translator: Translator,
     deck_io: DeckIO,
+    scheduler: Optional[TranslationScheduler] = None,
+    group_sentences: Optional[bool] = None,
+    failures: Optional[FailedTranslationIO] = None,
+    repair: Optional[bool] = None,
+    stats: Optional[dict] = None,
 ) -> Tuple[list[Candidate], list[Candidate]]:
     """
     Translate the selected candidates using the provided translator.
     Cache key: word: str, sentence: str, source_lang:str, target_lang:str
+    Batches run concurrently through the scheduler (rate limited, retried on
+    429); results are applied and cached in the original batch order.
+    With group_sentences (default TRANSLATE_GROUP_SENTENCES) a sentence shared
+    by several candidates is sent once with an id tag per term; candidates
+    whose tag does not survive are retried with the one-term tag.
+    Candidates still failing get one repair pass (default TRANSLATE_REPAIR,
+    see _repair_translations). With a failures store, failures are recorded
+    and skipped while their retry window is open. Counts are written to
+    stats: translation_wasted_calls (texts sent whose output was discarded),
+    translation_repaired and translation_skipped_failed.
     """
 
     if not selection:
         return [], []
 
-    BULK_TRANSLATION = 40
+    if group_sentences is None:
+        group_sentences = TRANSLATE_GROUP_SENTENCES
+    if repair is None:
+        repair = TRANSLATE_REPAIR
+    now = time.time()
 
-    candidates_cached, candidates_to_translate = _find_cached_translation_batch(
+    candidates_cached, candidates_to_translate = find_cached_translation_batch(
         selection, deck_io
     )
     logging.info(f"Cached {len(candidates_cached)} candidates")
     logging.info(f"To translate {len(candidates_to_translate)} candidates")
 
-    number_to_translate = len(candidates_to_translate)
     # In the future translation should bucket candidates with the same languages.
     # Now languages are inferred from the first candidate.
 
     target_lang_tag = selection[0].target_lang_tag
     source_lang_tag = selection[0].source_lang_tag
 
-    not_translated_correctly = []
-
-    for start in range(0, number_to_translate, BULK_TRANSLATION):
-        end = min(start + BULK_TRANSLATION, number_to_translate)
-        candidate_group = candidates_to_translate[start:end]
-
-        sentences_to_translate = []
-        for candidate in candidate_group:
-            translation_input = _tag_first(
-                candidate.sentence_original_lang, candidate.form_original_lang
-            )
-            candidate.translation_input = translation_input
-            sentences_to_translate.append(translation_input)
-
-        res = None
-        for attempt in range(2):
-            try:
-                res = translator.translate(
-                    sentences_to_translate,
-                    target_lang=target_lang_tag,
-                    source_lang=source_lang_tag,
-                )
-                print(
-                    f"DEBUG: Batch {start}-{end}, inputs: {len(sentences_to_translate)}, res: {type(res)} len: {len(res) if hasattr(res, '__len__') else 'N/A'}"
-                )
-                break  # Success
-
-            except deepl.TooManyRequestsException:
-                if attempt == 1:
-                    raise
-                logging.warning("Too many requests to DeepL, waiting 3s...")
-                time.sleep(3)
-
-        if res is None:
-            raise Exception("Failed to translate: result is None")
-
-        entries_to_cache = []
-        for candidate, translated_example in zip(candidate_group, res):
-            candidate.translation_output = translated_example
-
-            if not _is_valid_translation(translated_example):
-                logging.warning(
-                    "Translation missing tags or empty: input=%r, output=%r",
-                    candidate.translation_input,
-                    translated_example,
-                )
-                not_translated_correctly.append(candidate)
+    if scheduler is None:
+        scheduler = default_scheduler(translator)
 
-                candidate.translated_example = translated_example
-                candidate.translated_word = _extract_term(translated_example)
-                continue
+    skipped, records = [], {}
+    if failures is not None and candidates_to_translate:
+        to_translate, skipped, records = _skip_known_failures(
+            candidates_to_translate, failures, now
+        )
+        logging.info(f"Skipped {len(skipped)} candidates that failed before")
+    else:
+        to_translate = candidates_to_translate
 
-            candidate.translated_example = translated_example
-            candidate.translated_word = _extract_term(translated_example)
+    not_translated_correctly = []
+    units = _translation_units(to_translate, group_sentences)
+    lost = _translate_units(
+        units,
+        translator,
+        scheduler,
+        deck_io,
+        target_lang_tag,
+        source_lang_tag,
+        not_translated_correctly,
+    )
+    if lost:
+        logging.info(f"Retrying {len(lost)} candidates with one-term tags")
+        _translate_units(
+            _translation_units(lost, group_sentences=False),
+            translator,
+            scheduler,
+            deck_io,
+            target_lang_tag,
+            source_lang_tag,
+            not_translated_correctly,
+        )
+    wasted = len(lost) + len(not_translated_correctly)
+
+    repaired = []
+    if repair and not_translated_correctly:
+        repaired, not_translated_correctly = _repair_translations(
+            not_translated_correctly,
+            translator,
+            scheduler,
+            deck_io,
+            target_lang_tag,
+            source_lang_tag,
+        )
+        logging.info(f"Repaired {len(repaired)} failed translations")
+        wasted += 2 * len(not_translated_correctly)
+    if failures is not None and not_translated_correctly:
+        _record_failures(not_translated_correctly, records, failures, now)
+    logging.info(f"Translation scheduler stats: {scheduler.stats()}")
 
-            try:
-                entries_to_cache.append(_prepare_cache_entry(candidate))
-            except ValueError as e:
-                logging.error(f"Failed to prepare cache entry: {e}")
+    if stats is not None:
+        stats["translation_wasted_calls"] = wasted
+        stats["translation_repaired"] = len(repaired)
+        stats["translation_skipped_failed"] = len(skipped)
 
-        if entries_to_cache:
-            try:
-                deck_io.upsert_cache_translation(entries_to_cache)
-            except Exception as e:
-                logging.warning(f"Failed to batch cache translations: {e}")
     logging.info("Not translated correctly: %r", len(not_translated_correctly))
-    return candidates_cached + candidates_to_translate, not_translated_correctly
+    return (
+        candidates_cached + candidates_to_translate,
+        not_translated_correctly + skipped,
+    )
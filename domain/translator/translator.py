@@ -1,27 +1,52 @@
 import os
 
-import deepl
 from dotenv import load_dotenv
 
+from domain.translator.batching import BatchLimits
+
 load_dotenv()
 TRANS_VERSION = "DEEPL:2025-09"
 DEEPL_AUTH_KEY = os.getenv("DEEPL_AUTH_KEY")
+# DeepL: at most 50 texts and 128 KiB per request; chars keep batches even
+DEEPL_BATCH_MAX_ITEMS = int(os.getenv("DEEPL_BATCH_MAX_ITEMS", "50"))
+DEEPL_BATCH_MAX_CHARS = int(os.getenv("DEEPL_BATCH_MAX_CHARS", "5000"))
+DEEPL_BATCH_MAX_BYTES = int(os.getenv("DEEPL_BATCH_MAX_BYTES", "100000"))
+
+
+class TooManyRequestsError(Exception):
+    """
+    Translation backend throttled the request (HTTP 429).
+    Backend independent, so callers do not need to import the DeepL SDK.
+    """
 
 
 class Translator:
     def __init__(self):
+        # DeepL SDK is imported only when a translator is actually built
+        import deepl
+
         self.translator = deepl.Translator(DEEPL_AUTH_KEY)
+        self.batch_limits = BatchLimits(
+            max_items=DEEPL_BATCH_MAX_ITEMS,
+            max_chars=DEEPL_BATCH_MAX_CHARS,
+            max_bytes=DEEPL_BATCH_MAX_BYTES,
+        )
 
     def translate(
         self, text: list[str], target_lang: str, source_lang: str
     ) -> list[str]:
-        result = self.translator.translate_text(
-            text,
-            target_lang=target_lang,
-            source_lang=source_lang,
-            tag_handling="xml",
-            # outline_detection=True,
-        )
+        import deepl
+
+        try:
+            result = self.translator.translate_text(
+                text,
+                target_lang=target_lang,
+                source_lang=source_lang,
+                tag_handling="xml",
+                # outline_detection=True,
+            )
+        except deepl.TooManyRequestsException as e:
+            raise TooManyRequestsError(str(e)) from e
 
         if isinstance(result, list):
             return [r.text for r in result]
@@ -0,0 +1,63 @@
+from typing import Iterable
+
+import numpy as np
+
+
+class LemmaBitset:
+    """
+    Set of lemma ids stored as a little-endian bit array (bit i = id i).
+    50k known lemmas fit in ~6 KB; membership of many ids at once is one
+    vectorized gather.
+    """
+
+    def __init__(self, bits: np.ndarray = None):
+        self.bits = np.zeros(0, np.uint8) if bits is None else bits
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LemmaBitset":
+        return cls(np.frombuffer(data, np.uint8).copy())
+
+    def to_bytes(self) -> bytes:
+        return np.trim_zeros(self.bits, "b").tobytes()
+
+    @staticmethod
+    def _as_ids(ids: Iterable[int]) -> np.ndarray:
+        ids = np.fromiter(ids, np.int64)
+        if (ids < 0).any():
+            raise ValueError("Lemma ids must be >= 0")
+        return ids
+
+    def add(self, ids: Iterable[int]) -> None:
+        ids = self._as_ids(ids)
+        if not len(ids):
+            return
+        size = int(ids.max()) // 8 + 1
+        if size > len(self.bits):
+            self.bits = np.concatenate(
+                [self.bits, np.zeros(size - len(self.bits), np.uint8)]
+            )
+        np.bitwise_or.at(self.bits, ids >> 3, (1 << (ids & 7)).astype(np.uint8))
+
+    def remove(self, ids: Iterable[int]) -> None:
+        ids = self._as_ids(ids)
+        ids = ids[ids < len(self.bits) * 8]
+        np.bitwise_and.at(
+            self.bits, ids >> 3, (~(1 << (ids & 7))).astype(np.uint8)
+        )
+
+    def contains(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Boolean mask over ids; negative (unknown) ids are never members.
+        """
+        ids = np.asarray(ids, np.int64)
+        out = np.zeros(len(ids), bool)
+        in_range = (ids >= 0) & (ids < len(self.bits) * 8)
+        sel = ids[in_range]
+        out[in_range] = (self.bits[sel >> 3] >> (sel & 7)) & 1
+        return out
+
+    def ids(self) -> np.ndarray:
+        return np.flatnonzero(np.unpackbits(self.bits, bitorder="little"))
+
+    def __len__(self) -> int:
+        return int(np.unpackbits(self.bits).sum())
@@ -0,0 +1,78 @@
+import hashlib
+from typing import Iterable, List
+
+import numpy as np
+
+from core.ports import KnownLemmaIO
+from domain.vocab.bitset import LemmaBitset
+from domain.vocab.vocabulary import Vocabulary
+
+
+class KnownLemmas:
+    """
+    A user's known lemmas as a bitset over the ids of a vocabulary.
+    """
+
+    def __init__(self, bitset: LemmaBitset, vocabulary: Vocabulary):
+        self.bitset = bitset
+        self.vocabulary = vocabulary
+        self.digest = hashlib.sha1(bitset.to_bytes()).hexdigest()
+
+    def mask(self, lemma_ids: np.ndarray) -> np.ndarray:
+        """
+        Boolean mask of known lemmas (bitset intersection over vocabulary ids).
+        Ids of -1 (not in the vocabulary) were never marked known.
+        """
+        return self.bitset.contains(lemma_ids)
+
+
+class KnownVocabularyStore:
+    """
+    Per-user known-lemma sets, persisted as bitsets over the lemma ids of a
+    vocabulary.
+    """
+
+    def __init__(self, io: KnownLemmaIO, vocabulary: Vocabulary):
+        self.io = io
+        self.vocabulary = vocabulary
+
+    def lemma_ids(
+        self, lang: str, lemmas: Iterable[str], create: bool = False
+    ) -> np.ndarray:
+        ids = self.vocabulary.ids(lang, "lemma", lemmas, create=create)
+        return ids[ids >= 0]
+
+    def get(self, user_id: str, lang: str) -> LemmaBitset:
+        data = self.io.load_known(user_id, lang)
+        return LemmaBitset.from_bytes(data) if data else LemmaBitset()
+
+    def _save(self, user_id: str, lang: str, bitset: LemmaBitset) -> int:
+        count = len(bitset)
+        self.io.save_known(user_id, lang, bitset.to_bytes(), count)
+        return count
+
+    def add(self, user_id: str, lang: str, lemmas: Iterable[str]) -> int:
+        """
+        Mark lemmas known. Returns the user's known-lemma count.
+        """
+        bitset = self.get(user_id, lang)
+        bitset.add(self.lemma_ids(lang, lemmas, create=True))
+        return self._save(user_id, lang, bitset)
+
+    def remove(self, user_id: str, lang: str, lemmas: Iterable[str]) -> int:
+        bitset = self.get(user_id, lang)
+        bitset.remove(self.lemma_ids(lang, lemmas))
+        return self._save(user_id, lang, bitset)
+
+    def list_lemmas(self, user_id: str, lang: str) -> List[str]:
+        return self.vocabulary.values(lang, "lemma", self.get(user_id, lang).ids())
+
+    def known_lemmas(self, user_id: str, lang: str) -> KnownLemmas:
+        """
+        Filter for select_candidates.
+        """
+        return KnownLemmas(self.get(user_id, lang), self.vocabulary)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,119 @@
+import threading
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
+
+import numpy as np
+
+from core.ports import VocabularyIO
+
+VocabularyKind = Literal["lemma"]
+
+
+class _Table:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.values: Dict[int, str] = {}
+
+    def add(self, mapping: Dict[str, int]) -> None:
+        for value, idx in mapping.items():
+            self.ids[value] = idx
+            self.values[idx] = value
+
+
+class Vocabulary:
+    """
+    Interns (lang, lemma) strings to stable integer ids.
+    With io the ids are the persisted vocabulary ids (identical in every
+    process); without it they are assigned locally from 0.
+    Ids never change once assigned, so both directions are cached in process.
+    With io, a table over max_entries is cleared (its ids are re-read on
+    demand); local ids cannot be re-read and are never dropped.
+    """
+
+    def __init__(
+        self, io: Optional[VocabularyIO] = None, max_entries: Optional[int] = None
+    ):
+        self.io = io
+        self.max_entries = max_entries
+        self._tables: Dict[Tuple[str, str], _Table] = {}
+        self._lock = threading.Lock()
+        self.resets = 0
+
+    def _add(self, table: _Table, mapping: Dict[str, int]) -> None:
+        # Caller holds self._lock
+        if (
+            self.io is not None
+            and self.max_entries is not None
+            and len(table.ids) + len(mapping) > self.max_entries
+        ):
+            table.ids.clear()
+            table.values.clear()
+            self.resets += 1
+        table.add(mapping)
+
+    def _table(self, lang: str, kind: VocabularyKind) -> _Table:
+        with self._lock:
+            return self._tables.setdefault((lang, kind), _Table())
+
+    def ids(
+        self,
+        lang: str,
+        kind: VocabularyKind,
+        values: Iterable[str],
+        create: bool = False,
+    ) -> np.ndarray:
+        """
+        Ids of values (int64, input order). Unknown values are -1 unless create.
+        """
+        values = list(values)
+        table = self._table(lang, kind)
+        with self._lock:
+            found = {v: table.ids[v] for v in dict.fromkeys(values) if v in table.ids}
+        missing = [v for v in dict.fromkeys(values) if v not in found]
+        if missing:
+            if self.io is None:
+                if create:
+                    with self._lock:
+                        fresh = [v for v in missing if v not in table.ids]
+                        start = len(table.ids)
+                        table.add(dict(zip(fresh, range(start, start + len(fresh)))))
+                        found.update({v: table.ids[v] for v in missing})
+            else:
+                fetched = (
+                    self.io.create_ids(lang, kind, missing)
+                    if create
+                    else self.io.get_ids(lang, kind, missing)
+                )
+                with self._lock:
+                    self._add(table, fetched)
+                found.update(fetched)
+        get = found.get
+        return np.fromiter((get(v, -1) for v in values), np.int64, len(values))
+
+    def values(self, lang: str, kind: VocabularyKind, ids: Iterable[int]) -> List[str]:
+        """
+        Strings of ids (the interned objects). Raises KeyError for unknown ids.
+        """
+        ids = [int(i) for i in ids]
+        table = self._table(lang, kind)
+        with self._lock:
+            found = {
+                i: table.values[i] for i in dict.fromkeys(ids) if i in table.values
+            }
+        missing = [i for i in dict.fromkeys(ids) if i not in found]
+        if missing and self.io is not None:
+            fetched = self.io.get_values(lang, kind, missing)
+            with self._lock:
+                self._add(table, {value: idx for idx, value in fetched.items()})
+            found.update(fetched)
+        return [found[i] for i in ids]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                f"{lang}/{kind}": len(table.ids)
+                for (lang, kind), table in self._tables.items()
+            }
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,166 @@
+import hashlib
+import math
+import os
+import struct
+import threading
+import time
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+MAGIC = b"SBBF"
+FORMAT_VERSION = 2
+# magic, format, bits, hashes, count, capacity, fp_rate, built_at, watermark,
+# version length
+_HEADER = struct.Struct("<4sHQHQQdddH")
+
+
+class BloomFilter:
+    """
+    Thread-safe Bloom filter over string keys: no false negatives, false
+    positives at about fp_rate while count <= capacity. Sized from
+    (capacity, fp_rate); k positions per key come from one 128-bit blake2b
+    digest (double hashing). Carries a version label and its build time so
+    snapshots of another version (or too old) can be rejected, and a
+    watermark: the store's last write time the filter is known to cover.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        fp_rate: float,
+        version: str = "",
+        built_at: Optional[float] = None,
+        watermark: float = 0.0,
+    ):
+        if capacity < 1 or not 0 < fp_rate < 1:
+            raise ValueError("capacity must be >= 1 and 0 < fp_rate < 1")
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.version = version
+        self.built_at = time.time() if built_at is None else built_at
+        self.watermark = watermark
+        n_bits = math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)
+        self.n_bits = max(64, -(-n_bits // 64) * 64)
+        self.n_hashes = max(1, round(self.n_bits / capacity * math.log(2)))
+        self.bits = np.zeros(self.n_bits // 8, np.uint8)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _positions(self, keys: List[str]) -> np.ndarray:
+        digests = b"".join(
+            hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+            for key in keys
+        )
+        halves = np.frombuffer(digests, "<u8").reshape(-1, 2)
+        h1, h2 = halves[:, :1], halves[:, 1:] | np.uint64(1)
+        steps = np.arange(self.n_hashes, dtype=np.uint64)
+        # uint64 wrap-around is fine here, it is still a hash
+        return (h1 + steps * h2) % np.uint64(self.n_bits)
+
+    @staticmethod
+    def _split(pos: np.ndarray):
+        return pos >> np.uint64(3), (pos & np.uint64(7)).astype(np.uint8)
+
+    def add(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if not keys:
+            return
+        byte, bit = self._split(self._positions(keys).ravel())
+        with self._lock:
+            np.bitwise_or.at(self.bits, byte, np.left_shift(np.uint8(1), bit))
+            self.count += len(keys)
+
+    def contains(self, keys: List[str]) -> np.ndarray:
+        """
+        Boolean mask over keys: False means definitely absent.
+        """
+        if not keys:
+            return np.zeros(0, bool)
+        byte, bit = self._split(self._positions(keys))
+        with self._lock:
+            hit = (self.bits[byte] >> bit) & 1
+        return hit.all(axis=1)
+
+    def to_bytes(self) -> bytes:
+        version = self.version.encode("utf-8")
+        with self._lock:
+            header = _HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                self.n_bits,
+                self.n_hashes,
+                self.count,
+                self.capacity,
+                self.fp_rate,
+                self.built_at,
+                self.watermark,
+                len(version),
+            )
+            return header + version + self.bits.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        (
+            magic,
+            fmt,
+            n_bits,
+            n_hashes,
+            count,
+            capacity,
+            fp_rate,
+            built_at,
+            watermark,
+            version_len,
+        ) = _HEADER.unpack_from(data)
+        if magic != MAGIC or fmt != FORMAT_VERSION:
+            raise ValueError("Not a Bloom filter snapshot of this format")
+        offset = _HEADER.size + version_len
+        bits = np.frombuffer(data, np.uint8, offset=offset).copy()
+        if len(bits) * 8 != n_bits:
+            raise ValueError("Truncated Bloom filter snapshot")
+        bloom = cls(
+            capacity,
+            fp_rate,
+            data[_HEADER.size : offset].decode("utf-8"),
+            built_at,
+            watermark,
+        )
+        bloom.n_bits, bloom.n_hashes, bloom.bits, bloom.count = (
+            n_bits,
+            n_hashes,
+            bits,
+            count,
+        )
+        return bloom
+
+    def save(self, path: str) -> None:
+        """
+        Write a snapshot atomically, so readers never see a partial file.
+        """
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(self.to_bytes())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def stats(self) -> dict:
+        k, m = self.n_hashes, self.n_bits
+        return {
+            "count": self.count,
+            "capacity": self.capacity,
+            "bytes": len(self.bits),
+            "hashes": k,
+            # Expected false positive rate at the current count
+            "fp_rate": (1 - math.exp(-k * self.count / m)) ** k,
+        }
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,165 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """
+    Thread-safe in-process LRU with TTL and a size budget.
+    Each value is weighed once on insert (sizeof); least recently used entries
+    are evicted until both max_entries and max_size hold.
+    get_or_load is single-flight: concurrent misses on one key run the loader
+    once and the other callers wait for its result.
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_size: int,
+        ttl: float,
+        sizeof: Callable[[V], int] = lambda value: 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries (int): Entry count limit.
+            max_size (int): Limit on the summed sizeof() of entries.
+            ttl (float): Seconds an entry stays valid after it was loaded.
+            sizeof (Callable): Weight of a value (e.g. estimated bytes).
+            clock (Callable): Time source, monotonic seconds.
+        """
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        # key -> (value, size, expires_at)
+        self._entries: OrderedDict[Hashable, Tuple[V, int, float]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._loading: Dict[Hashable, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_errors = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Optional[V]]:
+        # Caller holds self._lock
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, size, expires_at = entry
+        if self.clock() >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        size = self.sizeof(value)
+        with self._lock:
+            self._insert(key, value, size)
+
+    def _insert(self, key: Hashable, value: V, size: int) -> None:
+        # Caller holds self._lock
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_size:
+            # Would evict everything else and still not fit
+            return
+        self._entries[key] = (value, size, self.clock() + self.ttl)
+        self._size += size
+        while len(self._entries) > self.max_entries or self._size > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], V]) -> V:
+        """
+        Return the cached value or load, cache and return it.
+        A failed load raises in its caller; the next waiter retries it.
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                self.hits += 1
+                return value
+            self.misses += 1
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another caller may have loaded it while we waited
+            with self._lock:
+                found, value = self._lookup(key)
+            if found:
+                return value
+            try:
+                value = loader()
+                size = self.sizeof(value)
+            except BaseException as e:
+                with self._lock:
+                    self.loads += 1
+                    if isinstance(e, Exception):
+                        self.load_errors += 1
+                    self._release_loading(key, key_lock)
+                raise
+            # Cached and unregistered in one step: a caller arriving in
+            # between would otherwise miss and load again
+            with self._lock:
+                self.loads += 1
+                self._insert(key, value, size)
+                self._release_loading(key, key_lock)
+            return value
+
+    def _release_loading(self, key: Hashable, key_lock: threading.Lock) -> None:
+        # Caller holds self._lock
+        if self._loading.get(key) is key_lock:
+            del self._loading[key]
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "loads": self.loads,
+                "load_errors": self.load_errors,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+if __name__ == "__main__":
+    pass
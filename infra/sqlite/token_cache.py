@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+from domain.nlp.lexicon.schema import NLPToken
+
+TOKEN_CACHE_PATH = os.getenv("TOKEN_CACHE_PATH", ".cache/token_cache.sqlite3")
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "500000"))
+
+# Bump when the table layout or the stored token JSON changes
+SCHEMA_VERSION = 1
+# SQLite host parameter limit is 999 on older builds
+_CHUNK = 500
+
+
+class SqliteTokenCache:
+    """
+    Disk-backed form -> NLPToken list store shared by worker processes on a node.
+    Rows are keyed by (model_version, form), so a new NLP model never reads
+    stale analyses. WAL mode lets several processes read while one writes.
+    Least recently used rows are evicted once max_entries is exceeded.
+    """
+
+    def __init__(
+        self,
+        path: str = TOKEN_CACHE_PATH,
+        max_entries: int = TOKEN_CACHE_MAX_ENTRIES,
+        timeout: float = 30.0,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections must not be shared across fork()
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS token_cache")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS token_cache (
+                    model_version TEXT NOT NULL,
+                    form TEXT NOT NULL,
+                    tokens TEXT NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (model_version, form)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS token_cache_last_used ON token_cache (last_used)"
+            )
+
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    def get_many(self, version: str, forms: List[str]) -> Dict[str, List[NLPToken]]:
+        """
+        Return cached tokens for the forms found. Marks found rows as used.
+        """
+        conn = self._connect()
+        found: Dict[str, List[NLPToken]] = {}
+        for start in range(0, len(forms), _CHUNK):
+            chunk = forms[start : start + _CHUNK]
+            rows = conn.execute(
+                "SELECT form, tokens FROM token_cache "
+                f"WHERE model_version = ? AND form IN ({','.join('?' * len(chunk))})",
+                [version, *chunk],
+            ).fetchall()
+            for form, tokens in rows:
+                found[form] = [NLPToken(**t) for t in json.loads(tokens)]
+
+        if found:
+            now = time.time()
+            with conn:
+                conn.executemany(
+                    "UPDATE token_cache SET last_used = ? "
+                    "WHERE model_version = ? AND form = ?",
+                    [(now, version, form) for form in found],
+                )
+
+        self.hits += len(found)
+        self.misses += len(forms) - len(found)
+        return found
+
+    def put_many(self, version: str, tokens_by_form: Dict[str, List[NLPToken]]) -> None:
+        """
+        Upsert analysed forms, then evict least recently used rows over the limit.
+        """
+        if not tokens_by_form:
+            return
+        conn = self._connect()
+        now = time.time()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO token_cache (model_version, form, tokens, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        version,
+                        form,
+                        json.dumps([t.model_dump() for t in tokens], ensure_ascii=False),
+                        now,
+                    )
+                    for form, tokens in tokens_by_form.items()
+                ],
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        count = conn.execute("SELECT COUNT(*) FROM token_cache").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        # Evict down to 90% so eviction does not run on every write
+        to_delete = count - int(self.max_entries * 0.9)
+        conn.execute(
+            "DELETE FROM token_cache WHERE rowid IN "
+            "(SELECT rowid FROM token_cache ORDER BY last_used, rowid LIMIT ?)",
+            (to_delete,),
+        )
+        logging.info(f"Evicted {to_delete} entries from token cache {self.path}")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+if __name__ == "__main__":
+    pass
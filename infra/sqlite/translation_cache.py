@@ -0,0 +1,187 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+TRANSLATION_CACHE_PATH = os.getenv(
+    "TRANSLATION_CACHE_PATH", ".cache/translation_cache.sqlite3"
+)
+TRANSLATION_CACHE_MAX_ENTRIES = int(
+    os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "1000000")
+)
+TRANSLATION_CACHE_TTL_S = float(os.getenv("TRANSLATION_CACHE_TTL_S", "604800"))
+
+# Bump when the table layout or the stored row JSON changes
+SCHEMA_VERSION = 1
+# SQLite host parameter limit is 999 on older builds
+_CHUNK = 500
+
+
+class SqliteTranslationCache:
+    """
+    Disk-backed cache id -> cached_translations row, shared by worker processes
+    on a node. Rows are keyed by (trans_version, id), reads only see the
+    caller's version, and rows expire ttl seconds after they were written.
+    Rows of other versions are not deleted eagerly (during a rolling deploy
+    both versions are live on a node); they expire or are evicted as least
+    recently used once max_entries is exceeded. Threads of a process share one
+    connection, serialized by a lock.
+    """
+
+    def __init__(
+        self,
+        path: str = TRANSLATION_CACHE_PATH,
+        max_entries: int = TRANSLATION_CACHE_MAX_ENTRIES,
+        ttl: float = TRANSLATION_CACHE_TTL_S,
+        timeout: float = 30.0,
+        clock=time.time,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.timeout = timeout
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections must not be shared across fork()
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(
+            self.path, timeout=self.timeout, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS translation_cache")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS translation_cache (
+                    trans_version TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    row TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (trans_version, id)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS translation_cache_last_used "
+                "ON translation_cache (last_used)"
+            )
+        self._purge(conn)
+
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    def _purge(self, conn: sqlite3.Connection) -> None:
+        with conn:
+            deleted = conn.execute(
+                "DELETE FROM translation_cache WHERE expires_at <= ?",
+                (self.clock(),),
+            ).rowcount
+        if deleted:
+            logging.info(f"Purged {deleted} expired translations from {self.path}")
+
+    def get_many(self, version: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the unexpired rows found for ids. Marks found rows as used.
+        """
+        with self._lock:
+            return self._get_many(version, ids)
+
+    def _get_many(self, version: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        conn = self._connect()
+        now = self.clock()
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(ids), _CHUNK):
+            chunk = ids[start : start + _CHUNK]
+            rows = conn.execute(
+                "SELECT id, row FROM translation_cache WHERE trans_version = ? "
+                f"AND expires_at > ? AND id IN ({','.join('?' * len(chunk))})",
+                [version, now, *chunk],
+            ).fetchall()
+            for cache_id, row in rows:
+                found[cache_id] = json.loads(row)
+
+        if found:
+            with conn:
+                conn.executemany(
+                    "UPDATE translation_cache SET last_used = ? "
+                    "WHERE trans_version = ? AND id = ?",
+                    [(now, version, cache_id) for cache_id in found],
+                )
+
+        self.hits += len(found)
+        self.misses += len(ids) - len(found)
+        return found
+
+    def put_many(self, version: str, rows: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Upsert rows by cache id, then evict least recently used rows over the limit.
+        """
+        if not rows:
+            return
+        with self._lock:
+            self._put_many(version, rows)
+
+    def _put_many(self, version: str, rows: Dict[str, Dict[str, Any]]) -> None:
+        conn = self._connect()
+        now = self.clock()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO translation_cache "
+                "(trans_version, id, row, expires_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        version,
+                        cache_id,
+                        json.dumps(row, ensure_ascii=False, default=str),
+                        now + self.ttl,
+                        now,
+                    )
+                    for cache_id, row in rows.items()
+                ],
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        count = conn.execute("SELECT COUNT(*) FROM translation_cache").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        # Evict down to 90% so eviction does not run on every write
+        to_delete = count - int(self.max_entries * 0.9)
+        conn.execute(
+            "DELETE FROM translation_cache WHERE rowid IN "
+            "(SELECT rowid FROM translation_cache ORDER BY last_used, rowid LIMIT ?)",
+            (to_delete,),
+        )
+        logging.info(f"Evicted {to_delete} entries from translation cache {self.path}")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+if __name__ == "__main__":
+    pass
@@ -1,6 +1,6 @@
 import logging
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
 
 from common.constants import CACHED_TRANSLATIONS_TABLE, CARDS_TABLE, DECKS_TABLE
 from common.schemas import CacheEntry
@@ -45,6 +45,51 @@ class SBDeckIO:
 
         return {row["id"]: row for row in rows}
 
+    def iter_cache_ids(self, page_size: int = 1000) -> Iterator[str]:
+        """
+        Yield every cache id, paging by id (keyset: PostgREST caps rows per
+        response, and offsets would shift under concurrent inserts).
+        """
+        return self._iter_ids(None, page_size)
+
+    def cache_ids_since(self, since: float, page_size: int = 1000) -> Iterator[str]:
+        """
+        Yield the ids of rows created at or after since (epoch seconds).
+        """
+        return self._iter_ids(since, page_size)
+
+    def _iter_ids(self, since: Optional[float], page_size: int) -> Iterator[str]:
+        last_id = None
+        while True:
+            query = self.sb.table(CACHED_TRANSLATIONS_TABLE).select("id")
+            if since is not None:
+                created = datetime.fromtimestamp(since, timezone.utc)
+                query = query.gte("created_at", created.isoformat())
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            rows = query.order("id").limit(page_size).execute().data or []
+            for row in rows:
+                yield row["id"]
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]["id"]
+
+    def last_cache_write(self) -> Optional[float]:
+        """
+        Creation time (epoch seconds, database clock) of the newest cache row.
+        """
+        rows = (
+            self.sb.table(CACHED_TRANSLATIONS_TABLE)
+            .select("created_at")
+            .order("created_at", desc=True)
+            .limit(1)
+            .execute()
+            .data
+        )
+        if not rows:
+            return None
+        return datetime.fromisoformat(rows[0]["created_at"]).timestamp()
+
     def upsert_cache_translation(self, cache_entries: list[CacheEntry]) -> dict:
         """
         Upsert data. List of entries to cache.
@@ -0,0 +1,33 @@
+from typing import Any, Dict, List
+
+from common.constants import FAILED_TRANSLATIONS_TABLE
+from common.supabase_client import get_client
+
+
+class SBFailedTranslationIO:
+    """
+    Failed translations (negative cache) keyed by translation cache id.
+    """
+
+    def __init__(self):
+        self.sb = get_client()
+
+    def get_failed(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not ids:
+            return {}
+        res = (
+            self.sb.table(FAILED_TRANSLATIONS_TABLE)
+            .select("id, translation_output, attempts, retry_after")
+            .in_("id", ids)
+            .execute()
+        )
+        return {row["id"]: row for row in res.data or []}
+
+    def record_failed(self, entries: List[Dict[str, Any]]) -> Any:
+        if not entries:
+            return None
+        return self.sb.table(FAILED_TRANSLATIONS_TABLE).upsert(entries).execute()
+
+
+if __name__ == "__main__":
+    pass
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from common.constants import (
     STATUS_FAILED,
@@ -59,6 +59,21 @@ class SBJobsIO:
         self.sb.storage.from_(bucket_name).upload(name, file)
         logging.info(f"Uploaded file {name} to bucket {bucket_name}")
 
+    def get_analysis_version(self, job_id: str) -> Optional[str]:
+        """
+        Changes with every successful (re-)analysis of the job.
+        """
+        row = (
+            self.sb.table(TABLE_JOBS)
+            .select("output_path, finished_at")
+            .eq("id", job_id)
+            .execute()
+            .data[0]
+        )
+        if not row.get("output_path"):
+            return None
+        return f"{row['output_path']}@{row.get('finished_at')}"
+
     def download_analysis(self, job_id: str) -> Any:
         output_path = (
             self.sb.table(TABLE_JOBS)
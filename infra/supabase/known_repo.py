@@ -0,0 +1,45 @@
+import base64
+from datetime import datetime
+from typing import Any, Optional
+
+from common.constants import KNOWN_LEMMAS_TABLE
+from common.supabase_client import get_client
+
+
+class SBKnownIO:
+    """
+    Per-user known-lemma bitsets (base64 text) over lemma vocabulary ids.
+    """
+
+    def __init__(self):
+        self.sb = get_client()
+
+    def load_known(self, user_id: str, lang: str) -> Optional[bytes]:
+        res = (
+            self.sb.table(KNOWN_LEMMAS_TABLE)
+            .select("bitset")
+            .eq("user_id", user_id)
+            .eq("lang", lang)
+            .execute()
+        )
+        rows = res.data or []
+        return base64.b64decode(rows[0]["bitset"]) if rows else None
+
+    def save_known(self, user_id: str, lang: str, bitset: bytes, count: int) -> Any:
+        return (
+            self.sb.table(KNOWN_LEMMAS_TABLE)
+            .upsert(
+                {
+                    "user_id": user_id,
+                    "lang": lang,
+                    "bitset": base64.b64encode(bitset).decode("ascii"),
+                    "count": count,
+                    "updated_at": datetime.now().isoformat(),
+                }
+            )
+            .execute()
+        )
+
+
+if __name__ == "__main__":
+    pass
@@ -33,6 +33,9 @@ CREATE TABLE IF NOT EXISTS cached_translations (
     target_lang TEXT,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
+-- Lets the translation Bloom filter catch up with rows stored since it was built
+CREATE INDEX IF NOT EXISTS cached_translations_created_at_idx
+    ON cached_translations (created_at);
 
 -- 3. Decks
 -- A deck is a specific configuration of cards generated from an Analyzed Job.
@@ -73,3 +76,36 @@ CREATE TABLE IF NOT EXISTS cards (
     analyzed_hash TEXT, -- Denormalized for easier querying
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
+
+-- 5. Vocabulary
+-- Stable integer id per (lang, lemma). The ids index the known-lemma bitsets,
+-- so only lemmas are interned here, keeping them dense.
+CREATE TABLE IF NOT EXISTS lemma_vocabulary (
+    id BIGSERIAL PRIMARY KEY,
+    lang TEXT NOT NULL,
+    value TEXT NOT NULL,
+    UNIQUE (lang, value)
+);
+
+-- 6. Known lemmas
+-- Per-user known vocabulary: base64 little-endian bitset over lemma_vocabulary.id.
+CREATE TABLE IF NOT EXISTS known_lemmas (
+    user_id TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    bitset TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (user_id, lang)
+);
+
+-- 7. Failed translations
+-- Negative cache: translations whose output lost its <i> tag, keyed like
+-- cached_translations.id. Rebuilds skip them until retry_after (epoch seconds).
+CREATE TABLE IF NOT EXISTS failed_translations (
+    id TEXT PRIMARY KEY,
+    translation_input TEXT,
+    translation_output TEXT,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    retry_after DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
@@ -0,0 +1,66 @@
+import logging
+from typing import Dict, List
+
+from common.constants import VOCABULARY_TABLES
+from common.supabase_client import get_client
+
+# Keeps PostgREST `in` filters within URL length limits
+_CHUNK = 200
+
+
+class SBVocabularyIO:
+    """
+    Global vocabulary tables: one BIGSERIAL id per (lang, value) and kind.
+    """
+
+    def __init__(self):
+        self.sb = get_client()
+
+    def get_ids(self, lang: str, kind: str, values: List[str]) -> Dict[str, int]:
+        out = {}
+        for start in range(0, len(values), _CHUNK):
+            res = (
+                self.sb.table(VOCABULARY_TABLES[kind])
+                .select("id, value")
+                .eq("lang", lang)
+                .in_("value", values[start : start + _CHUNK])
+                .execute()
+            )
+            out.update({row["value"]: row["id"] for row in res.data or []})
+        return out
+
+    def create_ids(self, lang: str, kind: str, values: List[str]) -> Dict[str, int]:
+        """
+        Ids of values, inserting the ones the vocabulary does not have yet.
+        Only missing values are upserted: conflicting inserts still consume
+        sequence numbers, and lemma ids should stay dense for the bitsets.
+        """
+        existing = self.get_ids(lang, kind, values)
+        missing = [value for value in values if value not in existing]
+        if missing:
+            self.sb.table(VOCABULARY_TABLES[kind]).upsert(
+                [{"lang": lang, "value": value} for value in missing],
+                on_conflict="lang,value",
+                ignore_duplicates=True,
+            ).execute()
+            # Re-read: rows inserted concurrently by other workers are skipped above
+            existing.update(self.get_ids(lang, kind, missing))
+            logging.info(f"Added {len(missing)} {kind}s to vocabulary ({lang}).")
+        return existing
+
+    def get_values(self, lang: str, kind: str, ids: List[int]) -> Dict[int, str]:
+        out = {}
+        for start in range(0, len(ids), _CHUNK):
+            res = (
+                self.sb.table(VOCABULARY_TABLES[kind])
+                .select("id, value")
+                .eq("lang", lang)
+                .in_("id", ids[start : start + _CHUNK])
+                .execute()
+            )
+            out.update({row["id"]: row["value"] for row in res.data or []})
+        return out
+
+
+if __name__ == "__main__":
+    pass
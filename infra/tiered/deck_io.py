@@ -0,0 +1,235 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from common.schemas import CacheEntry
+from core.ports import DeckIO, TranslationCache
+from domain.deck.schemas.schema import Card, Deck
+from domain.translator.translator import TRANS_VERSION
+from infra.memory.bloom_filter import BloomFilter
+from infra.memory.lru_cache import LRUCache
+
+# In-process (L1) translation cache; the disk tier (L2) is configured in
+# infra.sqlite.translation_cache
+TRANSLATION_L1_MAX_ENTRIES = int(os.getenv("TRANSLATION_L1_MAX_ENTRIES", "100000"))
+TRANSLATION_L1_TTL_S = float(os.getenv("TRANSLATION_L1_TTL_S", "3600"))
+# Ids L3 just reported missing are not asked again for this long; short, as
+# other workers may store them meanwhile
+TRANSLATION_MISS_TTL_S = float(os.getenv("TRANSLATION_MISS_TTL_S", "60"))
+TRANSLATION_MISS_MAX_ENTRIES = int(os.getenv("TRANSLATION_MISS_MAX_ENTRIES", "100000"))
+# Rows are stamped when their transaction starts; ones committing up to this
+# long after a newer row still show up when the negative filter catches up
+TRANSLATION_BLOOM_LAG_S = float(os.getenv("TRANSLATION_BLOOM_LAG_S", "30"))
+# Lookups starting within this long of a last-write check share its answer,
+# about the staleness of a lookup already in flight
+TRANSLATION_BLOOM_CHECK_S = float(os.getenv("TRANSLATION_BLOOM_CHECK_S", "1"))
+
+
+class TieredDeckIO:
+    """
+    DeckIO with cached_translations read through an in-process LRU (L1) and a
+    node-local disk cache (L2) before the wrapped store (L3, Supabase).
+    Hits are copied into the tiers above them; upserts are written to L3
+    first and then to L2 and L1. Entries live under the translation version,
+    so a TRANS_VERSION bump never serves rows of the previous one.
+    Ids L3 reported missing are remembered for TRANSLATION_MISS_TTL_S (or
+    until this worker upserts them), so repeated builds do not re-query them.
+    With a negative filter (Bloom filter over all L3 ids), ids it rules out
+    are reported missing without asking L3, but only once the filter covers
+    L3's last write: rows other workers stored after its watermark are added
+    first, and if L3 cannot tell, nothing is skipped. Upserted ids are added
+    to it.
+    Deck and card calls go straight to L3.
+    """
+
+    def __init__(
+        self,
+        l3: DeckIO,
+        l2: Optional[TranslationCache] = None,
+        l1: Optional[LRUCache] = None,
+        version: str = TRANS_VERSION,
+        negative: Optional[BloomFilter] = None,
+        misses: Optional[LRUCache] = None,
+    ):
+        self.l3 = l3
+        self.l2 = l2
+        self.l1 = l1 or LRUCache(
+            max_entries=TRANSLATION_L1_MAX_ENTRIES,
+            max_size=TRANSLATION_L1_MAX_ENTRIES,
+            ttl=TRANSLATION_L1_TTL_S,
+        )
+        self.version = version
+        self.misses = misses or LRUCache(
+            max_entries=TRANSLATION_MISS_MAX_ENTRIES,
+            max_size=TRANSLATION_MISS_MAX_ENTRIES,
+            ttl=TRANSLATION_MISS_TTL_S,
+        )
+        self.negative = negative
+        # (time, id) upserted since the negative filter was built
+        self._upserted: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._negative_lock = threading.Lock()
+        # Start (monotonic) and filter of the last successful last-write check
+        self._checked: Tuple[float, Optional[BloomFilter]] = (float("-inf"), None)
+        self._l3_stats = {
+            "hits": 0,
+            "misses": 0,
+            "requests": 0,
+            "skipped": 0,
+            "recent_misses": 0,
+            "catch_ups": 0,
+        }
+
+    def set_negative(self, negative: BloomFilter) -> None:
+        """
+        Swap in a rebuilt filter. Ids upserted after its build started are
+        added to it, so it never misses this worker's own writes.
+        """
+        with self._negative_lock, self._lock:
+            self._upserted = [
+                (t, cache_id)
+                for t, cache_id in self._upserted
+                if t >= negative.built_at
+            ]
+            negative.add(cache_id for _, cache_id in self._upserted)
+            self.negative = negative
+
+    def get_cached(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Rows for the ids found in any tier, looked up L1 -> L2 -> L3.
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for cache_id in dict.fromkeys(ids):
+            row = self.l1.get((self.version, cache_id))
+            if row is None:
+                missing.append(cache_id)
+            else:
+                found[cache_id] = row
+
+        if missing and self.l2 is not None:
+            from_l2 = self.l2.get_many(self.version, missing)
+            self._fill_l1(from_l2)
+            found.update(from_l2)
+            missing = [cache_id for cache_id in missing if cache_id not in from_l2]
+
+        if missing:
+            recent = [
+                cache_id
+                for cache_id in missing
+                if self.misses.get((self.version, cache_id)) is not None
+            ]
+            if recent:
+                with self._lock:
+                    self._l3_stats["recent_misses"] += len(recent)
+                recent = set(recent)
+                missing = [cache_id for cache_id in missing if cache_id not in recent]
+
+        negative = self.negative
+        if missing and negative is not None:
+            maybe = negative.contains(missing)
+            if not maybe.all() and self._catch_up(negative):
+                maybe = negative.contains(missing)
+                with self._lock:
+                    self._l3_stats["skipped"] += len(missing) - int(maybe.sum())
+                missing = [cache_id for cache_id, m in zip(missing, maybe) if m]
+
+        if missing:
+            from_l3 = self.l3.get_cached(missing)
+            with self._lock:
+                self._l3_stats["requests"] += 1
+                self._l3_stats["hits"] += len(from_l3)
+                self._l3_stats["misses"] += len(missing) - len(from_l3)
+            if self.l2 is not None:
+                self.l2.put_many(self.version, from_l3)
+            self._fill_l1(from_l3)
+            found.update(from_l3)
+            for cache_id in missing:
+                if cache_id not in from_l3:
+                    self.misses.put((self.version, cache_id), True)
+        return found
+
+    def _catch_up(self, negative: BloomFilter) -> bool:
+        """
+        Bring negative up to L3's last write, adding the ids stored since its
+        watermark. False if L3 could not be asked, so its "absent" answers
+        must not be trusted.
+        """
+        started = time.monotonic()
+        with self._negative_lock:
+            checked_at, checked = self._checked
+            fresh = started - checked_at <= TRANSLATION_BLOOM_CHECK_S
+            if checked is negative and fresh:
+                return True
+            checked_at = time.monotonic()
+            try:
+                last_write = self.l3.last_cache_write() or 0.0
+                if last_write <= negative.watermark:
+                    self._checked = (checked_at, negative)
+                    return True
+                since = negative.watermark - TRANSLATION_BLOOM_LAG_S
+                negative.add(self.l3.cache_ids_since(since))
+            except Exception as e:
+                logging.warning(f"Not trusting the translation Bloom filter: {e}")
+                return False
+            negative.watermark = last_write
+            self._checked = (checked_at, negative)
+            with self._lock:
+                self._l3_stats["catch_ups"] += 1
+            return True
+
+    def upsert_cache_translation(self, cache_entries: list[CacheEntry]) -> dict:
+        """
+        Write-through: the store of record first, then the local tiers.
+        """
+        res = self.l3.upsert_cache_translation(cache_entries)
+        rows = {entry["id"]: dict(entry) for entry in cache_entries}
+        with self._lock:
+            if self.negative is not None:
+                self.negative.add(rows)
+                now = time.time()
+                self._upserted.extend((now, cache_id) for cache_id in rows)
+        if self.l2 is not None:
+            self.l2.put_many(self.version, rows)
+        self._fill_l1(rows)
+        for cache_id in rows:
+            self.misses.invalidate((self.version, cache_id))
+        return res
+
+    def _fill_l1(self, rows: Dict[str, Dict[str, Any]]) -> None:
+        for cache_id, row in rows.items():
+            self.l1.put((self.version, cache_id), row)
+
+    def save_deck(self, deck: Deck, request_params: dict) -> Any:
+        return self.l3.save_deck(deck, request_params)
+
+    def save_cards(self, cards: list[Card], deck_id: str) -> Any:
+        return self.l3.save_cards(cards, deck_id)
+
+    def get_cards(self, deck_id: str) -> list[Card]:
+        return self.l3.get_cards(deck_id)
+
+    def stats(self) -> dict:
+        """
+        Hit rates per tier; every tier only sees the misses of the one above.
+        l3.skipped counts ids the negative filter kept from reaching L3,
+        l3.recent_misses the ids L3 had just reported missing and
+        l3.catch_ups the times the filter was topped up with newer L3 ids.
+        """
+        l1 = self.l1.stats()
+        with self._lock:
+            l3 = dict(self._l3_stats)
+        lookups = l3["hits"] + l3["misses"]
+        l3["hit_rate"] = l3["hits"] / lookups if lookups else 0.0
+        return {
+            "l1": {k: l1[k] for k in ("entries", "hits", "misses", "hit_rate")},
+            "l2": self.l2.stats() if self.l2 is not None else None,
+            "l3": l3,
+            "negative": self.negative.stats() if self.negative is not None else None,
+        }
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,103 @@
+import logging
+import os
+from typing import Optional
+
+from core.versions import ANALYZE_VERSION
+from domain.nlp.lexicon.artifact import load_analysis
+from domain.nlp.lexicon.index import LexiconIndex
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+from infra.memory.lru_cache import LRUCache
+from infra.supabase.jobs_repo import SBJobsIO
+from pipelines.vocabulary import vocabulary
+
+# Parsed analyses kept in memory, so repeat previews skip download + parse
+ANALYSIS_CACHE_TTL_S = float(os.getenv("ANALYSIS_CACHE_TTL_S", "900"))
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "32"))
+ANALYSIS_CACHE_MAX_MB = int(os.getenv("ANALYSIS_CACHE_MAX_MB", "512"))
+
+# Rough CPython overheads (object header + pointer slots)
+_LEMMA_OVERHEAD = 1000
+_ITEM_OVERHEAD = 80
+
+
+def estimate_analysis_size(analyzed_episode: AnalyzedEpisode) -> int:
+    """
+    Approximate in-memory bytes of a parsed analysis (upper bound: example
+    sentences are counted per reference).
+    """
+    size = 0
+    for lemma, data in analyzed_episode.episode_data_processed.items():
+        size += _LEMMA_OVERHEAD + len(lemma)
+        size += sum(len(f) + _ITEM_OVERHEAD for f in data.forms)
+        size += (len(data.forms_freq) + len(data.forms_cov)) * _ITEM_OVERHEAD
+        for form, examples in data.examples.items():
+            size += len(form) + _ITEM_OVERHEAD
+            size += sum(len(s) + _ITEM_OVERHEAD for s in examples)
+    return size
+
+
+_cache: LRUCache[AnalyzedEpisode] = LRUCache(
+    max_entries=ANALYSIS_CACHE_MAX_ENTRIES,
+    max_size=ANALYSIS_CACHE_MAX_MB * 1024 * 1024,
+    ttl=ANALYSIS_CACHE_TTL_S,
+    sizeof=estimate_analysis_size,
+)
+_indexes: LRUCache[LexiconIndex] = LRUCache(
+    max_entries=ANALYSIS_CACHE_MAX_ENTRIES,
+    max_size=ANALYSIS_CACHE_MAX_MB * 1024 * 1024,
+    ttl=ANALYSIS_CACHE_TTL_S,
+    sizeof=LexiconIndex.nbytes,
+)
+
+
+def analysis_key(job_id: str) -> tuple:
+    """
+    Cache key of a job's current analysis. Analyses are (re-)run by the
+    worker, in another process: the key carries the job's output version, so
+    a re-analysis is a miss here, not a stale hit. Costs a Supabase request;
+    compute it once per request and pass it to get_analysis and
+    get_lexicon_index.
+    """
+    return (job_id, ANALYZE_VERSION, SBJobsIO().get_analysis_version(job_id))
+
+
+def _load_analysis(key: tuple) -> AnalyzedEpisode:
+    def load() -> AnalyzedEpisode:
+        logging.info(f"Loading analysis for job: {key[0]}")
+        return load_analysis(SBJobsIO().download_analysis(key[0]))
+
+    analyzed_episode = _cache.get_or_load(key, load)
+    logging.info(f"Analysis cache stats: {_cache.stats()}")
+    return analyzed_episode
+
+
+def get_analysis(job_id: str, key: Optional[tuple] = None) -> AnalyzedEpisode:
+    """
+    Parsed analysis of a job, served from memory while the job's output is
+    unchanged. The returned object is shared between requests and must be
+    treated as read-only: deck and preview pipelines copy what they change
+    into Candidates.
+    Args:
+        key (tuple): analysis_key(job_id), looked up if None.
+    """
+    return _load_analysis(key or analysis_key(job_id))
+
+
+def get_lexicon_index(job_id: str, key: Optional[tuple] = None) -> LexiconIndex:
+    """
+    Vocabulary-id index of a job's analysis, built once per cached analysis.
+    Args:
+        key (tuple): analysis_key(job_id), looked up if None.
+    """
+    key = key or analysis_key(job_id)
+    return _indexes.get_or_load(
+        key, lambda: LexiconIndex.build(_load_analysis(key), vocabulary())
+    )
+
+
+def analysis_cache_stats() -> dict:
+    return _cache.stats()
+
+
+if __name__ == "__main__":
+    pass
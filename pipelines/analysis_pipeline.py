@@ -1,10 +1,13 @@
 import logging
+import os
 import traceback
 import uuid
 
 from common.constants import (
     BUCKET_RESULTS,
     BUCKET_UPLOADS,
+    MAX_EXAMPLES_PER_EPISODE,
+    MAX_EXAMPLES_PER_FORM,
     STATUS_FAILED,
     STATUS_QUEUED,
     STATUS_RUNNING,
@@ -12,8 +15,24 @@ from common.constants import (
     TABLE_JOBS,
 )
 from domain.nlp.adapter_factory import AdapterFactory
+from domain.nlp.lexicon.artifact import dump_analysis
 from domain.nlp.run_episode_analysis import process_episode
+from infra.sqlite.token_cache import SqliteTokenCache
 from infra.supabase.jobs_repo import SBJobsIO
+from pipelines.translation_warmup import schedule_translation_warmup
+from pipelines.vocabulary import register_analysis
+
+# Opt-in: >1 shards Stanza tokenization across a process pool
+TOKENIZE_WORKERS = int(os.getenv("TOKENIZE_WORKERS", "1"))
+TOKENIZE_SHARD_SIZE = int(os.getenv("TOKENIZE_SHARD_SIZE", "2000"))
+# "binary" (compact artifact) or "json"; readers accept both
+ANALYSIS_FORMAT = os.getenv("ANALYSIS_FORMAT", "binary")
+# Seeded example sample: cap per form and total per episode
+EXAMPLES_PER_FORM = int(os.getenv("EXAMPLES_PER_FORM", str(MAX_EXAMPLES_PER_FORM)))
+EXAMPLES_PER_EPISODE = int(
+    os.getenv("EXAMPLES_PER_EPISODE", str(MAX_EXAMPLES_PER_EPISODE))
+)
+EXAMPLES_SEED = int(os.getenv("EXAMPLES_SEED", "0"))
 
 
 def register_job(file: bytes, episode_name: str):
@@ -51,15 +70,30 @@ def run_analysis_pipeline(job_id: str) -> dict:
         sb_jobs_io.update_status(job_id, STATUS_RUNNING, 0)
 
         adapter = AdapterFactory.create_content_adapter(params["file_type"])
-        lang_adapter = AdapterFactory.create_lang_adapter(params["language"])
+        lang_adapter = AdapterFactory.create_lang_adapter(
+            params["language"],
+            token_cache=SqliteTokenCache(),
+            workers=TOKENIZE_WORKERS,
+            shard_size=TOKENIZE_SHARD_SIZE,
+        )
 
         analyzed_episode = process_episode(
-            file_to_process, adapter, lang_adapter, episode_name=params["episode_name"]
+            file_to_process,
+            adapter,
+            lang_adapter,
+            episode_name=params["episode_name"],
+            max_examples_per_form=EXAMPLES_PER_FORM,
+            max_examples_per_episode=EXAMPLES_PER_EPISODE,
+            example_seed=EXAMPLES_SEED,
         )
+        # Ids are assigned here, so deck builds only look them up
+        register_analysis(analyzed_episode)
 
         # Put it to bucket results
-        results_encoded = analyzed_episode.model_dump_json().encode("utf-8")
-        logging.info(f"Encoded results to {len(results_encoded)} bytes.")
+        results_encoded = dump_analysis(analyzed_episode, ANALYSIS_FORMAT)
+        logging.info(
+            f"Encoded results ({ANALYSIS_FORMAT}) to {len(results_encoded)} bytes."
+        )
         sb_jobs_io.upload_file(BUCKET_RESULTS, results_encoded, job_id)
         logging.info(f"Uploaded results to bucket {BUCKET_RESULTS}/{job_id}")
         # Put result path to jobs table
@@ -77,4 +111,6 @@ def run_analysis_pipeline(job_id: str) -> dict:
         )
         logging.error(f"Failed to process job: {job_id}")
         raise
+    # Background, low priority: the first deck build then mostly hits the cache
+    schedule_translation_warmup(job_id, analyzed_episode)
     return analyzed_episode.stats
@@ -1,42 +1,151 @@
+import logging
+import os
 import time
 import uuid
-from typing import Any
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from common.schemas import BuildDeckRequest, PreviewBuildDeckRequest
-from core.ports import DeckIO
+from core.ports import DeckIO, FailedTranslationIO
+from domain.deck.deck_generation.coverage_curve import (
+    CoverageCurve,
+    build_coverage_curve,
+    curve_key,
+)
 from domain.deck.deck_generation.deck_generation import assemble_cards
 from domain.deck.deck_generation.lexicon_processing import (
     pick_until_target,
-    score_and_rank,
     select_candidates,
     select_example,
 )
-from domain.deck.schemas.schema import Deck
+from domain.deck.deck_generation.scoring import (
+    CorpusStats,
+    load_corpus_stats,
+    rank_candidates,
+)
+from domain.deck.schemas.schema import Candidate, Deck
+from domain.nlp.lexicon.index import LexiconIndex
 from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.translator.lemma_translation import translate_lemmas, uses_lemma_tier
 from domain.translator.translation import translate_selection
 from domain.translator.translator import Translator
+from domain.vocab.known_store import KnownLemmas
+from infra.memory.lru_cache import LRUCache
+from infra.sqlite.translation_cache import SqliteTranslationCache
 from infra.supabase.deck_repo import SBDeckIO
-from infra.supabase.jobs_repo import SBJobsIO
+from infra.supabase.failed_translation_repo import SBFailedTranslationIO
+from infra.tiered.deck_io import TieredDeckIO
+from pipelines.analysis_cache import (
+    ANALYSIS_CACHE_TTL_S,
+    analysis_key,
+    get_analysis,
+    get_lexicon_index,
+)
+from pipelines.known_vocab import get_known_lemmas
+from pipelines.translation_bloom import refresh_translation_bloom
+
+# Optional reference corpus (JSON CorpusStats) for ZIPF / TFIDF scoring
+SCORING_CORPUS_PATH = os.getenv("SCORING_CORPUS_PATH")
+# Ranked candidates and coverage curves per preview configuration
+PREVIEW_CACHE_MAX_ENTRIES = int(os.getenv("PREVIEW_CACHE_MAX_ENTRIES", "256"))
+
+_preview_cache: LRUCache = LRUCache(
+    max_entries=PREVIEW_CACHE_MAX_ENTRIES,
+    max_size=PREVIEW_CACHE_MAX_ENTRIES,
+    ttl=ANALYSIS_CACHE_TTL_S,
+)
 
 
 def _t():
     return time.perf_counter()
 
 
+@lru_cache(maxsize=1)
+def scoring_corpus() -> Optional[CorpusStats]:
+    return load_corpus_stats(SCORING_CORPUS_PATH) if SCORING_CORPUS_PATH else None
+
+
+@lru_cache(maxsize=1)
+def tiered_deck_io() -> TieredDeckIO:
+    """
+    Process-wide DeckIO: translation lookups go memory -> node disk -> Supabase,
+    and ids the Bloom filter rules out never reach Supabase.
+    """
+    return TieredDeckIO(SBDeckIO(), SqliteTranslationCache())
+
+
 def run_deck_pipeline(request: BuildDeckRequest):
-    deck_io = SBDeckIO()
+    deck_io = tiered_deck_io()
+    refresh_translation_bloom(deck_io)
     translator = Translator()
-    jobs_io = SBJobsIO()
-    analyzed_episode = jobs_io.download_analysis(request.job_id)
-    analyzed_episode = AnalyzedEpisode.model_validate_json(analyzed_episode)
-    return deck_pipeline(analyzed_episode, request, translator, deck_io)
+    key = analysis_key(request.job_id)
+    analyzed_episode = get_analysis(request.job_id, key)
+    index = get_lexicon_index(request.job_id, key)
+    known = get_known_lemmas(request.user_id, index.lang)
+    stats = deck_pipeline(
+        analyzed_episode,
+        request,
+        translator,
+        deck_io,
+        known,
+        index,
+        failures=SBFailedTranslationIO(),
+    )
+    logging.info(f"Translation cache stats: {deck_io.stats()}")
+    return stats
+
+
+def get_preview_curve(request: PreviewBuildDeckRequest) -> CoverageCurve:
+    """
+    Coverage curve for the request's candidate set and caps, computed once per
+    (analysis output version, POS filter, known lemmas, scoring) and cap
+    configuration, so a re-analysed job gets a new curve.
+    """
+    key = analysis_key(request.job_id)
+    analyzed_episode = get_analysis(request.job_id, key)
+    index = get_lexicon_index(request.job_id, key)
+    known = get_known_lemmas(request.user_id, index.lang)
+    ranked_key = (
+        key,
+        request.difficulty_scoring,
+        frozenset(request.target_share_per_pos.keys()),
+        frozenset(request.exclude_known_lemmas or []),
+        known.digest if known else None,
+    )
+
+    def rank() -> Tuple[List[Candidate], List[float]]:
+        candidates = select_candidates(analyzed_episode, request, known, index)
+        return rank_candidates(
+            candidates, request.difficulty_scoring, scoring_corpus()
+        )
+
+    ranked, scores = _preview_cache.get_or_load(("ranked", ranked_key), rank)
+    key = curve_key(
+        len(ranked),
+        request.max_cards,
+        request.max_share_per_pos,
+        request.target_share_per_pos,
+    )
+    return _preview_cache.get_or_load(
+        ("curve", ranked_key, key),
+        lambda: build_coverage_curve(
+            ranked,
+            request.max_cards,
+            request.max_share_per_pos,
+            request.target_share_per_pos,
+            scores=scores,
+        ),
+    )
 
 
 def run_preview(request: PreviewBuildDeckRequest):
-    jobs_io = SBJobsIO()
-    analyzed_episode = jobs_io.download_analysis(request.job_id)
-    analyzed_episode = AnalyzedEpisode.model_validate_json(analyzed_episode)
-    return get_preview_stats(analyzed_episode, request)
+    return get_preview_curve(request).report(
+        request.max_cards, request.target_coverage
+    )
+
+
+def run_preview_curve(request: PreviewBuildDeckRequest) -> Dict[str, List]:
+    return get_preview_curve(request).points(request.max_cards)
 
 
 def deck_pipeline(
@@ -44,6 +153,9 @@ def deck_pipeline(
     req: BuildDeckRequest,
     translator: Translator,
     deck_io: DeckIO,
+    known: Optional[KnownLemmas] = None,
+    index: Optional[LexiconIndex] = None,
+    failures: Optional[FailedTranslationIO] = None,
 ) -> dict[str, Any]:
     """
     Pure pipeline runner. Deterministic given (analyzed_payload, req).
@@ -52,28 +164,53 @@ def deck_pipeline(
 
     # 1) Candidates
     candidates = select_candidates(
-        analyzed_episode, req
+        analyzed_episode, req, known, index
     )  # filtered by POS, known words, etc.
 
-    # 2) Score + rank (uses seed only for deterministic tie-breaking if needed)
-    ranked = score_and_rank(candidates, req)  # computes score
+    # 2) Score + rank (vectorized; scores stay in an array)
+    ranked, scores = rank_candidates(
+        candidates, req.difficulty_scoring, scoring_corpus()
+    )
 
-    # 3) Pick until you hit coverage or cap
+    # 3) Pick until you hit coverage or cap (writes score on picked only)
     candidate_selection, stats = pick_until_target(
         ranked,
         req.max_cards,
         req.target_coverage,
         req.max_share_per_pos,
         req.target_share_per_pos,
+        scores=scores,
     )
 
     candidate_selection_with_examples = select_example(
         candidate_selection, req, analyzed_episode
     )
 
+    # LEMMA mode: context-free glosses for the POS that allow it
+    lemma_tier = []
+    sentence_tier = candidate_selection_with_examples
+    if req.translation_mode == "LEMMA":
+        lemma_tier = [c for c in sentence_tier if uses_lemma_tier(c)]
+        sentence_tier = [c for c in sentence_tier if not uses_lemma_tier(c)]
+
+    translation_stats: dict[str, Any] = {}
     translated_candidate_selection, not_translated = translate_selection(
-        candidate_selection_with_examples, translator, deck_io
+        sentence_tier,
+        translator,
+        deck_io,
+        failures=failures,
+        stats=translation_stats,
     )
+    translated_lemmas, lemmas_not_translated = translate_lemmas(
+        lemma_tier,
+        translator,
+        deck_io,
+        with_sentences=req.render_sentence_translation,
+        stats=translation_stats,
+        failures=failures,
+    )
+    translated_candidate_selection += translated_lemmas
+    not_translated += lemmas_not_translated
 
     cards = assemble_cards(translated_candidate_selection, req)
 
@@ -81,6 +218,7 @@ def deck_pipeline(
 
     stats["deck_id"] = deck_id
     stats["cand_failed_translation"] = len(not_translated)
+    stats.update(translation_stats)
 
     deck = Deck(
         id=deck_id,
@@ -101,26 +239,29 @@ def deck_pipeline(
 def get_preview_stats(
     analyzed_episode: AnalyzedEpisode,
     req: PreviewBuildDeckRequest,
+    known: Optional[KnownLemmas] = None,
 ) -> dict[str, Any]:
     """
     Run pipeline up to card assembly for preview.
     """
     # 1) Candidates
-    candidates = select_candidates(analyzed_episode, req)
+    candidates = select_candidates(analyzed_episode, req, known)
 
     # 2) Score + rank
-    ranked = score_and_rank(candidates, req)
+    ranked, scores = rank_candidates(
+        candidates, req.difficulty_scoring, scoring_corpus()
+    )
 
-    # 3) Pick until you hit coverage or cap
-    _, stats = pick_until_target(
+    # 3) Pick order once, then stop at target coverage or cap
+    curve = build_coverage_curve(
         ranked,
         req.max_cards,
-        req.target_coverage,
         req.max_share_per_pos,
         req.target_share_per_pos,
+        scores=scores,
     )
 
-    return stats
+    return curve.report(req.max_cards, req.target_coverage)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+import os
+from functools import lru_cache
+from typing import List, Optional
+
+from domain.vocab.bitset import LemmaBitset
+from domain.vocab.known_store import KnownLemmas, KnownVocabularyStore
+from infra.memory.lru_cache import LRUCache
+from infra.supabase.known_repo import SBKnownIO
+from pipelines.vocabulary import vocabulary
+
+# Bitsets are re-read after this long, so edits made on other workers show up
+KNOWN_CACHE_TTL_S = float(os.getenv("KNOWN_CACHE_TTL_S", "30"))
+KNOWN_CACHE_MAX_ENTRIES = int(os.getenv("KNOWN_CACHE_MAX_ENTRIES", "1024"))
+
+_bitsets: LRUCache[LemmaBitset] = LRUCache(
+    max_entries=KNOWN_CACHE_MAX_ENTRIES,
+    max_size=KNOWN_CACHE_MAX_ENTRIES,
+    ttl=KNOWN_CACHE_TTL_S,
+)
+
+
+@lru_cache(maxsize=1)
+def known_store() -> KnownVocabularyStore:
+    return KnownVocabularyStore(SBKnownIO(), vocabulary())
+
+
+def get_known_lemmas(user_id: Optional[str], lang: str) -> Optional[KnownLemmas]:
+    """
+    Known-lemma filter of a user (None: no user).
+    """
+    if not user_id:
+        return None
+    store = known_store()
+    bitset = _bitsets.get_or_load(
+        (user_id, lang), lambda: store.get(user_id, lang)
+    )
+    return KnownLemmas(bitset, store.vocabulary)
+
+
+def add_known(user_id: str, lang: str, lemmas: List[str]) -> int:
+    count = known_store().add(user_id, lang, lemmas)
+    _bitsets.invalidate((user_id, lang))
+    return count
+
+
+def remove_known(user_id: str, lang: str, lemmas: List[str]) -> int:
+    count = known_store().remove(user_id, lang, lemmas)
+    _bitsets.invalidate((user_id, lang))
+    return count
+
+
+def list_known(user_id: str, lang: str) -> List[str]:
+    return known_store().list_lemmas(user_id, lang)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,157 @@
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from core.ports import DeckIO
+from domain.translator.translator import TRANS_VERSION
+from infra.memory.bloom_filter import BloomFilter
+from infra.tiered.deck_io import TieredDeckIO
+
+# Negative cache over cached_translations ids, shared by workers via a snapshot
+TRANSLATION_BLOOM_ENABLED = os.getenv("TRANSLATION_BLOOM_ENABLED", "1") == "1"
+TRANSLATION_BLOOM_PATH = os.getenv(
+    "TRANSLATION_BLOOM_PATH", ".cache/translation_bloom.bin"
+)
+TRANSLATION_BLOOM_FP_RATE = float(os.getenv("TRANSLATION_BLOOM_FP_RATE", "0.01"))
+# Filters older than this are reloaded from the snapshot or rebuilt
+TRANSLATION_BLOOM_MAX_AGE_S = float(os.getenv("TRANSLATION_BLOOM_MAX_AGE_S", "3600"))
+
+# Room for ids upserted until the next rebuild at the target rate
+CAPACITY_HEADROOM = 2
+MIN_CAPACITY = 100_000
+
+_lock = threading.Lock()
+# Background rebuild of this process, if one is running
+_rebuild: Optional[threading.Thread] = None
+
+
+def rebuild_translation_bloom(
+    deck_io: DeckIO,
+    path: str = TRANSLATION_BLOOM_PATH,
+    fp_rate: float = TRANSLATION_BLOOM_FP_RATE,
+) -> BloomFilter:
+    """
+    Build the filter from every id in the store and write its snapshot.
+    built_at and the watermark are taken before the scan, so ids written
+    during it count as newer than the filter.
+    """
+    started = time.time()
+    watermark = deck_io.last_cache_write() or 0.0
+    ids = list(deck_io.iter_cache_ids())
+    bloom = BloomFilter(
+        max(MIN_CAPACITY, CAPACITY_HEADROOM * len(ids)),
+        fp_rate,
+        TRANS_VERSION,
+        built_at=started,
+        watermark=watermark,
+    )
+    bloom.add(ids)
+    bloom.save(path)
+    logging.info(
+        f"Rebuilt translation Bloom filter: {len(ids)} ids, "
+        f"{len(bloom.bits)} bytes, {time.time() - started:.2f}s"
+    )
+    return bloom
+
+
+def load_translation_bloom(
+    path: str = TRANSLATION_BLOOM_PATH,
+    max_age: float = TRANSLATION_BLOOM_MAX_AGE_S,
+) -> Optional[BloomFilter]:
+    """
+    Snapshot at path if it exists, is of this TRANS_VERSION and is fresh.
+    """
+    try:
+        bloom = BloomFilter.load(path)
+    except FileNotFoundError:
+        return None
+    except (ValueError, OSError) as e:
+        logging.warning(f"Ignoring translation Bloom snapshot {path}: {e}")
+        return None
+    if bloom.version != TRANS_VERSION or time.time() - bloom.built_at > max_age:
+        return None
+    return bloom
+
+
+def _acquire_rebuild_lock(path: str, max_age: float) -> bool:
+    """
+    Node-wide: one rebuild per snapshot path across worker processes. A lock
+    older than max_age is left over from a crashed rebuild and taken over.
+    """
+    lock_path = f"{path}.lock"
+    if os.path.dirname(lock_path):
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    for _ in range(2):
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) <= max_age:
+                    return False
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+    return False
+
+
+def _rebuild_in_background(deck_io: TieredDeckIO, path: str, max_age: float) -> None:
+    if not _acquire_rebuild_lock(path, max_age):
+        return  # another worker is rebuilding; its snapshot is loaded next time
+    try:
+        deck_io.set_negative(rebuild_translation_bloom(deck_io.l3, path))
+    except Exception as e:
+        logging.warning(f"Failed to rebuild translation Bloom filter: {e}")
+    finally:
+        try:
+            os.remove(f"{path}.lock")
+        except FileNotFoundError:
+            pass
+
+
+def refresh_translation_bloom(
+    deck_io: TieredDeckIO,
+    path: str = TRANSLATION_BLOOM_PATH,
+    max_age: float = TRANSLATION_BLOOM_MAX_AGE_S,
+) -> Optional[threading.Thread]:
+    """
+    Keep deck_io's negative filter fresh without blocking the caller: a stale
+    one is replaced by the node's snapshot (written by any worker or by
+    running this module) or, when there is no fresh snapshot, rebuilt from
+    Supabase on a background thread, which is returned. Meanwhile deck_io
+    keeps what it has; a filter only skips L3 once it covers L3's last
+    write (see TieredDeckIO), so an old one costs lookups, not correctness.
+    """
+    global _rebuild
+    if not TRANSLATION_BLOOM_ENABLED:
+        return None
+    current = deck_io.negative
+    if current is not None and time.time() - current.built_at <= max_age:
+        return None
+    with _lock:
+        if deck_io.negative is not current:
+            return None  # refreshed by another thread meanwhile
+        bloom = load_translation_bloom(path, max_age)
+        if bloom is not None:
+            deck_io.set_negative(bloom)
+            return None
+        if _rebuild is not None and _rebuild.is_alive():
+            return None
+        _rebuild = threading.Thread(
+            target=_rebuild_in_background,
+            args=(deck_io, path, max_age),
+            name="translation-bloom",
+            daemon=True,
+        )
+        _rebuild.start()
+        return _rebuild
+
+
+if __name__ == "__main__":
+    # Periodic rebuild, e.g. from cron: python -m pipelines.translation_bloom
+    from infra.supabase.deck_repo import SBDeckIO
+
+    logging.basicConfig(level=logging.INFO)
+    rebuild_translation_bloom(SBDeckIO())
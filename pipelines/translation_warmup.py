@@ -0,0 +1,172 @@
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional
+
+from common.schemas import BuildDeckRequest
+from core.ports import DeckIO, FailedTranslationIO
+from domain.deck.deck_generation.lexicon_processing import (
+    pick_until_target,
+    select_candidates,
+    select_example,
+)
+from domain.deck.deck_generation.scoring import rank_candidates
+from domain.deck.schemas.schema import Candidate
+from domain.nlp.lexicon.index import LexiconIndex
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.translator.scheduler import TranslationScheduler
+from domain.translator.translation import (
+    find_cached_translation_batch,
+    translate_selection,
+)
+from domain.translator.translator import Translator
+from infra.supabase.failed_translation_repo import SBFailedTranslationIO
+from pipelines.deck_pipeline import scoring_corpus, tiered_deck_io
+
+# Opt-in: pre-translate the default deck of every analysed episode
+WARM_TRANSLATIONS = os.getenv("WARM_TRANSLATIONS", "0") == "1"
+WARM_TARGET_LANGS = [
+    lang for lang in os.getenv("WARM_TARGET_LANGS", "EN-GB").split(",") if lang
+]
+# Candidates warmed per target language and characters sent per job
+WARM_TOP_N = int(os.getenv("WARM_TOP_N", "200"))
+WARM_CHAR_BUDGET = int(os.getenv("WARM_CHAR_BUDGET", "20000"))
+# One request at a time at this rate. Deck builds each run their own
+# scheduler (TRANSLATE_RATE_PER_S), so warm-up requests do not wait for
+# interactive ones: this rate comes on top of theirs and must leave room
+# for it within the DeepL quota
+WARM_RATE_PER_S = float(os.getenv("WARM_RATE_PER_S", "1"))
+
+# One warm-up at a time per process; further jobs wait for the running one
+_warm_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="warmup")
+
+
+def warmup_scheduler(translator: Translator) -> TranslationScheduler:
+    """
+    Separate scheduler for warm-ups: its requests add to the interactive
+    ones, at most one in flight and WARM_RATE_PER_S per second per process.
+    """
+    return TranslationScheduler(translator, max_workers=1, rate=WARM_RATE_PER_S)
+
+
+def _default_request(job_id: str, target_lang_tag: str) -> BuildDeckRequest:
+    return BuildDeckRequest(
+        job_id=job_id,
+        deck_name="warmup",
+        target_lang_tag=target_lang_tag,
+        build_version="warmup",
+    )
+
+
+def _cost(candidate: Candidate) -> int:
+    # Sent as the example sentence with the form tagged; shared sentences are
+    # grouped, so this is an upper bound
+    return len(candidate.sentence_original_lang) + len("<i></i>")
+
+
+def _within_budget(candidates: List[Candidate], budget: int) -> List[Candidate]:
+    """
+    Longest prefix (in rank order) whose tagged sentences fit in budget chars.
+    """
+    picked = []
+    for c in candidates:
+        cost = _cost(c)
+        if cost > budget:
+            break
+        budget -= cost
+        picked.append(c)
+    return picked
+
+
+def warm_translation_cache(
+    analyzed_episode: AnalyzedEpisode,
+    job_id: str,
+    translator: Translator,
+    deck_io: DeckIO,
+    target_langs: Optional[List[str]] = None,
+    top_n: int = WARM_TOP_N,
+    char_budget: int = WARM_CHAR_BUDGET,
+    scheduler: Optional[TranslationScheduler] = None,
+    failures: Optional[FailedTranslationIO] = None,
+    index: Optional[LexiconIndex] = None,
+) -> dict[str, Any]:
+    """
+    Translate the examples a default deck request would pick, so the first
+    deck build of the episode is served from the translation cache.
+    Args:
+        target_langs (list[str]): Languages to warm, WARM_TARGET_LANGS if None.
+        top_n (int): Top candidates (default ranking) warmed per language.
+        char_budget (int): Characters of uncached tagged sentences sent for
+            the whole job; candidates beyond it are left to the deck build.
+        scheduler (TranslationScheduler): warmup_scheduler() if None.
+    """
+    if target_langs is None:
+        target_langs = WARM_TARGET_LANGS
+    scheduler = scheduler or warmup_scheduler(translator)
+    stats = {"warm_candidates": 0, "warm_cached": 0, "warm_sent": 0, "warm_chars": 0}
+
+    for target_lang_tag in target_langs:
+        req = _default_request(job_id, target_lang_tag)
+        candidates = select_candidates(analyzed_episode, req, index=index)
+        ranked, scores = rank_candidates(
+            candidates, req.difficulty_scoring, scoring_corpus()
+        )
+        selection, _ = pick_until_target(
+            ranked,
+            top_n,
+            req.target_coverage,
+            req.max_share_per_pos,
+            req.target_share_per_pos,
+            scores=scores,
+        )
+        selection = select_example(selection, req, analyzed_episode)
+        cached, missing = find_cached_translation_batch(selection, deck_io)
+        to_send = _within_budget(missing, char_budget)
+        char_budget -= sum(_cost(c) for c in to_send)
+        if to_send:
+            translate_selection(
+                to_send, translator, deck_io, scheduler=scheduler, failures=failures
+            )
+
+        stats["warm_candidates"] += len(selection)
+        stats["warm_cached"] += len(cached)
+        stats["warm_sent"] += len(to_send)
+        logging.info(
+            f"Warm-up {job_id} ({target_lang_tag}): {len(cached)} of"
+            f" {len(selection)} cached, {len(to_send)} sent"
+        )
+
+    stats["warm_chars"] = scheduler.stats()["chars"]
+    return stats
+
+
+def _run_warmup(job_id: str, analyzed_episode: AnalyzedEpisode) -> dict[str, Any]:
+    try:
+        stats = warm_translation_cache(
+            analyzed_episode,
+            job_id,
+            Translator(),
+            tiered_deck_io(),
+            failures=SBFailedTranslationIO(),
+        )
+    except Exception:
+        # Best effort: the deck build translates whatever is missing
+        logging.exception(f"Translation warm-up failed for job: {job_id}")
+        return {}
+    logging.info(f"Translation warm-up stats for job {job_id}: {stats}")
+    return stats
+
+
+def schedule_translation_warmup(
+    job_id: str, analyzed_episode: AnalyzedEpisode
+) -> Optional[Future]:
+    """
+    Queue the warm-up of a succeeded analysis in the background, if enabled.
+    """
+    if not WARM_TRANSLATIONS or not WARM_TARGET_LANGS:
+        return None
+    return _warm_pool.submit(_run_warmup, job_id, analyzed_episode)
+
+
+if __name__ == "__main__":
+    pass
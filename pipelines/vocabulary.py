@@ -0,0 +1,35 @@
+import logging
+import os
+from functools import lru_cache
+
+from domain.nlp.lexicon.index import LexiconIndex
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.vocab.vocabulary import Vocabulary
+from infra.supabase.vocabulary_repo import SBVocabularyIO
+
+# Ids cached in process per (lang, kind); a full table is dropped and re-read
+VOCABULARY_CACHE_MAX_ENTRIES = int(os.getenv("VOCABULARY_CACHE_MAX_ENTRIES", "200000"))
+
+
+@lru_cache(maxsize=1)
+def vocabulary() -> Vocabulary:
+    """
+    Process-wide vocabulary backed by the persisted id tables.
+    """
+    return Vocabulary(SBVocabularyIO(), max_entries=VOCABULARY_CACHE_MAX_ENTRIES)
+
+
+def register_analysis(analyzed_episode: AnalyzedEpisode) -> None:
+    """
+    Assign vocabulary ids to the lemmas of a new analysis (worker side), so
+    preview and deck builds only read them. Best effort: a lemma without an
+    id is just never known until a user marks it.
+    """
+    try:
+        LexiconIndex.build(analyzed_episode, vocabulary(), create=True)
+    except Exception as e:
+        logging.warning(f"Failed to register analysis vocabulary: {e}")
+
+
+if __name__ == "__main__":
+    pass
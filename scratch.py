@@ -3,7 +3,7 @@ from unittest.mock import MagicMock
 from core.ports import DeckIO
 from domain.deck.deck_generation.translator.translation import (
     _create_id_translation_cache,
-    _find_cached_translation_batch,
+    find_cached_translation_batch,
 )
 from domain.deck.schemas.schema import Candidate
 
@@ -44,7 +44,7 @@ ids = {
 }
 mock_deck_io.get_cached.return_value = ids
 # Execute
-cached_translation, to_translate = _find_cached_translation_batch(
+cached_translation, to_translate = find_cached_translation_batch(
     candidates, mock_deck_io
 )
 
@@ -0,0 +1,92 @@
+import ast
+import json
+
+import pytest
+
+from domain.nlp.lexicon.artifact import (
+    FORMAT_VERSION,
+    MAGIC,
+    decode_analysis,
+    dump_analysis,
+    encode_analysis,
+    load_analysis,
+)
+from domain.nlp.lexicon.examples import index_examples
+from domain.nlp.lexicon.schema import AnalyzedEpisode, LemmaSV, Stats
+
+
+def _preview_episode() -> AnalyzedEpisode:
+    with open("tests/integ/data_preview.txt", "r", encoding="utf-8") as f:
+        loaded_analysis = json.loads(ast.literal_eval(f.read()))
+    return AnalyzedEpisode(episode_name="BonusFam", **loaded_analysis)
+
+
+def _small_episode() -> AnalyzedEpisode:
+    shared = "Hunden och hundarna springer."
+    return AnalyzedEpisode(
+        episode_name="ep1",
+        episode_data_processed={
+            "hund": LemmaSV(
+                pos="NOUN",
+                forms=["hunden", "hundarna"],
+                examples={"hunden": [shared], "hundarna": [shared, "Två hundar."]},
+                forms_freq={"hunden": 3, "hundarna": 1},
+                forms_cov={"hunden": 0.75, "hundarna": 0.25},
+                lang="sv",
+                artikel="en",
+                gender="Com",
+            ),
+            "och": LemmaSV(
+                pos="CCONJ",
+                forms=["och"],
+                examples={},
+                to_learn=False,
+                lang="sv",
+            ),
+        },
+        stats=Stats(
+            total_tokens=5, total_types=3, total_lemas=2, examples_dropped=4
+        ),
+    )
+
+
+@pytest.mark.parametrize("make_episode", [_small_episode, _preview_episode])
+def test_binary_round_trip(make_episode):
+    episode = make_episode()
+
+    decoded = decode_analysis(encode_analysis(episode))
+
+    assert decoded.model_dump() == episode.model_dump()
+    assert decoded.model_dump_json() == episode.model_dump_json()
+
+
+def test_binary_round_trip_with_example_index():
+    episode = _preview_episode()
+    lexicon = index_examples(episode.episode_data_processed)
+    # Mixed with lemmas from analyses that predate the example index
+    lexicon.update(_small_episode().episode_data_processed)
+
+    decoded = decode_analysis(encode_analysis(episode))
+
+    assert decoded.model_dump() == episode.model_dump()
+
+
+def test_binary_is_smaller_than_json():
+    episode = _preview_episode()
+
+    assert len(dump_analysis(episode, "binary")) < len(dump_analysis(episode, "json"))
+
+
+def test_load_analysis_reads_both_formats():
+    episode = _small_episode()
+
+    for fmt in ("binary", "json"):
+        assert load_analysis(dump_analysis(episode, fmt)) == episode
+
+
+def test_decode_rejects_unknown_version():
+    data = bytearray(encode_analysis(_small_episode()))
+    data[len(MAGIC)] = FORMAT_VERSION + 1
+
+    with pytest.raises(ValueError):
+        decode_analysis(bytes(data))
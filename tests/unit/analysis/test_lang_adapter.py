@@ -0,0 +1,105 @@
+from domain.nlp.lang.lang_adapter import LangAdapter
+from domain.nlp.lexicon.examples import ExampleSampler
+from domain.nlp.lexicon.schema import LemmaBase, SentenceRec
+
+SENTENCES = [
+    SentenceRec(text="Fanny och Alexander", meta={}),
+    SentenceRec(text="Så det blir jobbigt för andra och Fanny.", meta={}),
+    SentenceRec(text="Andra veckan är det familjeliv.", meta={}),
+]
+
+
+def _lexicon():
+    return {
+        "fanny": LemmaBase(pos="NOUN", forms=["Fanny"], examples={}),
+        "andra": LemmaBase(pos="PRON", forms=["andra", "Andra"], examples={}),
+        "annan": LemmaBase(pos="ADJ", forms=["andra"], examples={}),
+        "familjeliv": LemmaBase(pos="NOUN", forms=["familjeliv"], examples={}),
+    }
+
+
+def test_attach_examples_uses_case_insensitive_form_index():
+    lexicon = LangAdapter.attach_examples(SENTENCES, _lexicon())
+
+    assert lexicon["fanny"].examples == {
+        "Fanny": [SENTENCES[0].text, SENTENCES[1].text]
+    }
+    # Form shared by two lemmas is attached to both, keyed by surface casing
+    for lemma in ("andra", "annan"):
+        assert lexicon[lemma].examples == {
+            "andra": [SENTENCES[1].text],
+            "Andra": [SENTENCES[2].text],
+        }
+    assert lexicon["familjeliv"].examples == {"familjeliv": [SENTENCES[2].text]}
+
+
+def test_attach_examples_caps_examples_per_form():
+    lexicon = LangAdapter.attach_examples(
+        SENTENCES, _lexicon(), max_examples_per_form=1
+    )
+    again = LangAdapter.attach_examples(
+        SENTENCES, _lexicon(), max_examples_per_form=1
+    )
+
+    # Seeded sample of the form's sentences: capped and reproducible
+    (example,) = lexicon["fanny"].examples["Fanny"]
+    assert example in (SENTENCES[0].text, SENTENCES[1].text)
+    assert again["fanny"].examples == lexicon["fanny"].examples
+
+
+def _lines(n: int):
+    return [SentenceRec(text=f"Det var dag {i}.", meta={}) for i in range(n)]
+
+
+def test_sampler_keeps_uniform_sample_in_sentence_order():
+    lines = _lines(200)
+    lexicon = {"vara": LemmaBase(pos="VERB", forms=["var"], examples={})}
+    sampler = ExampleSampler(cap=10, seed=7)
+
+    LangAdapter.attach_examples(lines, lexicon, sampler=sampler)
+
+    kept = lexicon["vara"].examples["var"]
+    order = [line.text for line in lines]
+    assert len(kept) == 10
+    assert kept == sorted(kept, key=order.index)
+    assert kept[-1] != order[9]  # not simply the first ten lines
+    assert sampler.dropped == 190
+
+
+def test_sampler_skips_near_duplicate_lines_only_when_bounded():
+    lines = [
+        SentenceRec(text=text, meta={})
+        for text in ("Fanny och Alexander", "Fanny, och ALEXANDER!", "Fanny kom.")
+    ]
+    lexicon = {"fanny": LemmaBase(pos="NOUN", forms=["Fanny"], examples={})}
+    sampler = ExampleSampler(cap=10)
+
+    LangAdapter.attach_examples(lines, lexicon, sampler=sampler)
+
+    assert lexicon["fanny"].examples["Fanny"] == ["Fanny och Alexander", "Fanny kom."]
+    assert sampler.dropped == 1
+
+    # Uncapped output is unchanged: every occurrence is kept
+    lexicon = {"fanny": LemmaBase(pos="NOUN", forms=["Fanny"], examples={})}
+    LangAdapter.attach_examples(lines, lexicon, sampler=ExampleSampler(cap=None))
+    assert lexicon["fanny"].examples["Fanny"] == [line.text for line in lines]
+
+
+def test_sampler_budget_shrinks_largest_forms_first():
+    lines = _lines(30) + [SentenceRec(text="En ny dag.", meta={})]
+    lexicon = {
+        "vara": LemmaBase(pos="VERB", forms=["var"], examples={}),
+        "dag": LemmaBase(pos="NOUN", forms=["dag"], examples={}),
+        "ny": LemmaBase(pos="ADJ", forms=["ny"], examples={}),
+    }
+    sampler = ExampleSampler(cap=20, budget=13)
+
+    LangAdapter.attach_examples(lines, lexicon, sampler=sampler)
+
+    sizes = {
+        form: len(examples)
+        for data in lexicon.values()
+        for form, examples in data.examples.items()
+    }
+    assert sizes == {"var": 6, "dag": 6, "ny": 1}
+    assert sampler.dropped == 30 + 31 + 1 - 13
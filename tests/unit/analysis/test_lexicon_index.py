@@ -0,0 +1,85 @@
+import ast
+import json
+
+import numpy as np
+import pytest
+
+from common.schemas import PreviewBuildDeckRequest
+from domain.deck.deck_generation.lexicon_processing import select_candidates
+from domain.nlp.lexicon.artifact import dump_analysis, load_analysis
+from domain.nlp.lexicon.index import LexiconIndex
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.vocab.vocabulary import Vocabulary
+
+
+def _episode() -> AnalyzedEpisode:
+    with open("tests/integ/data_preview.txt", "r", encoding="utf-8") as f:
+        loaded_analysis = json.loads(ast.literal_eval(f.read()))
+    return AnalyzedEpisode(episode_name="BonusFam", **loaded_analysis)
+
+
+def test_vocabulary_assigns_stable_local_ids():
+    vocabulary = Vocabulary()
+
+    first = vocabulary.ids("sv", "lemma", ["vara", "hej", "vara"], create=True)
+    second = vocabulary.ids("sv", "lemma", ["hej", "ny"], create=True)
+
+    assert first.tolist() == [0, 1, 0]
+    assert second.tolist() == [1, 2]
+    assert vocabulary.ids("sv", "lemma", ["okänd"]).tolist() == [-1]
+    assert vocabulary.ids("en", "lemma", ["hej"], create=True).tolist() == [0]
+    assert vocabulary.values("sv", "lemma", [2, 0]) == ["ny", "vara"]
+
+
+def test_index_is_shared_across_analyses():
+    vocabulary = Vocabulary()
+    episode = _episode()
+    reader = LexiconIndex.build(episode, vocabulary)
+    assert (reader.lemma_ids == -1).all()
+    assert vocabulary.stats() == {"sv/lemma": 0}
+
+    a = LexiconIndex.build(episode, vocabulary, create=True)
+    b = LexiconIndex.build(episode, vocabulary)
+
+    assert a.lemma_ids.tolist() == b.lemma_ids.tolist()
+    assert vocabulary.stats()["sv/lemma"] == len(episode.episode_data_processed)
+    assert a.lemmas(np.arange(3)) == list(episode.episode_data_processed)[:3]
+    first = next(iter(episode.episode_data_processed.values()))
+    assert b.forms(np.array([0])) == [list(dict.fromkeys(first.forms))]
+
+
+@pytest.mark.parametrize(
+    "pos", [{}, {"NOUN": 1.0}, {"NOUN": 0.5, "VERB": 0.3, "ADJ": 0.2}]
+)
+def test_select_candidates_matches_lexicon(pos):
+    episode = _episode()
+    lexicon = episode.episode_data_processed
+    excluded = list(lexicon)[::4]
+    req = PreviewBuildDeckRequest(
+        job_id="j", target_share_per_pos=pos, exclude_known_lemmas=excluded
+    )
+
+    candidates = select_candidates(episode, req)
+
+    expected = [
+        lemma
+        for lemma, data in lexicon.items()
+        if (not pos or data.pos in pos) and lemma not in excluded
+    ]
+    assert [c.lemma for c in candidates] == expected
+    for c in candidates:
+        data = lexicon[c.lemma]
+        assert c.pos == data.pos
+        assert sorted(c.forms) == sorted(set(data.forms))
+        assert c.freq == sum(data.forms_freq.values())
+        assert c.cov_share_source == sum(data.forms_cov.values())
+        assert c.source_lang_tag == data.lang
+
+
+def test_decoded_analyses_share_strings():
+    data = dump_analysis(_episode())
+
+    a, b = load_analysis(data), load_analysis(data)
+
+    for la, lb in zip(a.episode_data_processed, b.episode_data_processed):
+        assert la is lb
@@ -0,0 +1,50 @@
+import io
+
+from domain.nlp.content.srt_adapter import SRTAdapter
+
+SRT = b"""1
+00:01:10,438 --> 00:01:15,234
+<i>Olen ar god.</i>
+- Det finns en del fordelar med
+
+2
+00:01:15,651 --> 00:01:18,779
+att bo har.
+- Du kommer for sent.
+
+"""
+
+
+def test_iter_sentences_carries_cue_times():
+    adapter = SRTAdapter()
+
+    sentences = list(adapter.iter_sentences(SRT))
+
+    assert [(s.text, s.meta) for s in sentences] == [
+        ("Olen ar god.", {"start": 70.438, "end": 75.234}),
+        (
+            "Det finns en del fordelar med att bo har.",
+            {"start": 70.438, "end": 78.779},
+        ),
+        ("Du kommer for sent.", {"start": 75.651, "end": 78.779}),
+    ]
+
+
+def test_iter_sentences_matches_clean_for_sentence():
+    adapter = SRTAdapter()
+    with open("tests/unit/analysis/ep1.srt", "rb") as f:
+        raw = f.read()
+
+    streamed = list(adapter.iter_sentences(io.BytesIO(raw)))
+
+    assert streamed == adapter.clean_for_sentence(raw)
+    assert len(streamed) > 0
+
+
+def test_iter_sentences_does_not_close_file_object():
+    adapter = SRTAdapter()
+    f = io.BytesIO(SRT)
+
+    list(adapter.iter_sentences(f))
+
+    assert not f.closed
@@ -0,0 +1,50 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from domain.nlp.lang.sv.sv_lang_adapter import SVLangAdapter
+from domain.nlp.lexicon.schema import NLPToken
+
+WORDS = [f"ord{i}" for i in range(25)]
+
+
+def _fake_analyse(self, words):
+    # Later shards finish first, so merge order is not completion order
+    time.sleep(0.001 * (len(WORDS) - int(words[0][3:])) / len(WORDS))
+    return {
+        w: [NLPToken(form=w, lemma=w.upper(), pos="NOUN", other={})] for w in words
+    }
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=4)
+    started = []
+
+    def get_pool(cls, workers):
+        started.append(workers)
+        return executor
+
+    monkeypatch.setattr(SVLangAdapter, "_analyse", _fake_analyse)
+    monkeypatch.setattr(SVLangAdapter, "_get_pool", classmethod(get_pool))
+    yield started
+    executor.shutdown()
+
+
+def test_parallel_tokenize_matches_serial_in_input_order(pool):
+    serial = SVLangAdapter().tokenize(WORDS)
+    adapter = SVLangAdapter(workers=4, shard_size=3)
+    parallel = adapter.tokenize(WORDS)
+
+    assert pool == [4]
+    assert list(adapter._analyse_parallel(WORDS)) == WORDS
+    assert parallel == serial
+    assert [t.form for t in parallel] == WORDS
+
+
+def test_input_up_to_shard_size_stays_serial(pool):
+    tokens = SVLangAdapter(workers=4, shard_size=len(WORDS)).tokenize(WORDS)
+
+    assert pool == []
+    assert [t.form for t in tokens] == WORDS
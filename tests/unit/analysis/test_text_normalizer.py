@@ -0,0 +1,34 @@
+from domain.nlp.content.text_normalizer import TextNormalizer
+
+
+def test_clean_line_strips_tags_and_dialogue_dashes():
+    normalizer = TextNormalizer()
+
+    assert normalizer.clean_line("<i>- och så har jag ju Hazel.</i>") == (
+        "och så har jag ju Hazel."
+    )
+    assert normalizer.clean_line("- -Hej") == "Hej"
+    assert normalizer.clean_line("semi-detached") == "semi-detached"
+
+
+def test_split_sentences_keeps_abbreviations():
+    normalizer = TextNormalizer()
+
+    assert normalizer.split_sentences("Dr. Berg är här. Ölen är god! e.g. Nej") == [
+        "Dr. Berg är här.",
+        "Ölen är god!",
+        "e.g. Nej",
+    ]
+
+
+def test_words_lowercases_and_drops_non_alpha():
+    normalizer = TextNormalizer()
+
+    assert normalizer.words(["Hej, Åsa!", "Klockan är 5...", "tv-serie"]) == [
+        "hej",
+        "åsa",
+        "klockan",
+        "är",
+        "tv",
+        "serie",
+    ]
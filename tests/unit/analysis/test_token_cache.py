@@ -0,0 +1,66 @@
+import multiprocessing
+
+from domain.nlp.lexicon.schema import NLPToken
+from infra.sqlite.token_cache import SqliteTokenCache
+
+
+def _tokens(form: str, lemma: str) -> list[NLPToken]:
+    return [NLPToken(form=form, lemma=lemma, pos="NOUN", other={"artikel": "en"})]
+
+
+def test_round_trip_and_hit_rate(tmp_path):
+    cache = SqliteTokenCache(str(tmp_path / "tokens.sqlite3"))
+
+    cache.put_many("v1", {"katten": _tokens("katten", "katt")})
+    found = cache.get_many("v1", ["katten", "hunden"])
+
+    assert found == {"katten": _tokens("katten", "katt")}
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_entries_are_isolated_by_model_version(tmp_path):
+    cache = SqliteTokenCache(str(tmp_path / "tokens.sqlite3"))
+
+    cache.put_many("v1", {"katten": _tokens("katten", "katt")})
+
+    assert cache.get_many("v2", ["katten"]) == {}
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = SqliteTokenCache(str(tmp_path / "tokens.sqlite3"), max_entries=10)
+    forms = [f"w{i}" for i in range(10)]
+    for form in forms:
+        cache.put_many("v1", {form: _tokens(form, form)})
+
+    cache.get_many("v1", ["w0"])  # w1, w2 become least recently used
+    cache.put_many("v1", {"new": _tokens("new", "new")})
+
+    # Over the limit: evicted down to 90% of max_entries
+    assert set(cache.get_many("v1", forms + ["new"])) == (
+        set(forms) - {"w1", "w2"}
+    ) | {"new"}
+
+
+def _write_forms(path: str, worker: int) -> None:
+    cache = SqliteTokenCache(path)
+    for i in range(20):
+        form = f"w{worker}_{i}"
+        cache.put_many("v1", {form: _tokens(form, form)})
+
+
+def test_concurrent_writers(tmp_path):
+    path = str(tmp_path / "tokens.sqlite3")
+    SqliteTokenCache(path).get_many("v1", [])  # create schema up front
+
+    processes = [
+        multiprocessing.Process(target=_write_forms, args=(path, worker))
+        for worker in range(4)
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+
+    forms = [f"w{worker}_{i}" for worker in range(4) for i in range(20)]
+    assert all(p.exitcode == 0 for p in processes)
+    assert len(SqliteTokenCache(path).get_many("v1", forms)) == 80
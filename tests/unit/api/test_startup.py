@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+
+# The web tier only registers jobs and serves previews
+HEAVY_MODULES = ("stanza", "torch", "deepl")
+# Cumulative `python -X importtime` budget for api.app, in microseconds
+IMPORT_BUDGET_US = 3_000_000
+
+BOOT = """
+import json, sys
+from fastapi.testclient import TestClient
+from api.app import app
+
+response = TestClient(app).get("/health")
+print(json.dumps({"status": response.status_code, "modules": sorted(sys.modules)}))
+"""
+
+
+def _boot_api() -> subprocess.CompletedProcess:
+    env = {
+        **os.environ,
+        "SUPABASE_URL": os.environ.get("SUPABASE_URL", "http://localhost:54321"),
+        "SUPABASE_SERVICE_KEY": os.environ.get("SUPABASE_SERVICE_KEY", "test"),
+    }
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOT],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+        check=True,
+    )
+
+
+def _cumulative_us(importtime_log: str, module: str) -> int:
+    for line in importtime_log.splitlines():
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+def test_api_boots_without_ml_stack():
+    result = _boot_api()
+    boot = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert boot["status"] == 200
+    loaded = {name.split(".")[0] for name in boot["modules"]}
+    assert not loaded & set(HEAVY_MODULES)
+    assert _cumulative_us(result.stderr, "api.app") < IMPORT_BUDGET_US
@@ -0,0 +1,151 @@
+import ast
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from common.schemas import BuildDeckRequest
+from core.ports import DeckIO
+from domain.nlp.lexicon.artifact import dump_analysis
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.translator.translator import Translator
+from infra.memory.lru_cache import LRUCache
+from pipelines import analysis_cache
+from pipelines.deck_pipeline import deck_pipeline, get_preview_stats
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_evicts_least_recently_used_by_size():
+    cache = LRUCache(max_entries=10, max_size=10, ttl=60, sizeof=len)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    cache.get("a")
+
+    cache.put("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 8
+
+
+def test_lru_expires_after_ttl():
+    clock = FakeClock()
+    cache = LRUCache(max_entries=10, max_size=10, ttl=5, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_get_or_load_is_single_flight():
+    cache = LRUCache(max_entries=10, max_size=10, ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("k", loader)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    assert cache.stats()["loads"] == 1
+
+
+def test_get_or_load_caches_before_releasing_the_key():
+    calls = []
+    late = []
+
+    def sizeof(value):
+        # A caller arriving between the load and the insert waits for both
+        thread = threading.Thread(
+            target=lambda: late.append(cache.get_or_load("k", loader))
+        )
+        thread.start()
+        late.append(thread)
+        time.sleep(0.05)
+        return 1
+
+    def loader():
+        calls.append(1)
+        return "value"
+
+    cache = LRUCache(max_entries=10, max_size=10, ttl=60, sizeof=sizeof)
+    assert cache.get_or_load("k", loader) == "value"
+    late[0].join()
+
+    assert late[1:] == ["value"]
+    assert len(calls) == 1
+
+
+def test_get_or_load_does_not_cache_errors():
+    cache = LRUCache(max_entries=10, max_size=10, ttl=60)
+
+    def failing():
+        raise RuntimeError("download failed")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("k", failing)
+
+    assert cache.get_or_load("k", lambda: "ok") == "ok"
+    assert cache.stats()["load_errors"] == 1
+
+
+def test_get_analysis_downloads_once_per_job_output():
+    episode = AnalyzedEpisode(episode_name="ep1", episode_data_processed={})
+
+    with patch.object(analysis_cache, "SBJobsIO") as jobs_io:
+        jobs_io.return_value.download_analysis.return_value = dump_analysis(episode)
+        jobs_io.return_value.get_analysis_version.return_value = "results/job-1@t1"
+        first = analysis_cache.get_analysis("job-1")
+        second = analysis_cache.get_analysis("job-1")
+        analysis_cache.get_lexicon_index("job-1")
+        # Re-analysed by the worker process: new output version, no stale hit
+        jobs_io.return_value.get_analysis_version.return_value = "results/job-1@t2"
+        third = analysis_cache.get_analysis("job-1")
+
+    assert first == episode
+    assert second is first
+    assert third is not first
+    assert jobs_io.return_value.download_analysis.call_count == 2
+
+
+def test_deck_pipeline_does_not_mutate_the_shared_analysis():
+    with open("tests/integ/data_preview.txt", "r", encoding="utf-8") as f:
+        loaded_analysis = json.loads(ast.literal_eval(f.read()))
+    from tests.integ.example_request import request
+
+    episode = AnalyzedEpisode(episode_name="BonusFam", **loaded_analysis)
+    before = episode.model_dump()
+    translator = MagicMock(spec=Translator)
+    translator.translate.side_effect = lambda texts, **kwargs: texts
+    deck_io = MagicMock(spec=DeckIO)
+    deck_io.get_cached.return_value = {}
+
+    deck_pipeline(episode, BuildDeckRequest(**request), translator, deck_io)
+    get_preview_stats(episode, BuildDeckRequest(**request))
+
+    assert episode.model_dump() == before
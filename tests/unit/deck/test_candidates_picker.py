@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from domain.deck.deck_generation.candidates_picker import pick_until_target
+from domain.deck.schemas.schema import Candidate
+from tests.legacy_picker import legacy_pick_until_target
+
+POS = ["NOUN", "VERB", "ADJ", "ADV", "PRON"]
+
+
+def _random_case(rng: random.Random):
+    n = rng.randint(0, 300)
+    # Coarse scores force ties between and within buckets
+    candidates = []
+    for i in range(n):
+        score = rng.choice([rng.random(), round(rng.random(), 1), 0.0])
+        candidates.append(
+            Candidate(
+                lemma=f"l{i}",
+                pos=rng.choice(POS),
+                forms=[f"l{i}"],
+                freq=1,
+                cov_share_source=score / 20,
+                score=score,
+            )
+        )
+
+    caps = None
+    if rng.random() < 0.6:
+        chosen = rng.sample(POS + ["X"], rng.randint(1, 4))
+        shares = [rng.random() for _ in chosen]
+        total = sum(shares) * rng.uniform(1.0, 1.5)
+        caps = {pos: share / total for pos, share in zip(chosen, shares)}
+
+    targets = None
+    if rng.random() < 0.7:
+        chosen = rng.sample(POS + ["X"], rng.randint(1, 5))
+        targets = {pos: rng.choice([0.0, rng.random()]) for pos in chosen}
+
+    return dict(
+        filtered_ranked=candidates,
+        max_cards=rng.choice([None, 0, 1, 10, 50, 500]),
+        target_coverage=rng.choice([None, 0.0, 0.3, 0.9, 1.0]),
+        max_share_per_pos=caps,
+        target_share_per_pos=targets,
+        hysteresis_eps=rng.choice([0.0, 0.02, 0.2]),
+        score_gap_delta=rng.choice([0.0, 0.15, 1.0]),
+    )
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_matches_legacy_picker(seed):
+    case = _random_case(random.Random(seed))
+
+    legacy_picked, legacy_report = legacy_pick_until_target(**case)
+    picked, report = pick_until_target(**case)
+
+    assert [c.lemma for c in picked] == [c.lemma for c in legacy_picked]
+    assert report == legacy_report
+    assert list(report["pos_counts"]) == list(legacy_report["pos_counts"])
+
+
+def _candidate(lemma: str, pos: str, score: float) -> Candidate:
+    return Candidate(
+        lemma=lemma, pos=pos, forms=[lemma], freq=1, cov_share_source=0.01, score=score
+    )
+
+
+def test_respects_caps_and_stops_at_max_cards():
+    candidates = [_candidate(f"n{i}", "NOUN", 1.0 - i / 100) for i in range(50)]
+    candidates += [_candidate(f"v{i}", "VERB", 0.5 - i / 100) for i in range(50)]
+
+    picked, report = pick_until_target(candidates, 10, None, {"NOUN": 0.5})
+
+    assert report["pos_counts"] == {"NOUN": 5, "VERB": 5}
+    assert report["stopped_reason"] == "max_cards"
+    assert [c.lemma for c in picked[:5]] == [f"n{i}" for i in range(5)]
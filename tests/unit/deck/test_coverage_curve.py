@@ -0,0 +1,147 @@
+import ast
+import json
+import random
+from unittest.mock import patch
+
+import pytest
+
+from common.schemas import PreviewBuildDeckRequest
+from domain.deck.deck_generation.candidates_picker import pick_until_target
+from domain.deck.deck_generation.coverage_curve import build_coverage_curve
+from domain.deck.deck_generation.lexicon_processing import (
+    score_and_rank,
+    select_candidates,
+)
+from domain.deck.schemas.schema import Candidate
+from domain.nlp.lexicon.index import LexiconIndex
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.vocab.vocabulary import Vocabulary
+from pipelines import deck_pipeline
+
+MAX_CARDS = [None, 1, 5, 20, 60, 1000]
+TARGET_COVERAGE = [None, 0.0, 0.1, 0.35, 0.5, 0.9, 1.0]
+CONFIGS = [
+    ({}, {"NOUN": 0.5, "VERB": 0.5}),
+    ({"NOUN": 0.6, "VERB": 0.2}, {"NOUN": 0.5, "VERB": 0.3, "ADJ": 0.2}),
+    ({"NOUN": 0.3}, {}),
+]
+
+
+def _episode() -> AnalyzedEpisode:
+    with open("tests/integ/data_preview.txt", "r", encoding="utf-8") as f:
+        loaded_analysis = json.loads(ast.literal_eval(f.read()))
+    return AnalyzedEpisode(episode_name="BonusFam", **loaded_analysis)
+
+
+@pytest.mark.parametrize("caps,targets", CONFIGS)
+def test_report_matches_picker_on_preview_data(caps, targets):
+    req = PreviewBuildDeckRequest(
+        job_id="job", max_share_per_pos=caps, target_share_per_pos=targets
+    )
+    ranked = score_and_rank(select_candidates(_episode(), req), req)
+
+    for max_cards in MAX_CARDS:
+        curve = build_coverage_curve(ranked, max_cards, caps, targets)
+        for target in TARGET_COVERAGE:
+            _, expected = pick_until_target(ranked, max_cards, target, caps, targets)
+            assert curve.report(max_cards, target) == expected
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_report_matches_picker_on_random_candidates(seed):
+    rng = random.Random(seed)
+    ranked = []
+    for i in range(rng.randint(0, 80)):
+        cov = rng.choice([0.0, rng.random() / 10, 0.05])
+        ranked.append(
+            Candidate(
+                lemma=f"l{i}",
+                pos=rng.choice(["NOUN", "VERB", "ADJ"]),
+                forms=[],
+                freq=1,
+                cov_share_source=cov,
+                score=cov,
+            )
+        )
+    caps = rng.choice([{}, {"NOUN": 0.4}, {"VERB": 0.2, "ADJ": 0.3}])
+    targets = rng.choice([{}, {"NOUN": 0.7, "VERB": 0.3}])
+    max_cards = rng.choice(MAX_CARDS)
+    curve = build_coverage_curve(ranked, max_cards, caps, targets)
+
+    for target in TARGET_COVERAGE + [rng.random()]:
+        _, expected = pick_until_target(ranked, max_cards, target, caps, targets)
+        assert curve.report(max_cards, target) == expected
+
+
+def test_points_follow_pick_order():
+    req = PreviewBuildDeckRequest(job_id="job", target_share_per_pos={"NOUN": 1.0})
+    ranked = score_and_rank(select_candidates(_episode(), req), req)
+    curve = build_coverage_curve(ranked, 10, {}, {"NOUN": 1.0})
+
+    points = curve.points(10)
+
+    assert points["cards"] == list(range(11))
+    assert points["coverage"][0] == 0.0
+    assert points["coverage"] == sorted(points["coverage"])
+    _, report = pick_until_target(ranked, 10, None, {}, {"NOUN": 1.0})
+    assert points["coverage"][-1] == report["achieved_coverage"]
+
+
+def test_run_preview_builds_curve_once():
+    episode = _episode()
+    targets = {"NOUN": 0.5, "VERB": 0.5}
+    requests = [
+        PreviewBuildDeckRequest(
+            job_id="curve-job",
+            target_share_per_pos=targets,
+            target_coverage=target,
+            max_cards=max_cards,
+        )
+        for target in (0.2, 0.5, 0.9)
+        for max_cards in (None, 30)
+    ]
+
+    index = LexiconIndex.build(episode, Vocabulary())
+
+    with patch.object(
+        deck_pipeline, "analysis_key", return_value=("curve-job", "v", "out@1")
+    ) as analysis_key, patch.object(
+        deck_pipeline, "get_analysis", return_value=episode
+    ), patch.object(
+        deck_pipeline, "get_lexicon_index", return_value=index
+    ), patch.object(
+        deck_pipeline, "select_candidates", wraps=select_candidates
+    ) as select:
+        reports = [deck_pipeline.run_preview(req) for req in requests]
+
+    assert select.call_count == 1
+    # One job output version lookup per request, shared by both loads
+    assert analysis_key.call_count == len(requests)
+    for req, report in zip(requests, reports):
+        ranked = score_and_rank(select_candidates(episode, req), req)
+        _, expected = pick_until_target(
+            ranked, req.max_cards, req.target_coverage, {}, targets
+        )
+        assert report == expected
+
+
+def test_run_preview_recomputes_after_reanalysis():
+    episode = _episode()
+    req = PreviewBuildDeckRequest(job_id="reanalysed-job", target_coverage=0.5)
+    index = LexiconIndex.build(episode, Vocabulary())
+    versions = [("reanalysed-job", "v", f"out@{t}") for t in (1, 1, 2)]
+
+    with patch.object(
+        deck_pipeline, "analysis_key", side_effect=versions
+    ), patch.object(
+        deck_pipeline, "get_analysis", return_value=episode
+    ), patch.object(
+        deck_pipeline, "get_lexicon_index", return_value=index
+    ), patch.object(
+        deck_pipeline, "select_candidates", wraps=select_candidates
+    ) as select:
+        for _ in versions:
+            deck_pipeline.run_preview(req)
+
+    # Same output version: cached; new one after the worker re-ran the job
+    assert select.call_count == 2
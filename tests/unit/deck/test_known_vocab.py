@@ -0,0 +1,145 @@
+import ast
+import json
+from typing import Dict, List, Optional
+
+from common.schemas import PreviewBuildDeckRequest
+from domain.deck.deck_generation.lexicon_processing import select_candidates
+from domain.nlp.lexicon.index import LexiconIndex
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.vocab.bitset import LemmaBitset
+from domain.vocab.known_store import KnownVocabularyStore
+from domain.vocab.vocabulary import Vocabulary
+
+
+class MemoryVocabularyIO:
+    def __init__(self):
+        self.tables: Dict[tuple, Dict[str, int]] = {}
+        self.calls = 0
+
+    def get_ids(self, lang: str, kind: str, values: List[str]) -> Dict[str, int]:
+        self.calls += 1
+        table = self.tables.get((lang, kind), {})
+        return {value: table[value] for value in values if value in table}
+
+    def create_ids(self, lang: str, kind: str, values: List[str]) -> Dict[str, int]:
+        table = self.tables.setdefault((lang, kind), {})
+        for value in values:
+            table.setdefault(value, len(table) + 1)
+        return self.get_ids(lang, kind, values)
+
+    def get_values(self, lang: str, kind: str, ids: List[int]) -> Dict[int, str]:
+        wanted = set(ids)
+        table = self.tables.get((lang, kind), {})
+        return {i: value for value, i in table.items() if i in wanted}
+
+
+class MemoryKnownIO:
+    def __init__(self):
+        self.known: Dict[tuple, bytes] = {}
+
+    def load_known(self, user_id: str, lang: str) -> Optional[bytes]:
+        return self.known.get((user_id, lang))
+
+    def save_known(self, user_id: str, lang: str, bitset: bytes, count: int) -> None:
+        self.known[(user_id, lang)] = bitset
+
+
+def _episode() -> AnalyzedEpisode:
+    with open("tests/integ/data_preview.txt", "r", encoding="utf-8") as f:
+        loaded_analysis = json.loads(ast.literal_eval(f.read()))
+    return AnalyzedEpisode(episode_name="BonusFam", **loaded_analysis)
+
+
+def test_bitset_add_remove_roundtrip():
+    bitset = LemmaBitset()
+    bitset.add([3, 17, 1000, 17])
+    bitset.remove([17, 5])
+
+    restored = LemmaBitset.from_bytes(bitset.to_bytes())
+
+    assert len(restored) == 2
+    assert restored.ids().tolist() == [3, 1000]
+    assert restored.contains([3, 17, 1000, 10**6, -1]).tolist() == [
+        True,
+        False,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_store_add_list_remove():
+    vocabulary = Vocabulary(MemoryVocabularyIO())
+    store = KnownVocabularyStore(MemoryKnownIO(), vocabulary)
+
+    assert store.add("u1", "sv", ["hej", "vara", "hej"]) == 2
+    assert store.add("u1", "sv", ["och"]) == 3
+    assert store.add("u2", "sv", ["och"]) == 1
+    assert store.remove("u1", "sv", ["vara", "okänd"]) == 2
+
+    assert sorted(store.list_lemmas("u1", "sv")) == ["hej", "och"]
+    assert store.list_lemmas("u1", "en") == []
+
+
+def test_known_lemmas_filter_matches_exclude_list():
+    episode = _episode()
+    lemmas = list(episode.episode_data_processed)
+    excluded = lemmas[::3]
+    vocabulary = Vocabulary(MemoryVocabularyIO())
+    store = KnownVocabularyStore(MemoryKnownIO(), vocabulary)
+    store.add("u1", "sv", excluded + ["not_in_episode"])
+    known = store.known_lemmas("u1", "sv")
+
+    by_list = select_candidates(
+        episode, PreviewBuildDeckRequest(job_id="j", exclude_known_lemmas=excluded)
+    )
+    by_bitset = select_candidates(episode, PreviewBuildDeckRequest(job_id="j"), known)
+
+    assert [c.lemma for c in by_bitset] == [c.lemma for c in by_list]
+    assert len(by_bitset) < len(lemmas)
+
+
+def test_vocabulary_persisted_ids_are_cached():
+    io = MemoryVocabularyIO()
+    vocabulary = Vocabulary(io)
+
+    ids = vocabulary.ids("sv", "lemma", ["hej", "och", "hej"], create=True)
+    calls = io.calls
+    again = vocabulary.ids("sv", "lemma", ["och", "hej"])
+
+    assert ids.tolist() == [1, 2, 1]
+    assert again.tolist() == [2, 1]
+    assert io.calls == calls
+    assert vocabulary.ids("sv", "lemma", ["okänd"]).tolist() == [-1]
+    assert Vocabulary(io).values("sv", "lemma", [2, 1]) == ["och", "hej"]
+
+
+def test_index_build_is_read_only_and_sees_lemmas_marked_later():
+    episode = _episode()
+    lemmas = list(episode.episode_data_processed)
+    io = MemoryVocabularyIO()
+    vocabulary = Vocabulary(io)
+    index = LexiconIndex.build(episode, vocabulary)
+    assert io.tables == {} and (index.lemma_ids == -1).all()
+
+    store = KnownVocabularyStore(MemoryKnownIO(), vocabulary)
+    store.add("u1", "sv", lemmas[:2])
+    candidates = select_candidates(
+        episode,
+        PreviewBuildDeckRequest(job_id="j"),
+        store.known_lemmas("u1", "sv"),
+        index,
+    )
+
+    assert [c.lemma for c in candidates] == lemmas[2:]
+
+
+def test_vocabulary_cache_is_capped_and_reread():
+    io = MemoryVocabularyIO()
+    vocabulary = Vocabulary(io, max_entries=3)
+    ids = vocabulary.ids("sv", "lemma", ["a", "b", "c"], create=True)
+
+    assert vocabulary.ids("sv", "lemma", ["d", "e"], create=True).tolist() == [4, 5]
+    assert vocabulary.stats()["sv/lemma"] == 2 and vocabulary.resets == 1
+    assert vocabulary.ids("sv", "lemma", ["a", "b", "c"]).tolist() == ids.tolist()
+    assert vocabulary.values("sv", "lemma", [5, 1]) == ["e", "a"]
@@ -0,0 +1,145 @@
+import ast
+import json
+from unittest.mock import MagicMock
+
+from common.schemas import BuildDeckRequest
+from core.ports import DeckIO
+from domain.deck.schemas.schema import Candidate
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.translator.lemma_translation import translate_lemmas
+from domain.translator.translator import Translator
+from pipelines.deck_pipeline import deck_pipeline
+
+
+class MemoryDeckIO:
+    def __init__(self):
+        self.rows = {}
+
+    def get_cached(self, ids):
+        return {i: self.rows[i] for i in ids if i in self.rows}
+
+    def upsert_cache_translation(self, cache_entries):
+        self.rows.update({entry["id"]: dict(entry) for entry in cache_entries})
+
+
+def _translator():
+    glossary = {"hus": "house", "Vi har ett hus.": "We have a house."}
+    translator = MagicMock(spec=Translator)
+    translator.translate.side_effect = lambda texts, **kwargs: [
+        glossary.get(t, t.upper()) for t in texts
+    ]
+    return translator
+
+
+def _candidate(form, sentence, pos="NOUN"):
+    return Candidate(
+        lemma=form,
+        pos=pos,
+        forms=[form],
+        freq=1,
+        cov_share_source=0.0,
+        form_original_lang=form,
+        sentence_original_lang=sentence,
+        source_lang_tag="sv",
+        target_lang_tag="EN-GB",
+    )
+
+
+def test_gloss_is_translated_once_and_reused_across_sentences():
+    translator, deck_io, stats = _translator(), MemoryDeckIO(), {}
+    selection = [_candidate("hus", "Vi har ett hus."), _candidate("hus", "Huset.")]
+
+    translate_lemmas(selection, translator, deck_io, with_sentences=False)
+    assert translator.translate.call_args_list[0][0][0] == ["hus"]
+    assert [c.translated_word for c in selection] == ["house", "house"]
+    assert selection[0].translated_example is None
+
+    # Next episode, other sentences: served from the cache
+    again = [_candidate("hus", "Ett stort hus.")]
+    _, failed = translate_lemmas(
+        again, translator, deck_io, with_sentences=False, stats=stats
+    )
+    assert translator.translate.call_count == 1
+    assert failed == [] and again[0].translated_word == "house"
+    assert stats == {
+        "lemma_tier_candidates": 1,
+        "lemma_tier_cache_hits": 1,
+        "lemma_tier_chars": 0,
+        "lemma_tier_untagged": 0,
+    }
+
+
+def test_rendered_sentences_are_translated_untagged_and_gloss_tagged():
+    translator, deck_io = _translator(), MemoryDeckIO()
+    candidate = _candidate("hus", "Vi har ett hus.")
+
+    translate_lemmas([candidate], translator, deck_io)
+
+    assert translator.translate.call_args_list[0][0][0] == ["hus", "Vi har ett hus."]
+    assert candidate.translated_example == "We have a <i>house</i>."
+    translate_lemmas([_candidate("hus", "Vi har ett hus.")], translator, deck_io)
+    assert translator.translate.call_count == 1
+
+
+def test_gloss_missing_from_sentence_goes_through_sentence_tier():
+    translator, deck_io = _translator(), MemoryDeckIO()
+    # As left by the sentence tier of the same deck build
+    stats = {"translation_wasted_calls": 1, "translation_repaired": 1}
+    glossary = {
+        "hus": "house",
+        "Vi har två hus.": "We have two houses.",
+        "Vi har två <i>hus</i>.": "We have two <i>houses</i>.",
+    }
+    translator.translate.side_effect = lambda texts, **kwargs: [
+        glossary.get(t, t.upper()) for t in texts
+    ]
+    failures = MagicMock()
+    failures.get_failed.return_value = {}
+    # "house" does not occur in "We have two houses."
+    inflected = _candidate("hus", "Vi har två hus.")
+    # Nor in the tagged translation ("HUSET.") or its repair: recorded as failed
+    lost = _candidate("hus", "Huset.")
+
+    _, failed = translate_lemmas(
+        [inflected, lost], translator, deck_io, stats=stats, failures=failures
+    )
+
+    assert stats["lemma_tier_untagged"] == 2
+    # 1 + the gloss and both sentences sent here, then the fallback's
+    # failed "Huset." text and its repair pair
+    assert stats["translation_wasted_calls"] == 1 + 3 + 3
+    assert stats["translation_repaired"] == 1
+    assert stats["translation_skipped_failed"] == 0
+    assert inflected.translated_example == "We have two <i>houses</i>."
+    assert inflected.translated_word == "houses"
+    assert failed == [lost]
+    assert [e["id"] for e in failures.record_failed.call_args[0][0]] == [
+        lost.cache_key
+    ]
+
+
+def test_deck_pipeline_lemma_mode_sends_noun_forms_alone():
+    with open("tests/integ/data_preview.txt", "r", encoding="utf-8") as f:
+        loaded_analysis = json.loads(ast.literal_eval(f.read()))
+    from tests.integ.example_request import request
+
+    episode_data = AnalyzedEpisode(episode_name="BonusFam", **loaded_analysis)
+    build_request = BuildDeckRequest(
+        **request, translation_mode="LEMMA", render_sentence_translation=False
+    )
+    translator = MagicMock(spec=Translator)
+    translator.translate.side_effect = lambda texts, **kwargs: texts
+    deck_io = MagicMock(spec=DeckIO)
+    deck_io.get_cached.return_value = {}
+
+    result = deck_pipeline(episode_data, build_request, translator, deck_io)
+
+    sent = [t for call in translator.translate.call_args_list for t in call[0][0]]
+    cards = deck_io.save_cards.call_args[0][0]
+    nouns = [card for card in cards if card.pos == "NOUN"]
+    assert nouns and result["lemma_tier_candidates"] == len(nouns)
+    assert all(card.sentence_translation is None for card in nouns)
+    assert {card.prompt for card in nouns} <= set(sent)
+    assert all(
+        "<i>" in card.sentence_translation for card in cards if card.pos == "VERB"
+    )
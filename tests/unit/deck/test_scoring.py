@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from domain.deck.deck_generation.candidates_picker import pick_until_target
+from domain.deck.deck_generation.scoring import (
+    CandidateFeatures,
+    CorpusStats,
+    _episode_rank,
+    compute_scores,
+    rank_candidates,
+)
+from domain.deck.schemas.schema import Candidate
+
+
+def _candidate(lemma: str, cov: float, freq: int = 1, n_forms: int = 1) -> Candidate:
+    return Candidate(
+        lemma=lemma,
+        pos="NOUN",
+        forms=[f"{lemma}{i}" for i in range(n_forms)],
+        freq=freq,
+        cov_share_source=cov,
+    )
+
+
+def test_freq_matches_sorting_by_coverage():
+    covs = [0.1, 0.3, 0.1, 0.0, 0.3]
+    candidates = [_candidate(f"l{i}", cov) for i, cov in enumerate(covs)]
+
+    ranked, scores = rank_candidates(candidates, "FREQ")
+
+    expected = sorted(candidates, key=lambda c: c.cov_share_source, reverse=True)
+    assert [c.lemma for c in ranked] == [c.lemma for c in expected]
+    assert scores == [c.cov_share_source for c in expected]
+    assert all(c.score is None for c in candidates)
+
+
+def test_zipf_prefers_common_words_at_equal_coverage():
+    candidates = [_candidate("rare", 0.1), _candidate("common", 0.1)]
+    corpus = CorpusStats(freq_rank={"common": 10, "rare": 5000})
+
+    ranked, _ = rank_candidates(candidates, "ZIPF", corpus)
+
+    assert [c.lemma for c in ranked] == ["common", "rare"]
+
+
+def test_zipf_without_ranks_falls_back_to_episode_rank():
+    candidates = [_candidate("a", 0.2, freq=5), _candidate("b", 0.2, freq=50)]
+
+    ranked, _ = rank_candidates(candidates, "ZIPF")
+
+    assert [c.lemma for c in ranked] == ["b", "a"]
+
+
+def test_tfidf_downweights_lemmas_found_in_many_episodes():
+    candidates = [_candidate("everywhere", 0.3), _candidate("specific", 0.2)]
+    corpus = CorpusStats(n_docs=100, doc_freq={"everywhere": 100, "specific": 2})
+
+    ranked, _ = rank_candidates(candidates, "TFIDF", corpus)
+    ranked_no_corpus, _ = rank_candidates(candidates, "TFIDF")
+
+    assert [c.lemma for c in ranked] == ["specific", "everywhere"]
+    assert [c.lemma for c in ranked_no_corpus] == ["everywhere", "specific"]
+
+
+def test_length_penalizes_long_lemmas_and_many_forms():
+    candidates = [
+        _candidate("sjukskoterska", 0.1),
+        _candidate("hus", 0.1, n_forms=6),
+        _candidate("bil", 0.1),
+    ]
+
+    scores = compute_scores(CandidateFeatures(candidates), "LENGTH")
+
+    assert scores[2] == pytest.approx(0.1)
+    assert scores[2] > scores[1] > scores[0]
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        compute_scores(CandidateFeatures([_candidate("a", 0.1)]), "NOPE")
+
+
+def test_episode_rank_ties_share_rank():
+    ranks = _episode_rank(np.array([5, 50, 5, 7]))
+
+    assert ranks.tolist() == [3, 1, 3, 2]
+
+
+def test_picker_writes_scores_on_picked_only():
+    candidates = [_candidate(f"l{i}", 0.1 * (i + 1)) for i in range(5)]
+    ranked, scores = rank_candidates(candidates, "FREQ")
+
+    picked, _ = pick_until_target(ranked, 2, None, scores=scores)
+
+    assert [c.lemma for c in picked] == ["l4", "l3"]
+    assert [c.score for c in picked] == scores[:2]
+    assert all(c.score is None for c in ranked[2:])
@@ -0,0 +1,57 @@
+import ast
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.bench_select_example import legacy_select_example
+from domain.deck.deck_generation.lexicon_processing import select_example
+from domain.deck.schemas.schema import Candidate
+from domain.nlp.lexicon.examples import example_shortlist, index_examples
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+
+
+def _episode() -> AnalyzedEpisode:
+    with open("tests/integ/data_preview.txt", "r", encoding="utf-8") as f:
+        loaded_analysis = json.loads(ast.literal_eval(f.read()))
+    return AnalyzedEpisode(episode_name="BonusFam", **loaded_analysis)
+
+
+def _selection(episode: AnalyzedEpisode):
+    return [
+        Candidate(
+            lemma=lemma, pos=data.pos, forms=data.forms, freq=1, cov_share_source=0
+        )
+        for lemma, data in episode.episode_data_processed.items()
+        if data.examples
+    ]
+
+
+def test_shortlist_is_first_multi_word_examples():
+    assert example_shortlist([1, 3, 1, 2, 5, 4], size=3) == [1, 3, 4]
+    assert example_shortlist([1, 1]) == []
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+@pytest.mark.parametrize("seed", range(20))
+def test_select_example_matches_legacy(seed, indexed):
+    rng = random.Random(seed)
+    episode = _episode()
+    if indexed:
+        index_examples(episode.episode_data_processed, size=rng.randint(1, 5))
+    opts = {}
+    if rng.random() < 0.7:
+        opts["min_example_len"] = rng.randint(1, 6)
+    if rng.random() < 0.7:
+        opts["max_example_len"] = rng.randint(2, 15)
+    req = SimpleNamespace(
+        lang_opts={"sv": opts}, dedupe_sentences=rng.random() < 0.5
+    )
+
+    new = select_example(_selection(episode), req, episode)
+    legacy = legacy_select_example(_selection(episode), req, episode)
+
+    assert [(c.form_original_lang, c.sentence_original_lang) for c in new] == [
+        (c.form_original_lang, c.sentence_original_lang) for c in legacy
+    ]
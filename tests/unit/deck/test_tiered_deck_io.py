@@ -0,0 +1,118 @@
+from infra.memory.lru_cache import LRUCache
+from infra.sqlite.translation_cache import SqliteTranslationCache
+from infra.tiered.deck_io import TieredDeckIO
+
+
+class MemoryDeckIO:
+    def __init__(self, rows=None):
+        self.rows = dict(rows or {})
+        self.lookups = []
+
+    def get_cached(self, ids):
+        self.lookups.append(list(ids))
+        return {i: self.rows[i] for i in ids if i in self.rows}
+
+    def upsert_cache_translation(self, cache_entries):
+        for entry in cache_entries:
+            self.rows[entry["id"]] = dict(entry)
+        return {}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _row(cache_id):
+    return {"id": cache_id, "word_target_lang": f"w-{cache_id}"}
+
+
+def test_read_through_fills_local_tiers(tmp_path):
+    l3 = MemoryDeckIO({"a": _row("a"), "b": _row("b")})
+    path = str(tmp_path / "translations.sqlite3")
+    deck_io = TieredDeckIO(l3, SqliteTranslationCache(path), version="v1")
+
+    assert deck_io.get_cached(["a", "b", "c"]) == {"a": _row("a"), "b": _row("b")}
+    assert deck_io.get_cached(["a", "b"]) == {"a": _row("a"), "b": _row("b")}
+    assert l3.lookups == [["a", "b", "c"]]
+
+    # Another worker on the node: cold L1, warm L2
+    other = TieredDeckIO(l3, SqliteTranslationCache(path), version="v1")
+    assert other.get_cached(["a", "c"]) == {"a": _row("a")}
+    assert l3.lookups[-1] == ["c"]
+
+    stats = deck_io.stats()
+    assert stats["l1"]["hits"] == 2 and stats["l1"]["misses"] == 3
+    assert stats["l2"]["misses"] == 3
+    assert stats["l3"] == {
+        "hits": 2,
+        "misses": 1,
+        "requests": 1,
+        "skipped": 0,
+        "recent_misses": 0,
+        "catch_ups": 0,
+        "hit_rate": 2 / 3,
+    }
+    assert other.stats()["l2"]["hit_rate"] == 0.5
+
+
+def test_upsert_writes_through_all_tiers(tmp_path):
+    l3 = MemoryDeckIO()
+    l2 = SqliteTranslationCache(str(tmp_path / "translations.sqlite3"))
+    deck_io = TieredDeckIO(l3, l2, version="v1")
+
+    deck_io.upsert_cache_translation([_row("a")])
+
+    assert l3.rows == {"a": _row("a")}
+    assert l2.get_many("v1", ["a"]) == {"a": _row("a")}
+    assert deck_io.get_cached(["a"]) == {"a": _row("a")}
+    assert l3.lookups == []
+
+
+def test_entries_expire_and_are_isolated_by_version(tmp_path):
+    clock = Clock()
+    path = str(tmp_path / "translations.sqlite3")
+    l1 = LRUCache(max_entries=10, max_size=10, ttl=60, clock=clock)
+    l2 = SqliteTranslationCache(path, ttl=600, clock=clock)
+    l3 = MemoryDeckIO({"a": _row("a")})
+    deck_io = TieredDeckIO(l3, l2, l1, version="v1")
+    deck_io.get_cached(["a"])
+
+    clock.now += 120  # L1 expired, L2 still valid
+    deck_io.get_cached(["a"])
+    clock.now += 1200  # both expired
+    deck_io.get_cached(["a"])
+    assert len(l3.lookups) == 2
+
+    # A new translation version never reads the old rows, but leaves them to
+    # workers still on the old version (rolling deploy)
+    bumped = TieredDeckIO(l3, SqliteTranslationCache(path, clock=clock), version="v2")
+    bumped.get_cached(["a"])
+    assert len(l3.lookups) == 3
+    assert l2.get_many("v1", ["a"]) == {"a": _row("a")}
+
+    clock.now += 1200  # old version rows expire like any other
+    assert SqliteTranslationCache(path, clock=clock).get_many("v1", ["a"]) == {}
+
+
+def test_recent_l3_misses_are_not_queried_again():
+    clock = Clock()
+    l3 = MemoryDeckIO()
+    misses = LRUCache(max_entries=10, max_size=10, ttl=30, clock=clock)
+    deck_io = TieredDeckIO(l3, misses=misses)
+
+    assert deck_io.get_cached(["a", "b"]) == {}
+    assert deck_io.get_cached(["a", "b"]) == {}
+    assert l3.lookups == [["a", "b"]]
+    assert deck_io.stats()["l3"]["recent_misses"] == 2
+
+    # Own writes are visible at once, other misses once the entry expires
+    deck_io.upsert_cache_translation([_row("a")])
+    deck_io.l1.clear()
+    assert deck_io.get_cached(["a"]) == {"a": _row("a")}
+    clock.now += 30
+    deck_io.get_cached(["b"])
+    assert l3.lookups[1:] == [["a"], ["b"]]
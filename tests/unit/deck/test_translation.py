@@ -1,14 +1,20 @@
 import hashlib
 import json
+import time
 import unicodedata
 from unittest.mock import MagicMock, patch
 
 from core.ports import DeckIO
 from domain.deck.schemas.schema import Candidate
+from domain.translator.scheduler import TranslationScheduler
 from domain.translator.translation import (
+    TRANSLATION_FAILURE_SKIP_S,
+    _cache_keys,
     _create_id_translation_cache,
-    _find_cached_translation_batch,
     _look_up_translation_from_cache,
+    _select_term,
+    _tag_terms,
+    find_cached_translation_batch,
     translate_selection,
 )
 from domain.translator.translator import Translator
@@ -121,7 +127,7 @@ def test_find_cached_translation_batch():
     mock_deck_io.get_cached.return_value = ids
 
     # Execute
-    cached_translation, to_translate = _find_cached_translation_batch(
+    cached_translation, to_translate = find_cached_translation_batch(
         candidates, mock_deck_io
     )
 
@@ -167,7 +173,7 @@ def test_translate_selection():
 
     # Mock finding cached translations: 1 is cached, 2 needs translation
     with patch(
-        "domain.translator.translation._find_cached_translation_batch",
+        "domain.translator.translation.find_cached_translation_batch",
         return_value=([candidate_1], [candidate_2]),
     ):
         translated_candidates, failed = translate_selection(
@@ -200,3 +206,271 @@ def test_translate_selection_empty():
 
     assert translated == []
     assert failed == []
+
+
+def _shared_sentence_candidates():
+    def candidate(lemma, form, sentence):
+        return Candidate(
+            lemma=lemma,
+            pos="verb",
+            forms=[form],
+            freq=1,
+            cov_share_source=0.01,
+            form_original_lang=form,
+            sentence_original_lang=sentence,
+            source_lang_tag="sv",
+            target_lang_tag="EN-GB",
+        )
+
+    shared = "Vi går hem och äter nu."
+    return [
+        candidate("gå", "går", shared),
+        candidate("äta", "äter", shared),
+        candidate("sova", "sover", "Hon sover."),
+        candidate("hem", "hem", shared),
+    ]
+
+
+def _translate_grouped(translator, candidates, **kwargs):
+    deck_io = MagicMock(spec=DeckIO)
+    scheduler = TranslationScheduler(translator, rate=1000)
+    with patch(
+        "domain.translator.translation.find_cached_translation_batch",
+        return_value=([], candidates),
+    ):
+        return translate_selection(
+            candidates, translator, deck_io, scheduler=scheduler, **kwargs
+        )
+
+
+def test_tag_terms_and_select_term():
+    text, tagged = _tag_terms("Går du? Ja, jag går.", ["går", "du", "GÅR", "nej"])
+
+    assert text == '<i id="0">Går</i> <i id="1">du</i>? Ja, jag går.'
+    assert tagged == [0, 1]
+    assert _select_term(text, 1) == "Går <i>du</i>? Ja, jag går."
+    assert _select_term(text, 2) is None
+    assert _select_term('<i id="0"> </i> du', 0) is None
+
+
+def test_translate_selection_sends_shared_sentence_once():
+    translator = MagicMock(spec=Translator)
+    translator.translate.side_effect = lambda texts, **kwargs: texts
+    candidates = _shared_sentence_candidates()
+
+    translated, failed = _translate_grouped(translator, candidates)
+
+    sent = [t for call in translator.translate.call_args_list for t in call[0][0]]
+    assert sent == [
+        'Vi <i id="0">går</i> <i id="2">hem</i> och <i id="1">äter</i> nu.',
+        "Hon <i>sover</i>.",
+    ]
+    assert failed == []
+    assert [c.translated_word for c in translated] == ["går", "äter", "sover", "hem"]
+    assert candidates[1].translated_example == "Vi går hem och <i>äter</i> nu."
+
+
+def test_translate_selection_falls_back_to_one_term_tags():
+    def drop_first_tag(texts, **kwargs):
+        return [t.replace('<i id="0">går</i>', "går") for t in texts]
+
+    translator = MagicMock(spec=Translator)
+    translator.translate.side_effect = drop_first_tag
+    candidates = _shared_sentence_candidates()
+
+    translated, failed = _translate_grouped(translator, candidates)
+
+    assert failed == []
+    assert translator.translate.call_args_list[-1][0][0] == [
+        "Vi <i>går</i> hem och äter nu."
+    ]
+    assert candidates[0].translated_example == "Vi <i>går</i> hem och äter nu."
+    assert candidates[3].translated_example == "Vi går <i>hem</i> och äter nu."
+
+
+def test_translate_selection_without_grouping_tags_one_term_per_text():
+    translator = MagicMock(spec=Translator)
+    translator.translate.side_effect = lambda texts, **kwargs: texts
+    candidates = _shared_sentence_candidates()
+
+    _translate_grouped(translator, candidates, group_sentences=False)
+
+    sent = [t for call in translator.translate.call_args_list for t in call[0][0]]
+    assert sent == [c.translation_input for c in candidates]
+    assert all(t.count("<i>") == 1 for t in sent)
+
+
+def _key_candidate(form, sentence, source="sv", target="EN-GB"):
+    return Candidate(
+        lemma=form,
+        pos="NOUN",
+        forms=[form],
+        freq=1,
+        cov_share_source=0.0,
+        form_original_lang=form,
+        sentence_original_lang=sentence,
+        source_lang_tag=source,
+        target_lang_tag=target,
+    )
+
+
+def test_cache_keys_match_single_key_builder_and_are_memoized():
+    candidates = [
+        _key_candidate(" går ", "Vi  går\them."),
+        _key_candidate("ﬁka", 'Ska vi ta en "ﬁka"?'),
+        _key_candidate("Ä\u0308", "Ä\u0308r  det\u00a0du?", "sv", "PL"),
+        _key_candidate("går", "Vi går hem."),
+    ]
+
+    keys = _cache_keys(candidates)
+
+    assert keys == [
+        _create_id_translation_cache(
+            c.form_original_lang,
+            c.sentence_original_lang,
+            c.source_lang_tag,
+            c.target_lang_tag,
+        )
+        for c in candidates
+    ]
+    assert [c.cache_key for c in candidates] == keys
+    candidates[0].cache_key = "memo"
+    assert _cache_keys(candidates[:1]) == ["memo"]
+
+    # Other versions are neither served from nor stored in the memo
+    other = _cache_keys(candidates[:1], translation_ver="other")
+    assert other != ["memo"] and candidates[0].cache_key == "memo"
+
+    # Reassigning a key field drops the memo
+    candidates[3].sentence_original_lang = "Vi går ut."
+    assert candidates[3].cache_key is None
+    assert _cache_keys(candidates[3:]) != keys[3:]
+
+
+def test_find_cached_translation_batch_merges_concurrent_chunks_in_order():
+    candidates = [_key_candidate(f"ord{i}", f"Ett ord{i}.") for i in range(250)]
+    keys = _cache_keys(candidates)
+    stored = {
+        key: {"word_target_lang": f"word{i}", "sentence_target_lang": f"A word{i}."}
+        for i, key in enumerate(keys)
+        if i % 3
+    }
+
+    def get_cached(ids):
+        return {i: stored[i] for i in ids if i in stored}
+
+    deck_io = MagicMock(spec=DeckIO)
+    deck_io.get_cached.side_effect = get_cached
+
+    cached, to_translate = find_cached_translation_batch(
+        candidates, deck_io, max_workers=3
+    )
+
+    sizes = [len(call[0][0]) for call in deck_io.get_cached.call_args_list]
+    assert sorted(sizes) == [50, 100, 100]
+    assert cached == [c for i, c in enumerate(candidates) if i % 3]
+    assert to_translate == candidates[::3]
+    assert cached[0].translated_word == "word1"
+
+
+class MemoryFailures:
+    def __init__(self):
+        self.rows = {}
+
+    def get_failed(self, ids):
+        return {i: self.rows[i] for i in ids if i in self.rows}
+
+    def record_failed(self, entries):
+        self.rows.update({entry["id"]: dict(entry) for entry in entries})
+
+
+def _drop_tags(texts, **kwargs):
+    # Echo, but the <i> tag of tagged input is lost
+    return [
+        t.replace("<i>", "").replace("</i>", "") if "<i>" in t else t
+        for t in texts
+    ]
+
+
+def test_repair_pass_tags_separately_translated_term():
+    translator = MagicMock(spec=Translator)
+    translator.translate.side_effect = _drop_tags
+    deck_io = MagicMock(spec=DeckIO)
+    deck_io.get_cached.return_value = {}
+    candidate = _key_candidate("hem", "Vi går hem nu.")
+    stats = {}
+
+    translated, failed = translate_selection(
+        [candidate], translator, deck_io, stats=stats
+    )
+
+    assert failed == []
+    assert candidate.translated_example == "Vi går <i>hem</i> nu."
+    assert translator.translate.call_args_list[-1][0][0] == ["hem", "Vi går hem nu."]
+    assert deck_io.upsert_cache_translation.call_args[0][0][0]["id"] == (
+        candidate.cache_key
+    )
+    assert stats == {
+        "translation_wasted_calls": 1,
+        "translation_repaired": 1,
+        "translation_skipped_failed": 0,
+    }
+
+
+def test_repair_without_a_cacheable_term_counts_as_failed():
+    def stray_tag(texts, **kwargs):
+        # Repair pass: the untagged sentence comes back with an empty tag
+        if "hem" not in texts:
+            return _drop_tags(texts)
+        return ["<i> </i>" + t if " " in t else t for t in texts]
+
+    translator = MagicMock(spec=Translator)
+    translator.translate.side_effect = stray_tag
+    deck_io = MagicMock(spec=DeckIO)
+    deck_io.get_cached.return_value = {}
+    candidate = _key_candidate("hem", "Vi går hem nu.")
+
+    _, failed = translate_selection([candidate], translator, deck_io)
+
+    assert failed == [candidate]
+    assert candidate.translated_example == "Vi går hem nu."
+    deck_io.upsert_cache_translation.assert_not_called()
+
+
+def test_failed_translations_are_recorded_and_skipped_within_window():
+    def unusable(texts, **kwargs):
+        return ["???" if " " not in t else _drop_tags([t])[0] for t in texts]
+
+    translator = MagicMock(spec=Translator)
+    translator.translate.side_effect = unusable
+    deck_io = MagicMock(spec=DeckIO)
+    deck_io.get_cached.return_value = {}
+    failures = MemoryFailures()
+
+    def build():
+        stats = {}
+        candidate = _key_candidate("hem", "Vi går hem nu.")
+        _, failed = translate_selection(
+            [candidate], translator, deck_io, failures=failures, stats=stats
+        )
+        assert failed == [candidate]
+        return candidate, stats
+
+    candidate, stats = build()
+    record = failures.rows[candidate.cache_key]
+    assert record["attempts"] == 1
+    assert record["translation_output"] == "Vi går hem nu."
+    assert stats["translation_wasted_calls"] == 3  # tagged text + repair pair
+    calls = translator.translate.call_count
+
+    candidate, stats = build()  # inside the window: no translation calls
+    assert translator.translate.call_count == calls
+    assert stats["translation_skipped_failed"] == 1
+    assert candidate.translated_example == "Vi går hem nu."
+
+    record["retry_after"] = 0  # window over: retried, next window doubled
+    build()
+    record = failures.rows[candidate.cache_key]
+    assert record["attempts"] == 2
+    assert translator.translate.call_count > calls
+    assert record["retry_after"] - time.time() > 1.5 * TRANSLATION_FAILURE_SKIP_S
@@ -0,0 +1,32 @@
+import pytest
+
+from domain.translator.batching import BatchLimits, batch_sizes, pack_batches
+
+
+def test_pack_respects_item_char_and_byte_budgets():
+    texts = ["a" * 10, "b" * 10, "c" * 25, "d" * 5, "é" * 10, "f"]
+    limits = BatchLimits(max_items=3, max_chars=30, max_bytes=25)
+
+    batches = pack_batches(texts, limits)
+
+    assert batches == [[0, 1], [2], [3, 4], [5]]
+    for size in batch_sizes(texts, batches):
+        assert size["items"] <= 3 and size["chars"] <= 30 and size["bytes"] <= 25
+
+
+def test_pack_keeps_order_and_isolates_oversized_text():
+    texts = ["kort", "x" * 100, "kort", "kort"]
+
+    batches = pack_batches(texts, BatchLimits(max_items=None, max_chars=20))
+
+    assert batches == [[0], [1], [2, 3]]
+    assert [i for batch in batches for i in batch] == list(range(len(texts)))
+
+
+@pytest.mark.parametrize("n", [0, 1, 49, 50, 51, 120])
+def test_pack_by_items_only_matches_fixed_chunks(n):
+    texts = [f"s{i}" for i in range(n)]
+
+    batches = pack_batches(texts, BatchLimits(max_items=50))
+
+    assert batches == [list(range(i, min(i + 50, n))) for i in range(0, n, 50)]
@@ -0,0 +1,127 @@
+import os
+import time
+
+import infra.tiered.deck_io as tiered_deck_io
+from domain.translator.translator import TRANS_VERSION
+from infra.memory.bloom_filter import BloomFilter
+from infra.tiered.deck_io import TieredDeckIO
+from pipelines.translation_bloom import (
+    load_translation_bloom,
+    rebuild_translation_bloom,
+    refresh_translation_bloom,
+)
+
+
+class MemoryDeckIO:
+    def __init__(self, ids=()):
+        self.rows = {i: {"id": i} for i in ids}
+        self.written = {i: 1.0 for i in ids}
+        self.lookups = []
+
+    def get_cached(self, ids):
+        self.lookups.append(list(ids))
+        return {i: self.rows[i] for i in ids if i in self.rows}
+
+    def upsert_cache_translation(self, cache_entries):
+        for entry in cache_entries:
+            self.rows[entry["id"]] = dict(entry)
+            self.written.setdefault(entry["id"], time.time())
+        return {}
+
+    def iter_cache_ids(self):
+        return iter(list(self.rows))
+
+    def cache_ids_since(self, since):
+        return iter([i for i, t in self.written.items() if t >= since])
+
+    def last_cache_write(self):
+        return max(self.written.values(), default=None)
+
+
+def test_bloom_filter_has_no_false_negatives_and_target_fp_rate(tmp_path):
+    keys = [f"key{i}" for i in range(5000)]
+    bloom = BloomFilter(5000, 0.01, version="v1")
+    bloom.add(keys)
+
+    assert bloom.contains(keys).all()
+    assert bloom.contains([f"other{i}" for i in range(20000)]).mean() < 0.02
+
+    bloom.save(str(tmp_path / "bloom.bin"))
+    loaded = BloomFilter.load(str(tmp_path / "bloom.bin"))
+    assert loaded.version == "v1" and loaded.count == 5000
+    assert loaded.built_at == bloom.built_at
+    assert loaded.watermark == bloom.watermark
+    assert (loaded.contains(keys[:100])).all()
+
+
+def test_negative_filter_skips_definite_misses():
+    l3 = MemoryDeckIO(["a", "b"])
+    bloom = BloomFilter(100, 0.001, watermark=1.0)
+    bloom.add(["a", "b"])
+    deck_io = TieredDeckIO(l3, negative=bloom)
+
+    assert deck_io.get_cached(["a", "new1", "new2"]) == {"a": {"id": "a"}}
+    assert l3.lookups == [["a"]]
+    assert deck_io.stats()["l3"]["skipped"] == 2
+
+    # Upserted ids are added, also to a filter swapped in later
+    deck_io.upsert_cache_translation([{"id": "new1"}])
+    deck_io.l1.clear()
+    assert deck_io.get_cached(["new1"]) == {"new1": {"id": "new1"}}
+    deck_io.set_negative(BloomFilter(100, 0.001, built_at=time.time() - 60))
+    assert deck_io.negative.contains(["new1"]).all()
+
+
+def test_negative_filter_catches_up_with_other_workers_writes(monkeypatch):
+    # Only lookups overlapping a last-write check share it
+    monkeypatch.setattr(tiered_deck_io, "TRANSLATION_BLOOM_CHECK_S", 0)
+    l3 = MemoryDeckIO(["a"])
+    bloom = BloomFilter(100, 0.001, watermark=1.0)
+    bloom.add(["a"])
+    deck_io = TieredDeckIO(l3, negative=bloom)
+
+    # Stored by another worker after the filter's watermark
+    l3.upsert_cache_translation([{"id": "b"}])
+    assert deck_io.get_cached(["b", "new"]) == {"b": {"id": "b"}}
+    assert l3.lookups == [["b"]]
+    assert deck_io.stats()["l3"]["catch_ups"] == 1
+    assert bloom.watermark == l3.written["b"]
+
+    # If L3 cannot report its last write, nothing is skipped
+    def fail():
+        raise ConnectionError("down")
+
+    l3.last_cache_write = fail
+    assert deck_io.get_cached(["other"]) == {}
+    assert l3.lookups[-1] == ["other"]
+    assert deck_io.stats()["l3"]["skipped"] == 1
+
+
+def test_refresh_loads_snapshot_or_rebuilds_in_background(tmp_path):
+    path = str(tmp_path / "bloom.bin")
+    deck_io = TieredDeckIO(MemoryDeckIO(["a"]))
+
+    # No snapshot: rebuilt from L3 off the caller's thread
+    rebuild = refresh_translation_bloom(deck_io, path)
+    rebuild.join()
+    assert deck_io.negative.contains(["a", "b"]).tolist() == [True, False]
+    assert deck_io.negative.watermark == 1.0
+    assert load_translation_bloom(path).version == TRANS_VERSION
+
+    # Another worker on the node picks up the snapshot without scanning L3
+    other = TieredDeckIO(MemoryDeckIO())
+    assert refresh_translation_bloom(other, path) is None
+    assert other.negative.contains(["a"]).all()
+
+    # A rebuild running in another worker is not duplicated
+    stale = TieredDeckIO(MemoryDeckIO(["a"]))
+    os.remove(path)
+    open(f"{path}.lock", "w").close()
+    refresh_translation_bloom(stale, path).join()
+    assert stale.negative is None
+
+    # Snapshots of another translation version or too old are not used
+    BloomFilter(10, 0.01, version="OLD").save(path)
+    assert load_translation_bloom(path) is None
+    rebuild_translation_bloom(MemoryDeckIO(["a"]), path)
+    assert load_translation_bloom(path, max_age=-1) is None
@@ -0,0 +1,132 @@
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.ports import DeckIO
+from domain.deck.schemas.schema import Candidate
+from domain.translator.fake_translator import FakeTranslator
+from domain.translator.scheduler import (
+    AdaptiveLimiter,
+    TokenBucket,
+    TranslationScheduler,
+    backoff_delay,
+)
+from domain.translator.translation import translate_selection
+from domain.translator.translator import TooManyRequestsError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3:] == pytest.approx([0.5, 0.5])
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_adaptive_limiter_halves_on_throttle_and_recovers():
+    limiter = AdaptiveLimiter(max_limit=8)
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 2
+
+    for _ in range(2):
+        limiter.acquire()
+        limiter.release(throttled=False)
+    assert limiter.limit == 3
+
+
+def test_backoff_is_jittered_and_capped():
+    rng = random.Random(1)
+    delays = [backoff_delay(attempt, 0.5, 4.0, rng) for attempt in range(6)]
+
+    for attempt, delay in enumerate(delays):
+        full = min(4.0, 0.5 * 2**attempt)
+        assert full / 2 <= delay <= full
+    assert len(set(delays)) == len(delays)
+
+
+def test_scheduler_retries_throttled_batches_and_keeps_order():
+    translator = FakeTranslator(latency=0.01, jitter=0.01, max_concurrent=2)
+    scheduler = TranslationScheduler(
+        translator,
+        max_workers=6,
+        rate=1000,
+        burst=6,
+        max_retries=10,
+        base_delay=0.01,
+        max_delay=0.05,
+        seed=0,
+    )
+    batches = [[f"s{i}-{j}" for j in range(3)] for i in range(30)]
+
+    results = scheduler.run(batches, target_lang="EN-GB", source_lang="sv")
+
+    assert results == batches
+    stats = scheduler.stats()
+    assert translator.throttled > 0
+    assert stats["throttled"] == translator.throttled
+    assert stats["requests"] == translator.calls
+    assert translator.peak_in_flight <= 2
+
+
+def test_scheduler_gives_up_after_max_retries():
+    translator = FakeTranslator(latency=0, throttle_rate=1.0)
+    scheduler = TranslationScheduler(
+        translator, max_workers=2, max_retries=2, base_delay=0.001, rate=1000
+    )
+
+    with pytest.raises(TooManyRequestsError):
+        scheduler.run([["a"], ["b"]], target_lang="EN-GB", source_lang="sv")
+    assert translator.calls <= 6
+
+
+def test_translate_selection_applies_concurrent_results_in_order():
+    translator = FakeTranslator(latency=0.005, jitter=0.01, throttle_rate=0.2)
+    deck_io = MagicMock(spec=DeckIO)
+    deck_io.get_cached.return_value = {}
+    selection = [
+        Candidate(
+            lemma=f"ord{i}",
+            pos="NOUN",
+            forms=[f"ord{i}"],
+            freq=1,
+            cov_share_source=0.01,
+            form_original_lang=f"ord{i}",
+            sentence_original_lang=f"Ett ord{i} här.",
+            source_lang_tag="sv",
+            target_lang_tag="EN-GB",
+        )
+        for i in range(130)
+    ]
+    scheduler = TranslationScheduler(
+        translator, max_workers=4, rate=1000, max_retries=10, base_delay=0.001
+    )
+
+    translated, failed = translate_selection(selection, translator, deck_io, scheduler)
+
+    assert failed == []
+    assert [c.translated_word for c in translated] == [f"ord{i}" for i in range(130)]
+    cached = [
+        entry["form_org_lang"]
+        for call in deck_io.upsert_cache_translation.call_args_list
+        for entry in call.args[0]
+    ]
+    assert cached == [f"ord{i}" for i in range(130)]
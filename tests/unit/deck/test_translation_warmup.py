@@ -0,0 +1,92 @@
+import ast
+import json
+from unittest.mock import MagicMock
+
+import pipelines.translation_warmup as translation_warmup
+from common.schemas import BuildDeckRequest
+from domain.nlp.lexicon.schema import AnalyzedEpisode
+from domain.translator.translator import Translator
+from pipelines.deck_pipeline import deck_pipeline
+from pipelines.translation_warmup import warm_translation_cache, warmup_scheduler
+
+
+class MemoryDeckIO:
+    def __init__(self):
+        self.rows = {}
+
+    def get_cached(self, ids):
+        return {i: self.rows[i] for i in ids if i in self.rows}
+
+    def upsert_cache_translation(self, cache_entries):
+        self.rows.update({entry["id"]: dict(entry) for entry in cache_entries})
+
+    def save_deck(self, deck, params):
+        pass
+
+    def save_cards(self, cards, deck_id):
+        pass
+
+
+def _episode():
+    with open("tests/integ/data_preview.txt", "r", encoding="utf-8") as f:
+        loaded_analysis = json.loads(ast.literal_eval(f.read()))
+    return AnalyzedEpisode(episode_name="BonusFam", **loaded_analysis)
+
+
+def _translator():
+    translator = MagicMock(spec=Translator)
+    translator.translate.side_effect = lambda texts, **kwargs: texts
+    return translator
+
+
+def test_first_default_deck_build_is_served_from_warm_cache():
+    episode, deck_io, translator = _episode(), MemoryDeckIO(), _translator()
+
+    stats = warm_translation_cache(
+        episode,
+        "job",
+        translator,
+        deck_io,
+        target_langs=["EN-GB"],
+        top_n=10**6,
+        char_budget=10**9,
+    )
+    assert stats["warm_sent"] == stats["warm_candidates"] > 0
+    assert stats["warm_cached"] == 0
+
+    translator.translate.reset_mock()
+    req = BuildDeckRequest(
+        job_id="job", deck_name="d", target_lang_tag="EN-GB", build_version="b"
+    )
+    result = deck_pipeline(episode, req, translator, deck_io)
+    assert translator.translate.call_count == 0
+    assert result["cand_failed_translation"] == 0
+
+
+def test_warmup_stops_at_the_job_character_budget():
+    episode, deck_io, translator = _episode(), MemoryDeckIO(), _translator()
+    scheduler = warmup_scheduler(translator)
+
+    stats = warm_translation_cache(
+        episode,
+        "job",
+        translator,
+        deck_io,
+        target_langs=["EN-GB", "DE"],
+        top_n=50,
+        char_budget=500,
+        scheduler=scheduler,
+    )
+    assert 0 < stats["warm_sent"] < stats["warm_candidates"]
+    assert 400 < stats["warm_chars"] <= 500
+
+    # Already warmed candidates cost nothing on the next run
+    again = warm_translation_cache(
+        episode, "job", translator, deck_io, target_langs=["EN-GB", "DE"], top_n=50
+    )
+    assert again["warm_cached"] == stats["warm_sent"]
+
+
+def test_warmup_is_not_scheduled_unless_enabled(monkeypatch):
+    monkeypatch.setattr(translation_warmup, "WARM_TRANSLATIONS", False)
+    assert translation_warmup.schedule_translation_warmup("job", None) is None